@@ -24,8 +24,8 @@ def test_terminal_capabilities():
     
     print("\nDetected Capabilities:")
     for cap in TerminalCapability:
-        if info.capabilities.get(cap, False):
-            print(f"  ✓ {cap.value}")
+        if info.has(cap):
+            print(f"  ✓ {cap.name.lower()}")
     
     print("\n✓ Terminal capability detection complete")
     
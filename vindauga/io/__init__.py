@@ -10,7 +10,8 @@ This module provides a multi-platform terminal I/O system with support for:
 """
 
 from typing import Tuple, Optional
-from .platform_detector import PlatformDetector, PlatformType, PlatformCapabilities
+from .platform_detector import (PlatformDetector, PlatformType, PlatformCapabilities,
+                                get_default_detector, invalidate_caches)
 from .display.base import Display
 from .input.base import InputHandler
 
@@ -25,7 +26,7 @@ from .input.termio import TermIOInput
 from .input.curses import CursesInput
 
 # Import core components
-from .screen_cell import ScreenCell
+from .screen_cell import Attr, ScreenCell
 from .display_buffer import DisplayBuffer
 from .damage_region import DamageRegion
 from .fps_limiter import FPSLimiter
@@ -91,8 +92,7 @@ class PlatformIO:
         Returns:
             Dictionary of platform information
         """
-        detector = PlatformDetector()
-        return detector.get_platform_info()
+        return get_default_detector().get_platform_info()
 
 
 __all__ = [
@@ -103,6 +103,8 @@ __all__ = [
     'PlatformDetector',
     'PlatformType',
     'PlatformCapabilities',
+    'get_default_detector',
+    'invalidate_caches',
     
     # Base classes
     'Display',
@@ -119,6 +121,7 @@ __all__ = [
     'CursesInput',
     
     # Core components
+    'Attr',
     'ScreenCell',
     'DisplayBuffer',
     'DamageRegion',
@@ -19,6 +19,20 @@ from ..display_buffer import DisplayBuffer
 from ..screen_cell import ScreenCell
 from ..terminal_cleanup import register_cleanup
 
+# SGR parameters worked out once at import, so building an attribute
+# sequence is a few table lookups and a join
+_SGR_ATTR_PARAMS = tuple(
+    tuple(code for flag, code in ((ScreenCell.ATTR_BOLD, '1'),
+                                  (ScreenCell.ATTR_UNDERLINE, '4'),
+                                  (ScreenCell.ATTR_REVERSE, '7'))
+          if attrs & flag)
+    for attrs in range(256)
+)
+_SGR_FG_PARAMS = tuple([str(30 + i) for i in range(8)] + [str(90 + i) for i in range(8)] +
+                       [f'38;5;{i}' for i in range(16, 256)])
+_SGR_BG_PARAMS = tuple([str(40 + i) for i in range(8)] + [str(100 + i) for i in range(8)] +
+                       [f'48;5;{i}' for i in range(16, 256)])
+
 
 class ANSIDisplay(Display):
     """
@@ -235,10 +249,8 @@ class ANSIDisplay(Display):
             # Position cursor at start of damaged region
             output.append(f'{self.CSI}{row_idx + 1};{start + 1}H')
             
-            # Track current attributes to minimize escape sequences
-            current_fg = -1
-            current_bg = -1
-            current_attrs = 0
+            # Track the current style to minimize escape sequences
+            current_style = -1
             
             # Output cells in damaged region
             for col in range(start, end):
@@ -247,16 +259,12 @@ class ANSIDisplay(Display):
                     output.append(' ')
                     continue
                 
-                # Check if we need to update colors/attributes
-                if (cell.fg_color != current_fg or 
-                    cell.bg_color != current_bg or 
-                    cell.attrs != current_attrs):
-                    
+                # Colors and attributes are compared as one packed value
+                style = cell.style
+                if style != current_style:
                     seq = self._build_attr_sequence(cell.fg_color, cell.bg_color, cell.attrs)
                     output.append(seq)
-                    current_fg = cell.fg_color
-                    current_bg = cell.bg_color
-                    current_attrs = cell.attrs
+                    current_style = style
                 
                 # Output character
                 output.append(cell.char)
@@ -280,55 +288,44 @@ class ANSIDisplay(Display):
         if cache_key in self.color_cache:
             return self.color_cache[cache_key]
         
-        parts = []
-        
         # Reset if needed
         if attrs == 0 and fg == 7 and bg == 0:
             seq = self.RESET_ATTRS
         else:
-            parts.append('0')  # Reset first
+            parts = ['0']  # Reset first
             
             # Text attributes
-            if attrs & ScreenCell.ATTR_BOLD:
-                parts.append('1')
-            if attrs & ScreenCell.ATTR_UNDERLINE:
-                parts.append('4')
-            if attrs & ScreenCell.ATTR_REVERSE:
-                parts.append('7')
+            parts.extend(_SGR_ATTR_PARAMS[attrs & 0xFF])
             
             # Foreground color
-            if self.has_24bit_color and fg >= 16:
+            if fg < 16 or (self.has_256_color and not self.has_24bit_color and fg < 256):
+                # 16 or 256 color
+                parts.append(_SGR_FG_PARAMS[fg])
+            elif self.has_24bit_color:
                 # 24-bit RGB color
                 r = (fg >> 16) & 0xFF
                 g = (fg >> 8) & 0xFF
                 b = fg & 0xFF
                 parts.append(f'38;2;{r};{g};{b}')
-            elif self.has_256_color and fg >= 16:
-                # 256 color
+            elif self.has_256_color:
                 parts.append(f'38;5;{fg}')
             else:
-                # 16 color
-                if fg < 8:
-                    parts.append(str(30 + fg))
-                else:
-                    parts.append(str(90 + (fg - 8)))
+                parts.append(str(90 + (fg - 8)))
             
             # Background color
-            if self.has_24bit_color and bg >= 16:
+            if bg < 16 or (self.has_256_color and not self.has_24bit_color and bg < 256):
+                # 16 or 256 color
+                parts.append(_SGR_BG_PARAMS[bg])
+            elif self.has_24bit_color:
                 # 24-bit RGB color
                 r = (bg >> 16) & 0xFF
                 g = (bg >> 8) & 0xFF
                 b = bg & 0xFF
                 parts.append(f'48;2;{r};{g};{b}')
-            elif self.has_256_color and bg >= 16:
-                # 256 color
+            elif self.has_256_color:
                 parts.append(f'48;5;{bg}')
             else:
-                # 16 color
-                if bg < 8:
-                    parts.append(str(40 + bg))
-                else:
-                    parts.append(str(100 + (bg - 8)))
+                parts.append(str(100 + (bg - 8)))
             
             seq = self.CSI + ';'.join(parts) + 'm'
         
@@ -19,6 +19,11 @@ class Display(ABC):
         self._cursor_y = 0
         self._cursor_visible = True
     
+    @classmethod
+    def is_available(cls) -> bool:
+        """Check, without side effects, whether this backend can run here."""
+        return True
+    
     @property
     def is_initialized(self) -> bool:
         """Check if display is initialized."""
@@ -4,6 +4,7 @@ Curses display backend.
 """
 
 import curses
+import sys
 from typing import Tuple, Dict
 from .base import Display
 from ..display_buffer import DisplayBuffer
@@ -22,6 +23,11 @@ class CursesDisplay(Display):
         self.next_pair = 1
         self.max_pairs = 64
     
+    @classmethod
+    def is_available(cls) -> bool:
+        """Curses needs a working initscr and a real terminal on stdout."""
+        return hasattr(curses, 'initscr') and sys.stdout.isatty()
+    
     def initialize(self) -> bool:
         """Initialize Curses display."""
         if self._initialized:
@@ -89,11 +89,11 @@ class FixedTermIODisplay(Display):
                 b'\x1b[?1006l',  # Disable SGR mouse
             ]
             
-            for seq in sequences:
-                try:
-                    os.write(self.tty_fd, seq)
-                except:
-                    pass
+            # One writev() call rather than a write() per sequence
+            try:
+                os.writev(self.tty_fd, sequences)
+            except OSError:
+                pass
             
             # Restore terminal settings
             if self.original_termios:
@@ -188,11 +188,11 @@ class FixedTermIODisplay(Display):
             b'\x1b[0m',      # Reset attributes
         ]
         
-        for seq in sequences:
-            try:
-                os.write(self.tty_fd, seq)
-            except:
-                pass
+        # One writev() call rather than a write() per sequence
+        try:
+            os.writev(self.tty_fd, sequences)
+        except OSError:
+            pass
     
     def get_size(self) -> Tuple[int, int]:
         """Get terminal size."""
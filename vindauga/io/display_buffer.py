@@ -7,11 +7,16 @@ with damage tracking, inspired by TVision's TDisplayBuffer but using Python
 best practices.
 """
 
+from operator import attrgetter
 from typing import List, Optional, Tuple, Iterator
-from .screen_cell import ScreenCell, WideCharCell
+from .screen_cell import ScreenCell, WIDE_TRAIL
 from .damage_region import DamageRegion
 from .fps_limiter import FPSLimiter
 
+# Reads a cell's packed display state (ScreenCell.display_key) in C,
+# avoiding a Python-level property call per cell when diffing frames
+_display_key = attrgetter('_state')
+
 
 class DisplayBuffer:
     """
@@ -54,10 +59,11 @@ class DisplayBuffer:
         self.height = height
         self.fps_limiter = FPSLimiter(fps)
         
-        # Initialize cell buffer
+        # Initialize cell buffer, skipping per-cell normalization of blanks
+        new_cell = ScreenCell._raw
         self.cells: List[List[ScreenCell]] = []
         for _ in range(height):
-            row = [ScreenCell() for _ in range(width)]
+            row = [new_cell() for _ in range(width)]
             self.cells.append(row)
         
         # Initialize damage tracking (one region per row)
@@ -95,7 +101,11 @@ class DisplayBuffer:
         if not (0 <= x < self.width and 0 <= y < self.height):
             return
         
-        cell = self.cells[y][x]
+        row = self.cells[y]
+        cell = row[x]
+        if cell is WIDE_TRAIL:
+            # The shared trail cell is never written to; give the column its own cell
+            cell = row[x] = ScreenCell._raw()
         
         # Update cell properties
         cell.set_char(char)
@@ -109,7 +119,7 @@ class DisplayBuffer:
         # Handle wide characters
         if cell.is_wide and x + 1 < self.width:
             # Mark next cell as wide character trail
-            self.cells[y][x + 1] = WideCharCell()
+            row[x + 1] = WIDE_TRAIL
             self.damage[y].mark_dirty(x, x + 2)
         else:
             self.damage[y].mark_cell_dirty(x)
@@ -162,8 +172,11 @@ class DisplayBuffer:
             bg: Background color for cleared cells
         """
         for y in range(self.height):
+            row = self.cells[y]
             for x in range(self.width):
-                cell = self.cells[y][x]
+                cell = row[x]
+                if cell is WIDE_TRAIL:
+                    cell = row[x] = ScreenCell._raw()
                 cell.clear()
                 cell.fg_color = fg
                 cell.bg_color = bg
@@ -189,8 +202,11 @@ class DisplayBuffer:
         y_end = min(self.height, y + height)
         
         for row in range(y_start, y_end):
+            cells = self.cells[row]
             for col in range(x_start, x_end):
-                cell = self.cells[row][col]
+                cell = cells[col]
+                if cell is WIDE_TRAIL:
+                    cell = cells[col] = ScreenCell._raw()
                 cell.clear()
                 cell.fg_color = fg
                 cell.bg_color = bg
@@ -214,9 +230,12 @@ class DisplayBuffer:
         x_start = max(0, x)
         x_end = min(self.width, x + width)
         
+        row = self.cells[y]
         for col in range(x_start, x_end):
-            self.cells[y][col].attrs = attrs
-            self.cells[y][col].dirty = True
+            if row[col] is WIDE_TRAIL:
+                continue  # Trail cells take the attributes of their lead cell
+            row[col].attrs = attrs
+            row[col].dirty = True
         
         if x_start < x_end:
             self.damage[y].mark_dirty(x_start, x_end)
@@ -244,7 +263,7 @@ class DisplayBuffer:
         
         # Clear the bottom rows
         for y in range(max(top, bottom - lines), bottom):
-            self.cells[y] = [ScreenCell() for _ in range(self.width)]
+            self.cells[y] = [ScreenCell._raw() for _ in range(self.width)]
             self.damage[y].mark_dirty(0, self.width)
     
     def scroll_down(self, lines: int = 1, top: int = 0,
@@ -270,7 +289,7 @@ class DisplayBuffer:
         
         # Clear the top rows
         for y in range(top, min(bottom, top + lines)):
-            self.cells[y] = [ScreenCell() for _ in range(self.width)]
+            self.cells[y] = [ScreenCell._raw() for _ in range(self.width)]
             self.damage[y].mark_dirty(0, self.width)
     
     def get_damaged_regions(self) -> Iterator[Tuple[int, DamageRegion]]:
@@ -291,14 +310,16 @@ class DisplayBuffer:
         
         for row in self.cells:
             for cell in row:
-                cell.mark_clean()
+                if cell is not WIDE_TRAIL:
+                    cell.dirty = False
     
     def mark_all_dirty(self) -> None:
         """Mark the entire buffer as dirty (needs complete redraw)."""
         for y in range(self.height):
             self.damage[y].mark_dirty(0, self.width)
             for cell in self.cells[y]:
-                cell.mark_dirty()
+                if cell is not WIDE_TRAIL:
+                    cell.dirty = True
     
     def resize(self, new_width: int, new_height: int) -> None:
         """
@@ -324,7 +345,7 @@ class DisplayBuffer:
                 if y < self.height and x < self.width:
                     row.append(self.cells[y][x])
                 else:
-                    row.append(ScreenCell())
+                    row.append(ScreenCell._raw())
             new_cells.append(row)
         
         # Update buffer
@@ -336,6 +357,33 @@ class DisplayBuffer:
         self.damage = [DamageRegion() for _ in range(new_height)]
         self.mark_all_dirty()
     
+    def diff(self, other: 'DisplayBuffer') -> Iterator[Tuple[int, List[int]]]:
+        """
+        Compare this buffer against another of the same size.
+        
+        Each row is reduced to a list of packed display keys, so identical rows
+        are rejected with a single list comparison and only rows that differ
+        are examined column by column.
+        
+        Args:
+            other: The buffer to compare with (e.g. the previous frame)
+            
+        Yields:
+            Tuples of (row_index, changed_columns) for each row that differs
+            
+        Raises:
+            ValueError: If the buffers are not the same size
+        """
+        if self.width != other.width or self.height != other.height:
+            raise ValueError(f"Buffer size mismatch: {self.width}x{self.height} "
+                             f"vs {other.width}x{other.height}")
+        
+        for y, (row, other_row) in enumerate(zip(self.cells, other.cells)):
+            keys = list(map(_display_key, row))
+            other_keys = list(map(_display_key, other_row))
+            if keys != other_keys:
+                yield y, [x for x, (a, b) in enumerate(zip(keys, other_keys)) if a != b]
+    
     def should_update(self) -> bool:
         """
         Check if an update should be performed based on FPS limiting.
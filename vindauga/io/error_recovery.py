@@ -364,6 +364,9 @@ class ResilientIO:
         """
         try:
             return os.read(fd, size)
+        except BlockingIOError:
+            # Nothing to read on a non-blocking descriptor
+            return None
         except Exception as e:
             return self.recovery.handle_error(e, component, "read")
     
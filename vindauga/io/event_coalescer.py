@@ -6,62 +6,143 @@ This module provides event coalescing to reduce the number of events
 processed, especially for rapid mouse movements and key repeats.
 """
 
+import sys
 import time
-from typing import Optional, List, Any
-from dataclasses import dataclass
-from collections import deque
+import warnings
+from functools import partial
+from time import monotonic_ns as _monotonic_ns
+from typing import Optional, List, Any, ClassVar, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
 
+# Coalescing windows are tens of milliseconds wide, so on Linux the cheaper
+# CLOCK_MONOTONIC_COARSE (1-4ms resolution) is precise enough. Callers that
+# timestamp events themselves must use now_ns so times stay comparable
+_CLOCK_MONOTONIC_COARSE = 6
 
-@dataclass
+if sys.platform.startswith('linux'):
+    try:
+        time.clock_gettime_ns(_CLOCK_MONOTONIC_COARSE)
+        now_ns = partial(time.clock_gettime_ns, _CLOCK_MONOTONIC_COARSE)
+    except (AttributeError, OSError):
+        now_ns = _monotonic_ns
+else:
+    now_ns = _monotonic_ns
+
+# KeyEvent modifier bits
+MOD_CTRL = 1
+MOD_ALT = 2
+MOD_SHIFT = 4
+
+
+# Maximum number of recycled MouseMoveEvent objects kept for reuse
+MOUSE_EVENT_POOL_SIZE = 64
+
+# Held event slots in EventCoalescer
+_MOUSE = 0
+_KEY = 1
+_RESIZE = 2
+
+
+@dataclass(slots=True)
 class MouseMoveEvent:
-    """Mouse movement event."""
+    """Mouse movement event. timestamp is in now_ns() nanoseconds, 0 if unset."""
     x: int
     y: int
-    timestamp: float
+    timestamp: int
+    # Set for events handed out by acquire; only those go back to the pool
+    _pooled: bool = field(default=False, init=False, repr=False, compare=False)
+
+    _pool: ClassVar[List['MouseMoveEvent']] = []
+
+    @classmethod
+    def acquire(cls, x: int, y: int, timestamp: int = 0) -> 'MouseMoveEvent':
+        """Get a mouse move event, reusing a released one if available."""
+        pool = cls._pool
+        if pool:
+            event = pool.pop()
+            event.x = x
+            event.y = y
+            event.timestamp = timestamp
+            return event
+        event = cls(x, y, timestamp)
+        event._pooled = True
+        return event
+
+    def release(self):
+        """
+        Return this event to the pool. It must not be used afterwards.
+
+        Events built directly rather than by acquire may still be held by
+        their creator, so they are left alone.
+        """
+        pool = MouseMoveEvent._pool
+        if self._pooled and len(pool) < MOUSE_EVENT_POOL_SIZE:
+            pool.append(self)
     
-    def can_coalesce_with(self, other: 'MouseMoveEvent', max_time_diff: float = 0.05) -> bool:
+    def can_coalesce_with(self, other: 'MouseMoveEvent') -> bool:
         """Check if this event can be coalesced with another."""
-        if not isinstance(other, MouseMoveEvent):
-            return False
-        # Coalesce if within time window
-        return abs(self.timestamp - other.timestamp) <= max_time_diff
+        # Any two moves coalesce; the time window is checked by the coalescer
+        return isinstance(other, MouseMoveEvent)
 
 
-@dataclass
+@dataclass(slots=True, init=False)
 class KeyEvent:
-    """Keyboard event."""
+    """Keyboard event. timestamp is in now_ns() nanoseconds, 0 if unset."""
     key: str
-    ctrl: bool = False
-    alt: bool = False
-    shift: bool = False
-    timestamp: float = 0.0
+    mods: int = 0
+    timestamp: int = 0
     repeat_count: int = 1
+
+    def __init__(self, key: str, *, mods: int = 0, timestamp: int = 0, repeat_count: int = 1,
+                 ctrl: bool = False, alt: bool = False, shift: bool = False):
+        # The ctrl/alt/shift keywords are kept for callers of the old fields.
+        # Everything after key is keyword-only, so old positional calls
+        # (key, ctrl, alt, shift, ...) fail instead of being misread
+        self.key = key
+        self.mods = mods | (ctrl and MOD_CTRL) | (alt and MOD_ALT) | (shift and MOD_SHIFT)
+        self.timestamp = timestamp
+        self.repeat_count = repeat_count
+
+    @property
+    def ctrl(self) -> bool:
+        return bool(self.mods & MOD_CTRL)
+
+    @property
+    def alt(self) -> bool:
+        return bool(self.mods & MOD_ALT)
+
+    @property
+    def shift(self) -> bool:
+        return bool(self.mods & MOD_SHIFT)
     
-    def can_coalesce_with(self, other: 'KeyEvent', max_time_diff: float = 0.05) -> bool:
+    def can_coalesce_with(self, other: 'KeyEvent') -> bool:
         """Check if this event can be coalesced with another."""
         if not isinstance(other, KeyEvent):
             return False
         # Only coalesce identical key events (for key repeat)
-        return (self.key == other.key and 
-                self.ctrl == other.ctrl and
-                self.alt == other.alt and
-                self.shift == other.shift and
-                abs(self.timestamp - other.timestamp) <= max_time_diff)
+        return self.key == other.key and self.mods == other.mods
 
 
-@dataclass
+@dataclass(slots=True)
 class ResizeEvent:
-    """Terminal resize event."""
+    """Terminal resize event. timestamp is in now_ns() nanoseconds, 0 if unset."""
     width: int
     height: int
-    timestamp: float
+    timestamp: int
     
-    def can_coalesce_with(self, other: 'ResizeEvent', max_time_diff: float = 0.1) -> bool:
+    def can_coalesce_with(self, other: 'ResizeEvent') -> bool:
         """Check if this event can be coalesced with another."""
-        if not isinstance(other, ResizeEvent):
-            return False
-        # Coalesce rapid resize events
-        return abs(self.timestamp - other.timestamp) <= max_time_diff
+        # Any two resizes coalesce; the time window is checked by the coalescer
+        return isinstance(other, ResizeEvent)
+
+
+# Exact event type to held event slot
+_SLOT_FOR_TYPE = {
+    MouseMoveEvent: _MOUSE,
+    KeyEvent: _KEY,
+    ResizeEvent: _RESIZE,
+}
 
 
 class EventCoalescer:
@@ -70,7 +151,8 @@ class EventCoalescer:
     
     Features:
     - Coalesces rapid mouse movements into single events
-    - Combines repeated key events
+    - Combines repeated key events, for callers that opt in
+      (ImprovedANSIInput passes keys straight through)
     - Merges rapid resize events
     - Configurable time windows and thresholds
     """
@@ -79,7 +161,9 @@ class EventCoalescer:
                  mouse_coalesce_time: float = 0.016,  # ~60 FPS
                  key_coalesce_time: float = 0.05,     # 50ms for key repeat
                  resize_coalesce_time: float = 0.1,   # 100ms for resize
-                 max_queue_size: int = 100):
+                 max_queue_size: Optional[int] = None,
+                 max_key_repeat: int = 32,
+                 stats_enabled: bool = False):
         """
         Initialize event coalescer.
         
@@ -87,27 +171,57 @@ class EventCoalescer:
             mouse_coalesce_time: Time window for mouse event coalescing
             key_coalesce_time: Time window for key event coalescing
             resize_coalesce_time: Time window for resize event coalescing
-            max_queue_size: Maximum pending events before forced flush
+            max_queue_size: Deprecated and ignored; at most one event of
+                each kind is ever held
+            max_key_repeat: Maximum key repeats folded into one event before
+                it is released, bounding how long a held key is delayed
+            stats_enabled: Count received/coalesced/output events for get_stats
         """
         self.mouse_coalesce_time = mouse_coalesce_time
         self.key_coalesce_time = key_coalesce_time
         self.resize_coalesce_time = resize_coalesce_time
-        self.max_queue_size = max_queue_size
+        self.max_key_repeat = max_key_repeat
+        if max_queue_size is not None:
+            warnings.warn("EventCoalescer max_queue_size is ignored and will be removed",
+                          DeprecationWarning, stacklevel=2)
+
+        # Time windows pre-scaled to integer nanoseconds for the hot path
+        self.mouse_coalesce_ns = int(mouse_coalesce_time * 1_000_000_000)
+        self.key_coalesce_ns = int(key_coalesce_time * 1_000_000_000)
+        self.resize_coalesce_ns = int(resize_coalesce_time * 1_000_000_000)
         
-        # Event queues
-        self.pending_events = deque(maxlen=max_queue_size)
-        self.last_mouse_event: Optional[MouseMoveEvent] = None
-        self.last_key_event: Optional[KeyEvent] = None
-        self.last_resize_event: Optional[ResizeEvent] = None
+        # Held events indexed by kind, with their matching age thresholds
+        self._held: List[Optional[Any]] = [None, None, None]
+        # False only when nothing is held, so pollers can skip
+        # get_pending_event without calling it
+        self.holding = False
+        self._thresholds_ns = (self.mouse_coalesce_ns, self.key_coalesce_ns, self.resize_coalesce_ns)
         
         # Statistics
+        self.stats_enabled = stats_enabled
         self.events_received = 0
         self.events_coalesced = 0
         self.events_output = 0
+        self._cached_stats: Optional[Mapping[str, Any]] = None
+
+    @property
+    def last_mouse_event(self) -> Optional[MouseMoveEvent]:
+        return self._held[_MOUSE]
+
+    @property
+    def last_key_event(self) -> Optional[KeyEvent]:
+        return self._held[_KEY]
+
+    @property
+    def last_resize_event(self) -> Optional[ResizeEvent]:
+        return self._held[_RESIZE]
     
     def add_event(self, event: Any) -> Optional[Any]:
         """
         Add an event for potential coalescing.
+
+        This is called for every input event, so the per-kind handling is
+        kept inline rather than dispatched to helper methods.
         
         Args:
             event: Input event
@@ -115,92 +229,64 @@ class EventCoalescer:
         Returns:
             Coalesced event if ready, None if holding for more
         """
-        self.events_received += 1
-        current_time = time.time()
-        
-        # Handle mouse movement events
-        if isinstance(event, MouseMoveEvent):
-            return self._handle_mouse_event(event, current_time)
-        
-        # Handle keyboard events
-        elif isinstance(event, KeyEvent):
-            return self._handle_key_event(event, current_time)
+        stats = self.stats_enabled
+        if stats:
+            self.events_received += 1
         
-        # Handle resize events
-        elif isinstance(event, ResizeEvent):
-            return self._handle_resize_event(event, current_time)
-        
-        # Pass through other events immediately
-        else:
-            self.events_output += 1
+        slot = _SLOT_FOR_TYPE.get(type(event))
+        if slot is None:
+            # Pass through other events immediately
+            if stats:
+                self.events_output += 1
             return event
-    
-    def _handle_mouse_event(self, event: MouseMoveEvent, current_time: float) -> Optional[MouseMoveEvent]:
-        """Handle mouse movement event coalescing."""
-        event.timestamp = current_time
         
-        if self.last_mouse_event is None:
-            # First mouse event, hold it
-            self.last_mouse_event = event
-            return None
+        held = self._held
+        previous = held[slot]
+        # Keep an arrival time the caller took from now_ns, else stamp it now.
+        # Float seconds from time.time() (the old convention) would mix
+        # clocks, so they are treated as unset too
+        current_time = event.timestamp
+        if not current_time or current_time.__class__ is not int:
+            current_time = event.timestamp = now_ns()
         
-        # Check if we can coalesce
-        if self.last_mouse_event.can_coalesce_with(event, self.mouse_coalesce_time):
-            # Coalesce: keep the latest position
-            self.events_coalesced += 1
-            self.last_mouse_event = event
+        if previous is None:
+            # First event of this kind, hold it
+            held[slot] = event
+            self.holding = True
             return None
-        else:
-            # Can't coalesce, output the previous event
-            output = self.last_mouse_event
-            self.last_mouse_event = event
-            self.events_output += 1
-            return output
-    
-    def _handle_key_event(self, event: KeyEvent, current_time: float) -> Optional[KeyEvent]:
-        """Handle keyboard event coalescing."""
-        event.timestamp = current_time
         
-        if self.last_key_event is None:
-            # First key event
-            self.last_key_event = event
-            return None
+        within_window = current_time - previous.timestamp <= self._thresholds_ns[slot]
         
-        # Check if we can coalesce (same key in rapid succession)
-        if self.last_key_event.can_coalesce_with(event, self.key_coalesce_time):
-            # Coalesce: increment repeat count
-            self.events_coalesced += 1
-            self.last_key_event.repeat_count += 1
-            self.last_key_event.timestamp = current_time
+        if slot == _KEY:
+            # Only identical keys in rapid succession coalesce (key repeat)
+            if within_window and previous.can_coalesce_with(event):
+                if stats:
+                    self.events_coalesced += 1
+                previous.repeat_count += 1
+                previous.timestamp = current_time
+                if previous.repeat_count >= self.max_key_repeat:
+                    # Release the held key so a long key hold can't starve output
+                    held[_KEY] = None
+                    if stats:
+                        self.events_output += 1
+                    return previous
+                return None
+        elif within_window:
+            # Mouse moves and resizes coalesce by keeping the latest event
+            if stats:
+                self.events_coalesced += 1
+            held[slot] = event
+            if slot == _MOUSE:
+                # The superseded move is never delivered, recycle it if it
+                # came from the pool
+                previous.release()
             return None
-        else:
-            # Different key or too much time passed
-            output = self.last_key_event
-            self.last_key_event = event
-            self.events_output += 1
-            return output
-    
-    def _handle_resize_event(self, event: ResizeEvent, current_time: float) -> Optional[ResizeEvent]:
-        """Handle resize event coalescing."""
-        event.timestamp = current_time
         
-        if self.last_resize_event is None:
-            # First resize event
-            self.last_resize_event = event
-            return None
-        
-        # Check if we can coalesce
-        if self.last_resize_event.can_coalesce_with(event, self.resize_coalesce_time):
-            # Coalesce: keep the latest size
-            self.events_coalesced += 1
-            self.last_resize_event = event
-            return None
-        else:
-            # Too much time passed
-            output = self.last_resize_event
-            self.last_resize_event = event
+        # Can't coalesce, output the previous event and hold the new one
+        held[slot] = event
+        if stats:
             self.events_output += 1
-            return output
+        return previous
     
     def flush(self) -> List[Any]:
         """
@@ -209,24 +295,13 @@ class EventCoalescer:
         Returns:
             List of pending events
         """
-        output = []
-        
-        # Flush held events in order
-        if self.last_mouse_event:
-            output.append(self.last_mouse_event)
-            self.events_output += 1
-            self.last_mouse_event = None
-        
-        if self.last_key_event:
-            output.append(self.last_key_event)
-            self.events_output += 1
-            self.last_key_event = None
-        
-        if self.last_resize_event:
-            output.append(self.last_resize_event)
-            self.events_output += 1
-            self.last_resize_event = None
-        
+        # Flush held events in kind order (mouse, key, resize)
+        held = self._held
+        output = [event for event in held if event is not None]
+        held[:] = (None, None, None)
+        self.holding = False
+        if self.stats_enabled:
+            self.events_output += len(output)
         return output
     
     def get_pending_event(self, max_wait: float = 0.0) -> Optional[Any]:
@@ -239,42 +314,56 @@ class EventCoalescer:
         Returns:
             Next event or None
         """
-        current_time = time.time()
+        current_time = now_ns()
+        held = self._held
         
         # Check if any held events have aged out
-        if self.last_mouse_event:
-            if current_time - self.last_mouse_event.timestamp > self.mouse_coalesce_time:
-                event = self.last_mouse_event
-                self.last_mouse_event = None
-                self.events_output += 1
-                return event
-        
-        if self.last_key_event:
-            if current_time - self.last_key_event.timestamp > self.key_coalesce_time:
-                event = self.last_key_event
-                self.last_key_event = None
-                self.events_output += 1
-                return event
-        
-        if self.last_resize_event:
-            if current_time - self.last_resize_event.timestamp > self.resize_coalesce_time:
-                event = self.last_resize_event
-                self.last_resize_event = None
-                self.events_output += 1
+        for kind, threshold in enumerate(self._thresholds_ns):
+            event = held[kind]
+            if event is not None and current_time - event.timestamp > threshold:
+                held[kind] = None
+                if self.stats_enabled:
+                    self.events_output += 1
                 return event
         
+        if held[0] is None and held[1] is None and held[2] is None:
+            self.holding = False
         return None
     
-    def get_stats(self) -> dict:
-        """Get coalescing statistics."""
-        return {
-            'events_received': self.events_received,
-            'events_coalesced': self.events_coalesced,
-            'events_output': self.events_output,
-            'coalesce_ratio': self.events_coalesced / max(1, self.events_received),
-            'reduction_ratio': 1.0 - (self.events_output / max(1, self.events_received))
-        }
+    def get_stats(self) -> Mapping[str, Any]:
+        """
+        Get coalescing statistics.
+
+        The result is a read-only view, cached and reused until one of the
+        counters changes, so polling every frame costs nothing while the
+        input is idle.
+        """
+        received = self.events_received
+        coalesced = self.events_coalesced
+        output = self.events_output
+        cached = self._cached_stats
+        if (cached is not None and cached['events_received'] == received and
+                cached['events_coalesced'] == coalesced and cached['events_output'] == output):
+            return cached
+
+        divisor = max(1, received)
+        cached = self._cached_stats = MappingProxyType({
+            'events_received': received,
+            'events_coalesced': coalesced,
+            'events_output': output,
+            'coalesce_ratio': coalesced / divisor,
+            'reduction_ratio': 1.0 - output / divisor,
+        })
+        return cached
     
+    def enable_stats(self):
+        """Start counting events for get_stats."""
+        self.stats_enabled = True
+
+    def disable_stats(self):
+        """Stop counting events; get_stats keeps reporting the last counts."""
+        self.stats_enabled = False
+
     def reset_stats(self):
         """Reset statistics counters."""
         self.events_received = 0
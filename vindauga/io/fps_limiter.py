@@ -6,7 +6,7 @@ This module provides the FPSLimiter class which helps control the rate
 of screen updates to prevent excessive CPU usage and flickering.
 """
 
-import time
+from time import monotonic as _monotonic, sleep as _sleep
 from typing import Optional
 
 
@@ -62,7 +62,7 @@ class FPSLimiter:
         if not self._enabled:
             return True
         
-        current_time = time.monotonic()
+        current_time = _monotonic()
         
         # First frame always proceeds
         if self.last_frame_time is None:
@@ -88,16 +88,19 @@ class FPSLimiter:
         if not self._enabled:
             return
         
-        current_time = time.monotonic()
+        current_time = _monotonic()
         
         if self.last_frame_time is not None:
             time_elapsed = current_time - self.last_frame_time
             time_to_wait = self.frame_time - time_elapsed
             
             if time_to_wait > 0:
-                time.sleep(time_to_wait)
+                _sleep(time_to_wait)
+                # The frame starts at the deadline we slept until; no need
+                # to read the clock again
+                current_time += time_to_wait
         
-        self.last_frame_time = time.monotonic()
+        self.last_frame_time = current_time
     
     def set_fps(self, target_fps: int) -> None:
         """
@@ -132,7 +135,7 @@ class FPSLimiter:
         if self.last_frame_time is None:
             return 0.0
         
-        current_time = time.monotonic()
+        current_time = _monotonic()
         time_elapsed = current_time - self.last_frame_time
         
         if time_elapsed > 0:
@@ -150,7 +153,7 @@ class FPSLimiter:
         if self.last_frame_time is None:
             return 0.0
         
-        return time.monotonic() - self.last_frame_time
+        return _monotonic() - self.last_frame_time
     
     def __repr__(self) -> str:
         """String representation for debugging."""
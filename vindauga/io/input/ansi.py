@@ -7,35 +7,96 @@ including escape sequence parsing and event generation.
 """
 
 import sys
-import select
+import re
 import time
 import os
-from typing import Optional, List, Tuple
+from collections import deque
+from typing import Optional, List, Tuple, Deque
 from dataclasses import dataclass
-from enum import Enum, auto
-from .base import InputHandler
+from enum import IntEnum
 
+try:
+    import fcntl
+    import termios
+    import tty
+except ImportError:
+    # Not a POSIX platform, the handler can't be initialized
+    fcntl = termios = tty = None
 
-class ParserState(Enum):
+from .base import InputHandler, create_read_selector
+
+
+class ParserState(IntEnum):
     """ANSI escape sequence parser states."""
-    NORMAL = auto()
-    ESC = auto()
-    CSI = auto()
-    SS3 = auto()
-    DCS = auto()
-    OSC = auto()
+    NORMAL = 0
+    ESC = 1
+    CSI = 2
+    SS3 = 3
+    DCS = 4
+    OSC = 5
+
+
+# Plain int states for the per-byte hot path; they index the parser's
+# handler table
+_ST_NORMAL = 0
+_ST_ESC = 1
+_ST_CSI = 2
+_ST_SS3 = 3
+
+# (shift, alt, ctrl) for a CSI key modifier parameter, indexed by
+# (modifier - 1) & 7: 1=none, 2=shift, 3=alt, 4=shift+alt, 5=ctrl, ...
+_KEY_MODIFIERS = tuple((bool(bits & 1), bool(bits & 2), bool(bits & 4)) for bits in range(8))
+
+# (shift, alt, ctrl) for a mouse button code, indexed by button_code & 0x1C
+_MOUSE_MODIFIERS = tuple((bool(bits & 0x04), bool(bits & 0x08), bool(bits & 0x10)) for bits in range(0x20))
+
+# Mouse button action by CSI final byte: 'M' press, SGR 'm' release
+_MOUSE_ACTIONS = {0x4D: 'press', 0x6D: 'release'}
+
+# Marks the ESC byte in the NORMAL state lookup table
+_ESC_MARK = object()
 
+# Size of the reusable stdin read buffer
+READ_BUFFER_SIZE = 65536
 
-@dataclass
+# Runs of bytes that each map straight to a key in the NORMAL state (text,
+# Tab, Enter, Backspace, Ctrl+letter) need no escape parsing and can be
+# emitted in bulk
+_KEY_RUN = re.compile(rb'[\x01-\x1a\x20-\xff]+')
+# A complete CSI sequence: ESC [ params intermediates final
+_CSI_SEQUENCE = re.compile(rb'\x1b\[([\x3c-\x3f]?[0-9;]*)([\x20-\x2f]*)([\x40-\x7e])')
+# An X11 or SGR mouse report: optional '<' marker and the button code
+_MOUSE_REPORT = re.compile(rb'\x1b\[(<?)([0-9]+);[0-9]+;[0-9]+M')
+
+
+@dataclass(frozen=True, slots=True)
 class ParsedKey:
-    """Parsed keyboard event."""
+    """
+    Parsed keyboard event.
+    
+    Instances are interned by _pk() and shared between keystrokes, so they
+    are immutable.
+    """
     key: str
     ctrl: bool = False
     alt: bool = False
     shift: bool = False
-    
 
-@dataclass
+
+# (key, ctrl, alt, shift) -> shared ParsedKey
+_KEY_CACHE = {}
+
+
+def _pk(key: str, ctrl: bool = False, alt: bool = False, shift: bool = False) -> ParsedKey:
+    """Return the interned ParsedKey for a key and modifier combination."""
+    cache_key = (key, ctrl, alt, shift)
+    parsed = _KEY_CACHE.get(cache_key)
+    if parsed is None:
+        parsed = _KEY_CACHE[cache_key] = ParsedKey(key, ctrl, alt, shift)
+    return parsed
+
+
+@dataclass(slots=True)
 class ParsedMouse:
     """Parsed mouse event."""
     x: int
@@ -47,6 +108,14 @@ class ParsedMouse:
     shift: bool = False
 
 
+def _is_repeat_move(previous: object, event: object) -> bool:
+    """Check if event is a mouse move continuing the same drag as previous."""
+    return (type(event) is ParsedMouse and event.action == 'move' and
+            type(previous) is ParsedMouse and previous.action == 'move' and
+            previous.button == event.button and previous.ctrl == event.ctrl and
+            previous.alt == event.alt and previous.shift == event.shift)
+
+
 class ANSIEscapeParser:
     """
     ANSI escape sequence parser.
@@ -60,10 +129,16 @@ class ANSIEscapeParser:
     
     def __init__(self):
         """Initialize parser."""
-        self.state = ParserState.NORMAL
-        self.sequence_buffer = bytearray()
-        self.sequence_params = []
+        self.state = _ST_NORMAL
+        # CSI parameters are accumulated as ints while the bytes arrive;
+        # -1 marks an omitted parameter
+        self.sequence_params: List[int] = []
+        self._cur_param = 0
+        self._has_param = False
+        self.private_marker = 0
         self.intermediate = ''
+        # Handlers indexed by parser state
+        self._handlers = (self._parse_normal, self._parse_esc, self._parse_csi, self._parse_ss3)
         
         # Build key mappings
         self._build_key_maps()
@@ -103,12 +178,41 @@ class ANSIEscapeParser:
             'R': 'F3',
             'S': 'F4',
         }
+        
+        # NORMAL state byte -> interned ParsedKey, _ESC_MARK or None
+        lut = [None] * 256
+        for byte in range(0x01, 0x1B):  # Ctrl+A through Ctrl+Z
+            lut[byte] = _pk(chr(byte + 0x40), ctrl=True)
+        for byte in range(0x20, 0x100):  # Regular characters
+            lut[byte] = _pk(chr(byte))
+        lut[0x09] = _pk('Tab')
+        lut[0x0D] = _pk('Enter')
+        lut[0x08] = lut[0x7F] = _pk('Backspace')
+        lut[0x1B] = _ESC_MARK
+        self._normal_lut = tuple(lut)
+        
+        # ESC state byte -> interned Alt+key or None
+        self._alt_lut = tuple(_pk(chr(byte), alt=True) if byte < 0x80 else None
+                              for byte in range(256))
+        
+        # SS3 state byte -> interned key or None
+        lut = [None] * 256
+        for char, key_name in self.ss3_keys.items():
+            lut[ord(char)] = _pk(key_name)
+        self._ss3_lut = tuple(lut)
+    
+    @property
+    def in_sequence(self) -> bool:
+        """True while an escape sequence has been started but not finished."""
+        return self.state != _ST_NORMAL
     
     def reset(self):
         """Reset parser state."""
-        self.state = ParserState.NORMAL
-        self.sequence_buffer.clear()
+        self.state = _ST_NORMAL
         self.sequence_params.clear()
+        self._cur_param = 0
+        self._has_param = False
+        self.private_marker = 0
         self.intermediate = ''
     
     def parse_byte(self, byte: int) -> Optional[object]:
@@ -118,103 +222,188 @@ class ANSIEscapeParser:
         Returns:
             ParsedKey, ParsedMouse, or None if sequence incomplete
         """
-        if self.state == ParserState.NORMAL:
-            return self._parse_normal(byte)
-        elif self.state == ParserState.ESC:
-            return self._parse_esc(byte)
-        elif self.state == ParserState.CSI:
-            return self._parse_csi(byte)
-        elif self.state == ParserState.SS3:
-            return self._parse_ss3(byte)
-        else:
-            # Unsupported sequence, reset
+        try:
+            handler = self._handlers[self.state]
+        except IndexError:
+            # Unsupported state, reset
             self.reset()
             return None
+        return handler(byte)
+    
+    def feed(self, data: bytes, coalesce_moves: bool = False) -> List[object]:
+        """
+        Parse a chunk of input in one call.
+        
+        Equivalent to calling parse_byte for every byte and keeping the
+        results that aren't None. While the parser is idle, runs of plain key
+        bytes and complete CSI sequences are recognised with compiled regex
+        scans, so they skip the per-byte state machine; everything else,
+        including sequences split across chunks, goes through parse_byte.
+        
+        Args:
+            data: Input bytes
+            coalesce_moves: If True, of consecutive mouse move reports with
+                the same buttons and modifiers only the last is parsed
+        
+        Returns:
+            ParsedKey and ParsedMouse objects in input order
+        """
+        results = []
+        append = results.append
+        extend = results.extend
+        parse = self.parse_byte
+        parse_csi = self.parse_csi_sequence
+        match_keys = _KEY_RUN.match
+        match_csi = _CSI_SEQUENCE.match
+        match_mouse = _MOUSE_REPORT.match
+        lookup_key = self._normal_lut.__getitem__
+        alt_keys = self._alt_lut
+        ss3_keys = self._ss3_lut
+        position = 0
+        length = len(data)
+        while position < length:
+            if self.state == _ST_NORMAL:
+                run = match_keys(data, position)
+                if run:
+                    extend(map(lookup_key, run.group()))
+                    position = run.end()
+                    continue
+                
+                if coalesce_moves:
+                    report = match_mouse(data, position)
+                    if report and int(report.group(2)) & 0x60 == 0x20:
+                        # Skip ahead to the last move of the same drag
+                        button = report.group(1, 2)
+                        following = match_mouse(data, report.end())
+                        while following and following.group(1, 2) == button:
+                            report = following
+                            following = match_mouse(data, report.end())
+                        position = report.start()
+                
+                sequence = match_csi(data, position)
+                if sequence:
+                    params, intermediate, final = sequence.groups()
+                    result = parse_csi(params, intermediate, final[0])
+                    position = sequence.end()
+                elif data[position] == 0x1B and position + 1 < length and data[position + 1] != 0x5B:
+                    # Complete two and three byte sequences resolve through
+                    # the ESC and SS3 state tables directly
+                    if data[position + 1] != 0x4F:
+                        result = alt_keys[data[position + 1]]
+                        position += 2
+                    elif position + 2 < length:
+                        result = ss3_keys[data[position + 2]]
+                        position += 3
+                    else:
+                        result = parse(data[position])
+                        position += 1
+                else:
+                    result = parse(data[position])
+                    position += 1
+            else:
+                result = parse(data[position])
+                position += 1
+            
+            if result:
+                append(result)
+        return results
     
     def _parse_normal(self, byte: int) -> Optional[ParsedKey]:
         """Parse normal state byte."""
-        if byte == 0x1B:  # ESC
-            self.state = ParserState.ESC
+        key = self._normal_lut[byte]
+        if key is _ESC_MARK:
+            self.state = _ST_ESC
             return None
-        elif byte < 0x20:  # Control character
-            # Handle common control characters
-            if byte == 0x09:  # Tab
-                return ParsedKey('Tab')
-            elif byte == 0x0D:  # Enter
-                return ParsedKey('Enter')
-            elif byte == 0x08 or byte == 0x7F:  # Backspace
-                return ParsedKey('Backspace')
-            elif 0x01 <= byte <= 0x1A:  # Ctrl+A through Ctrl+Z
-                return ParsedKey(chr(byte + 0x40), ctrl=True)
-            else:
-                return None
-        else:
-            # Regular character
-            try:
-                char = chr(byte)
-                return ParsedKey(char)
-            except:
-                return None
+        return key
     
     def _parse_esc(self, byte: int) -> Optional[object]:
         """Parse ESC state byte."""
         if byte == ord('['):  # CSI
-            self.state = ParserState.CSI
-            self.sequence_buffer.clear()
+            self.state = _ST_CSI
             self.sequence_params.clear()
+            self._cur_param = 0
+            self._has_param = False
             return None
         elif byte == ord('O'):  # SS3
-            self.state = ParserState.SS3
+            self.state = _ST_SS3
             return None
         else:
             # Alt+key combination
             self.reset()
-            if byte < 0x80:
-                return ParsedKey(chr(byte), alt=True)
-            return None
+            return self._alt_lut[byte]
     
     def _parse_csi(self, byte: int) -> Optional[object]:
         """Parse CSI state byte."""
-        if 0x30 <= byte <= 0x3F:  # Parameter byte
-            self.sequence_buffer.append(byte)
+        if 0x30 <= byte <= 0x39:  # Parameter digit
+            self._cur_param = self._cur_param * 10 + (byte - 0x30)
+            self._has_param = True
+            return None
+        elif byte == 0x3B or byte == 0x3A:  # Parameter separator
+            self.sequence_params.append(self._cur_param if self._has_param else -1)
+            self._cur_param = 0
+            self._has_param = False
+            return None
+        elif 0x3C <= byte <= 0x3F:  # Private marker, e.g. '<' for SGR mouse
+            self.private_marker = byte
             return None
         elif 0x20 <= byte <= 0x2F:  # Intermediate byte
             self.intermediate = chr(byte)
             return None
         elif 0x40 <= byte <= 0x7E:  # Final byte
-            # Parse parameters
-            params_str = self.sequence_buffer.decode('ascii', errors='ignore')
-            if params_str:
-                self.sequence_params = params_str.split(';')
-            else:
-                self.sequence_params = []
-            
-            # Check for mouse event
-            if chr(byte) == 'M' and len(self.sequence_params) >= 3:
-                return self._parse_x11_mouse()
-            elif chr(byte) == '<' and self.intermediate:
-                return self._parse_sgr_mouse(chr(byte))
-            
-            # Parse key event
-            return self._parse_csi_key(chr(byte))
+            if self._has_param or self.sequence_params:
+                self.sequence_params.append(self._cur_param if self._has_param else -1)
+            return self._parse_csi_final(byte)
         else:
             # Invalid sequence
             self.reset()
             return None
     
+    def _parse_csi_final(self, byte: int) -> Optional[object]:
+        """Parse a CSI sequence once its final byte and parameters are known."""
+        # Mouse reports: X11 'ESC [ b;x;y M' or SGR 'ESC [ < b;x;y M/m'
+        marker = self.private_marker
+        if len(self.sequence_params) >= 3 and ((byte == 0x4D and not marker) or
+                                               (marker == 0x3C and byte in _MOUSE_ACTIONS)):
+            return self._parse_mouse(byte)
+        
+        # Parse key event
+        return self._parse_csi_key(chr(byte))
+    
+    def parse_csi_sequence(self, params: bytes, intermediate: bytes, final: int) -> Optional[object]:
+        """
+        Parse a complete CSI sequence in one call.
+        
+        Equivalent to feeding ESC, '[', the parameter and intermediate bytes
+        and the final byte through parse_byte, without the per-byte dispatch.
+        The parser must be in the NORMAL state, and params may only hold an
+        optional leading private marker followed by digits and semicolons.
+        """
+        self.state = _ST_CSI
+        if intermediate:
+            self.intermediate = chr(intermediate[-1])
+        if params and params[0] >= 0x3C:
+            self.private_marker = params[0]
+            params = params[1:]
+        if params:
+            self.sequence_params = [int(param) if param else -1 for param in params.split(b';')]
+        return self._parse_csi_final(final)
+    
     def _parse_ss3(self, byte: int) -> Optional[ParsedKey]:
         """Parse SS3 state byte."""
         self.reset()
-        key_char = chr(byte)
-        if key_char in self.ss3_keys:
-            return ParsedKey(self.ss3_keys[key_char])
-        return None
+        return self._ss3_lut[byte]
     
     def _parse_csi_key(self, final_char: str) -> Optional[ParsedKey]:
         """Parse CSI key sequence."""
+        params = self.sequence_params
+        if self.private_marker:
+            # No private-mode key sequences are mapped
+            self.reset()
+            return None
+        
         # Build full sequence
-        if self.sequence_params:
-            seq = self.sequence_params[0] + final_char
+        if params and params[0] >= 0:
+            seq = str(params[0]) + final_char
         else:
             seq = final_char
         
@@ -227,88 +416,38 @@ class ANSIEscapeParser:
             alt = False
             shift = False
             
-            if len(self.sequence_params) >= 2:
-                modifier = int(self.sequence_params[1]) if self.sequence_params[1] else 1
-                # Modifier encoding: 1=none, 2=shift, 3=alt, 4=shift+alt, 
-                #                   5=ctrl, 6=shift+ctrl, 7=alt+ctrl, 8=shift+alt+ctrl
-                shift = (modifier - 1) & 1 != 0
-                alt = (modifier - 1) & 2 != 0
-                ctrl = (modifier - 1) & 4 != 0
+            if len(params) >= 2:
+                modifier = params[1] if params[1] >= 0 else 1
+                shift, alt, ctrl = _KEY_MODIFIERS[(modifier - 1) & 7]
             
             self.reset()
-            return ParsedKey(key_name, ctrl=ctrl, alt=alt, shift=shift)
+            return _pk(key_name, ctrl, alt, shift)
         
         self.reset()
         return None
     
-    def _parse_x11_mouse(self) -> Optional[ParsedMouse]:
-        """Parse X11 mouse protocol event."""
-        if len(self.sequence_params) < 3:
-            self.reset()
+    def _parse_mouse(self, final_byte: int) -> Optional[ParsedMouse]:
+        """Parse an X11 or SGR mouse protocol event."""
+        button_code, x, y = self.sequence_params[:3]
+        self.reset()
+        if button_code < 0 or x < 0 or y < 0:
+            # Omitted parameter
             return None
         
-        try:
-            button_code = int(self.sequence_params[0])
-            x = int(self.sequence_params[1]) - 1  # Convert to 0-based
-            y = int(self.sequence_params[2]) - 1
-            
-            # Decode button and modifiers
+        shift, alt, ctrl = _MOUSE_MODIFIERS[button_code & 0x1C]
+        if button_code & 0x40:
+            action = 'wheel'
+            button = 4 + (button_code & 0x01)  # Wheel up/down
+        elif button_code & 0x20:
+            action = 'move'
             button = button_code & 0x03
-            shift = (button_code & 0x04) != 0
-            alt = (button_code & 0x08) != 0
-            ctrl = (button_code & 0x10) != 0
-            
-            # Determine action
-            if button_code & 0x20:
-                action = 'move'
-            elif button_code & 0x40:
-                action = 'wheel'
-            else:
-                action = 'press'  # X11 doesn't distinguish press/release
-            
-            self.reset()
-            return ParsedMouse(x, y, button, action, ctrl=ctrl, alt=alt, shift=shift)
-            
-        except:
-            self.reset()
-            return None
-    
-    def _parse_sgr_mouse(self, final_char: str) -> Optional[ParsedMouse]:
-        """Parse SGR mouse protocol event."""
-        if len(self.sequence_params) < 3:
-            self.reset()
-            return None
-        
-        try:
-            button_code = int(self.sequence_params[0])
-            x = int(self.sequence_params[1]) - 1  # Convert to 0-based
-            y = int(self.sequence_params[2]) - 1
-            
-            # Decode button and modifiers
+        else:
+            # X11 doesn't distinguish press/release, SGR uses 'm' for release
+            action = _MOUSE_ACTIONS[final_byte]
             button = button_code & 0x03
-            shift = (button_code & 0x04) != 0
-            alt = (button_code & 0x08) != 0
-            ctrl = (button_code & 0x10) != 0
-            
-            # Determine action based on final character
-            if final_char == 'M':
-                action = 'press'
-            elif final_char == 'm':
-                action = 'release'
-            else:
-                action = 'move'
-            
-            # Check for wheel events
-            if button_code >= 64:
-                action = 'wheel'
-                button = 4 if button_code == 64 else 5  # Wheel up/down
-            
-            self.reset()
-            return ParsedMouse(x, y, button, action, ctrl=ctrl, alt=alt, shift=shift)
-            
-        except:
-            self.reset()
-            return None
+        
+        # Convert to 0-based coordinates
+        return ParsedMouse(x - 1, y - 1, button, action, ctrl, alt, shift)
 
 
 class ANSIInput(InputHandler):
@@ -327,9 +466,13 @@ class ANSIInput(InputHandler):
         super().__init__()
         self.stdin = sys.stdin
         self.stdin_fd = None
+        self._selector = None
         self.parser = ANSIEscapeParser()
         self.input_buffer = bytearray()
-        self.event_queue = []
+        # Reused for every read so draining stdin doesn't allocate
+        self._read_buffer = bytearray(READ_BUFFER_SIZE)
+        self._read_view = memoryview(self._read_buffer)
+        self.event_queue: Deque[object] = deque()
         self.utf8_buffer = bytearray()
         self.original_termios = None
         
@@ -339,6 +482,9 @@ class ANSIInput(InputHandler):
             return True
         
         try:
+            if termios is None:
+                return False
+            
             # Get stdin file descriptor
             if hasattr(self.stdin, 'fileno'):
                 self.stdin_fd = self.stdin.fileno()
@@ -346,24 +492,24 @@ class ANSIInput(InputHandler):
                 return False
             
             # Save original terminal settings
-            import termios
-            import tty
             try:
                 self.original_termios = termios.tcgetattr(self.stdin_fd)
                 # Set terminal to raw mode to prevent echo
                 tty.setraw(self.stdin_fd)
-            except:
+            except termios.error:
                 self.original_termios = None
             
             # Set non-blocking mode
-            import fcntl
             flags = fcntl.fcntl(self.stdin_fd, fcntl.F_GETFL)
             fcntl.fcntl(self.stdin_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
             
+            # Watch stdin with a persistent selector instead of select() per call
+            self._selector = create_read_selector(self.stdin_fd)
+            
             self._initialized = True
             return True
             
-        except:
+        except (OSError, ValueError):
             return False
     
     def shutdown(self) -> None:
@@ -374,17 +520,19 @@ class ANSIInput(InputHandler):
         try:
             # Restore original terminal settings
             if hasattr(self, 'original_termios') and self.original_termios and self.stdin_fd is not None:
-                import termios
                 termios.tcsetattr(self.stdin_fd, termios.TCSADRAIN, self.original_termios)
             
             # Restore blocking mode
             if self.stdin_fd is not None:
-                import fcntl
                 flags = fcntl.fcntl(self.stdin_fd, fcntl.F_GETFL)
                 fcntl.fcntl(self.stdin_fd, fcntl.F_SETFL, flags & ~os.O_NONBLOCK)
-        except:
+        except (OSError, termios.error):
             pass
         
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        
         self._initialized = False
     
     def get_event(self, timeout: float = 0.0) -> Optional[object]:
@@ -400,56 +548,111 @@ class ANSIInput(InputHandler):
         if not self._initialized:
             return None
         
-        # Check queued events first
+        # Check queued events first, only reading stdin when there are none
+        if not self.event_queue:
+            self._poll_input(timeout)
+        
         if self.event_queue:
-            return self.event_queue.pop(0)
+            return self.event_queue.popleft()
+        
+        return None
+    
+    def get_events(self, max_count: int = 64) -> List[object]:
+        """
+        Get up to max_count events at once.
+        
+        Queued events are drained first, and stdin is polled, read and parsed
+        at most once per call, so an event loop can take a whole burst of
+        input without paying for a select() per event.
+        """
+        if not self._initialized:
+            return []
         
-        # Read available input
+        queue = self.event_queue
+        if len(queue) < max_count:
+            self._poll_input(0.0)
+        
+        pop = queue.popleft
+        return [pop() for _ in range(min(max_count, len(queue)))]
+    
+    def _poll_input(self, timeout: float) -> None:
+        """
+        Wait for stdin to become readable, then read and queue its events.
+        
+        Args:
+            timeout: Timeout in seconds (0 = non-blocking, -1 = blocking)
+        """
         if timeout < 0:
             # Blocking read
             ready = True
         elif timeout == 0:
             # Non-blocking check
-            ready, _, _ = select.select([self.stdin_fd], [], [], 0)
+            ready = self._selector.select(0)
         else:
             # Timed wait
-            ready, _, _ = select.select([self.stdin_fd], [], [], timeout)
+            ready = self._selector.select(timeout)
         
         if not ready:
-            return None
+            return
         
         # Read available bytes
-        try:
-            data = os.read(self.stdin_fd, 4096)
-            if not data:
-                return None
-        except (OSError, IOError):
-            return None
-        
-        # Parse input bytes
-        for byte in data:
-            result = self.parser.parse_byte(byte)
-            if result:
-                # Convert parsed result to event
-                event = self._convert_to_event(result)
-                if event:
-                    self.event_queue.append(event)
+        count = self._read_input()
+        if count:
+            self._queue_input(self._read_view[:count])
+    
+    def _read_input(self) -> int:
+        """
+        Drain pending stdin into the reusable read buffer.
         
-        # Return first event if available
-        if self.event_queue:
-            return self.event_queue.pop(0)
+        Keeps reading until the descriptor would block, so a burst that
+        arrives in several chunks is parsed in one pass.
         
-        return None
+        Returns:
+            Number of bytes read into the buffer
+        """
+        view = self._read_view
+        capacity = len(view)
+        total = 0
+        while total < capacity:
+            try:
+                count = os.readv(self.stdin_fd, [view[total:]])
+            except OSError:
+                # Includes BlockingIOError once stdin is drained
+                break
+            if not count:
+                break
+            total += count
+        return total
+    
+    def _queue_input(self, data: bytes) -> None:
+        """Parse input bytes and queue the resulting events."""
+        convert = self._convert_to_event
+        queue = self.event_queue
+        enqueue = queue.append
+        for result in self.parser.feed(data, coalesce_moves=True):
+            # Convert parsed result to event
+            event = convert(result)
+            if event:
+                if type(event) is ParsedMouse and queue and _is_repeat_move(queue[-1], event):
+                    # Only the latest position of a drag matters
+                    queue[-1] = event
+                else:
+                    enqueue(event)
     
     def has_events(self) -> bool:
-        """Check if events are available."""
+        """
+        Check if events are available.
+        
+        Readable stdin may only hold part of an escape sequence, so pending
+        input is parsed here and only complete events are reported.
+        """
         if self.event_queue:
             return True
         
         # Check for available input
-        if self.stdin_fd:
-            ready, _, _ = select.select([self.stdin_fd], [], [], 0)
-            return bool(ready)
+        if self._selector is not None:
+            self._poll_input(0.0)
+            return bool(self.event_queue)
         
         return False
     
@@ -471,14 +674,14 @@ class ANSIInput(InputHandler):
         self.parser.reset()
         
         # Flush stdin
-        if self.stdin_fd:
+        if self._selector is not None:
             try:
                 while True:
-                    ready, _, _ = select.select([self.stdin_fd], [], [], 0)
+                    ready = self._selector.select(0)
                     if not ready:
                         break
                     os.read(self.stdin_fd, 4096)
-            except:
+            except OSError:
                 pass
     
     def _convert_to_event(self, parsed: object) -> Optional[object]:
@@ -8,15 +8,24 @@ sequences and generates input events while allowing Ctrl+C to work normally.
 
 import sys
 import os
-import select
 import signal
 import atexit
-from typing import Optional, List
-from enum import Enum
-from .base import InputHandler
+from collections import deque
+from typing import Optional, Deque
+from enum import IntEnum
 
+try:
+    import fcntl
+    import termios
+    import tty
+except ImportError:
+    # Not a POSIX platform, the handler can't be initialized
+    fcntl = termios = tty = None
 
-class ParserState(Enum):
+from .base import InputHandler, create_read_selector
+
+
+class ParserState(IntEnum):
     """ANSI escape parser states."""
     NORMAL = 0
     ESC = 1
@@ -24,8 +33,18 @@ class ParserState(Enum):
     SS3 = 3
 
 
+# Plain int states for the per-byte hot path; they index the parser's
+# handler table
+_ST_NORMAL = 0
+_ST_ESC = 1
+_ST_CSI = 2
+_ST_SS3 = 3
+
+
 class ParsedKey:
     """Parsed key event."""
+    __slots__ = ('key', 'ctrl', 'alt', 'shift')
+    
     def __init__(self, key: str, ctrl: bool = False, alt: bool = False, shift: bool = False):
         self.key = key
         self.ctrl = ctrl
@@ -35,6 +54,8 @@ class ParsedKey:
 
 class MouseEvent:
     """Mouse event."""
+    __slots__ = ('x', 'y', 'button', 'action')
+    
     def __init__(self, x: int, y: int, button: int, action: str):
         self.x = x
         self.y = y
@@ -56,14 +77,16 @@ class ANSIEscapeParser:
         Args:
             allow_ctrl_c: If True, Ctrl+C triggers SIGINT instead of being captured
         """
-        self.state = ParserState.NORMAL
+        self.state = _ST_NORMAL
         self.sequence_buffer = bytearray()
         self.sequence_params = []
         self.allow_ctrl_c = allow_ctrl_c
+        # Handlers indexed by parser state
+        self._handlers = (self._parse_normal, self._parse_esc, self._parse_csi, self._parse_ss3)
     
     def reset(self):
         """Reset parser state."""
-        self.state = ParserState.NORMAL
+        self.state = _ST_NORMAL
         self.sequence_buffer.clear()
         self.sequence_params.clear()
     
@@ -77,23 +100,18 @@ class ANSIEscapeParser:
         Returns:
             Parsed event or None
         """
-        if self.state == ParserState.NORMAL:
-            return self._parse_normal(byte)
-        elif self.state == ParserState.ESC:
-            return self._parse_esc(byte)
-        elif self.state == ParserState.CSI:
-            return self._parse_csi(byte)
-        elif self.state == ParserState.SS3:
-            return self._parse_ss3(byte)
-        else:
-            # Unknown state, reset
+        try:
+            handler = self._handlers[self.state]
+        except IndexError:
+            # Unsupported state, reset
             self.reset()
             return None
+        return handler(byte)
     
     def _parse_normal(self, byte: int) -> Optional[ParsedKey]:
         """Parse normal state byte."""
         if byte == 0x1B:  # ESC
-            self.state = ParserState.ESC
+            self.state = _ST_ESC
             return None
         elif byte < 0x20:  # Control character
             # When allow_ctrl_c is True and ISIG is enabled,
@@ -119,18 +137,18 @@ class ANSIEscapeParser:
             try:
                 char = chr(byte)
                 return ParsedKey(char)
-            except:
+            except ValueError:
                 return None
     
     def _parse_esc(self, byte: int) -> Optional[object]:
         """Parse ESC state byte."""
         if byte == ord('['):  # CSI
-            self.state = ParserState.CSI
+            self.state = _ST_CSI
             self.sequence_buffer.clear()
             self.sequence_params.clear()
             return None
         elif byte == ord('O'):  # SS3
-            self.state = ParserState.SS3
+            self.state = _ST_SS3
             return None
         else:
             # Alt+key combination
@@ -174,13 +192,15 @@ class ANSIEscapeParser:
     def _parse_csi_sequence(self, final: int) -> Optional[object]:
         """Parse complete CSI sequence."""
         # Parse parameters
+        # int() accepts the ASCII digit bytes directly, no decode needed.
+        # A private marker such as SGR mouse's '<' is not part of the first
+        # parameter.
         params = []
         if self.sequence_buffer:
-            param_str = self.sequence_buffer.decode('ascii', errors='ignore')
-            for p in param_str.split(';'):
+            for p in self.sequence_buffer.lstrip(b'<=>?').split(b';'):
                 try:
                     params.append(int(p))
-                except:
+                except ValueError:
                     params.append(0)
         
         # Handle different sequences
@@ -213,7 +233,10 @@ class ANSIEscapeParser:
                 y = params[2] - 1 if len(params) > 2 else 0
                 
                 # Determine action
-                if final == ord('M'):
+                if button & 0x20:
+                    # Motion report, with or without a button held
+                    action = 'move'
+                elif final == ord('M'):
                     action = 'press'
                 else:
                     action = 'release'
@@ -243,8 +266,9 @@ class ANSIInput(InputHandler):
         super().__init__()
         self.stdin = sys.stdin
         self.stdin_fd = None
+        self._selector = None
         self.parser = ANSIEscapeParser(allow_ctrl_c=allow_ctrl_c)
-        self.event_queue: List[object] = []
+        self.event_queue: Deque[object] = deque()
         self._initialized = False
         self.original_termios = None
         self.allow_ctrl_c = allow_ctrl_c
@@ -261,6 +285,9 @@ class ANSIInput(InputHandler):
             return True
         
         try:
+            if termios is None:
+                return False
+            
             # Get stdin file descriptor
             if hasattr(self.stdin, 'fileno'):
                 self.stdin_fd = self.stdin.fileno()
@@ -268,8 +295,6 @@ class ANSIInput(InputHandler):
                 return False
             
             # Save original terminal settings
-            import termios
-            import tty
             try:
                 self.original_termios = termios.tcgetattr(self.stdin_fd)
                 
@@ -289,14 +314,16 @@ class ANSIInput(InputHandler):
                     # Use raw mode - captures everything including Ctrl+C
                     tty.setraw(self.stdin_fd)
                     
-            except:
+            except termios.error:
                 self.original_termios = None
             
             # Set non-blocking mode
-            import fcntl
             flags = fcntl.fcntl(self.stdin_fd, fcntl.F_GETFL)
             fcntl.fcntl(self.stdin_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
             
+            # Watch stdin with a persistent selector instead of select() per call
+            self._selector = create_read_selector(self.stdin_fd)
+            
             # Register cleanup handler
             if not self._cleanup_registered:
                 atexit.register(self._cleanup)
@@ -305,7 +332,7 @@ class ANSIInput(InputHandler):
             self._initialized = True
             return True
             
-        except:
+        except (OSError, ValueError):
             return False
     
     def shutdown(self) -> None:
@@ -316,28 +343,30 @@ class ANSIInput(InputHandler):
         try:
             # Restore original terminal settings
             if self.original_termios and self.stdin_fd is not None:
-                import termios
                 try:
                     termios.tcsetattr(self.stdin_fd, termios.TCSADRAIN, self.original_termios)
-                except:
+                except termios.error:
                     # Try immediate if drain fails
                     try:
                         termios.tcsetattr(self.stdin_fd, termios.TCSANOW, self.original_termios)
-                    except:
+                    except termios.error:
                         pass
             
             # Restore blocking mode
             if self.stdin_fd is not None:
-                import fcntl
                 try:
                     flags = fcntl.fcntl(self.stdin_fd, fcntl.F_GETFL)
                     fcntl.fcntl(self.stdin_fd, fcntl.F_SETFL, flags & ~os.O_NONBLOCK)
-                except:
+                except OSError:
                     pass
                     
-        except:
+        except (OSError, termios.error):
             pass
         
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        
         self._initialized = False
     
     def get_event(self, timeout: float = 0.0) -> Optional[object]:
@@ -355,7 +384,7 @@ class ANSIInput(InputHandler):
         
         # Check queued events first
         if self.event_queue:
-            return self.event_queue.pop(0)
+            return self.event_queue.popleft()
         
         # Read available input
         if timeout < 0:
@@ -363,10 +392,10 @@ class ANSIInput(InputHandler):
             ready = True
         elif timeout == 0:
             # Non-blocking check
-            ready, _, _ = select.select([self.stdin_fd], [], [], 0)
+            ready = self._selector.select(0)
         else:
             # Timed wait
-            ready, _, _ = select.select([self.stdin_fd], [], [], timeout)
+            ready = self._selector.select(timeout)
         
         if not ready:
             return None
@@ -379,18 +408,21 @@ class ANSIInput(InputHandler):
         except (OSError, IOError):
             return None
         
-        # Parse input bytes
+        # Parse input bytes, with the per-byte calls bound to locals
+        parse = self.parser.parse_byte
+        convert = self._convert_to_event
+        enqueue = self.event_queue.append
         for byte in data:
-            result = self.parser.parse_byte(byte)
+            result = parse(byte)
             if result:
                 # Convert parsed result to event
-                event = self._convert_to_event(result)
+                event = convert(result)
                 if event:
-                    self.event_queue.append(event)
+                    enqueue(event)
         
         # Return first event if available
         if self.event_queue:
-            return self.event_queue.pop(0)
+            return self.event_queue.popleft()
         
         return None
     
@@ -414,9 +446,8 @@ class ANSIInput(InputHandler):
             return True
         
         # Check for available input
-        if self.stdin_fd is not None:
-            ready, _, _ = select.select([self.stdin_fd], [], [], 0)
-            return bool(ready)
+        if self._selector is not None:
+            return bool(self._selector.select(0))
         
         return False
     
@@ -438,14 +469,14 @@ class ANSIInput(InputHandler):
         self.event_queue.clear()
         
         # Read and discard available input
-        if self.stdin_fd is not None:
+        if self._selector is not None:
             while True:
-                ready, _, _ = select.select([self.stdin_fd], [], [], 0)
+                ready = self._selector.select(0)
                 if not ready:
                     break
                 try:
                     os.read(self.stdin_fd, 4096)
-                except:
+                except OSError:
                     break
     
     def __del__(self):
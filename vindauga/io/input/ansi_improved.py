@@ -8,15 +8,27 @@ and error recovery for a production-ready implementation.
 
 import sys
 import os
-import select
-import time
 import logging
 from typing import Optional, List, Any
-from .ansi_fixed import ANSIInput as BaseANSIInput
-from ..event_coalescer import EventCoalescer, MouseMoveEvent, KeyEvent
+from .ansi_fixed import ANSIInput as BaseANSIInput, ParsedKey, MouseEvent
+from ..event_coalescer import EventCoalescer, MouseMoveEvent, now_ns
 from ..error_recovery import ErrorRecoveryManager, ResilientIO
 
 
+def _mouse_to_coalesceable(event: MouseEvent, timestamp: int) -> Optional[MouseMoveEvent]:
+    """Convert a mouse move to a coalesceable event, other actions pass through."""
+    if event.action == 'move':
+        return MouseMoveEvent.acquire(event.x, event.y, timestamp)
+    return None
+
+
+# Raw event type -> converter to its coalesceable event. Keys are absent on
+# purpose: every keystroke must be delivered, so they bypass the coalescer
+_COALESCE_CONVERTERS = {
+    MouseEvent: _mouse_to_coalesceable,
+}
+
+
 class ImprovedANSIInput(BaseANSIInput):
     """
     Production-ready ANSI input handler with:
@@ -48,7 +60,8 @@ class ImprovedANSIInput(BaseANSIInput):
         
         # Initialize subsystems
         if enable_coalescing:
-            self.coalescer = EventCoalescer()
+            # Coalescing statistics are part of get_statistics()
+            self.coalescer = EventCoalescer(stats_enabled=True)
         else:
             self.coalescer = None
         
@@ -62,6 +75,9 @@ class ImprovedANSIInput(BaseANSIInput):
             self.error_recovery = None
             self.resilient_io = None
         
+        # Arrival time of the last read, shared by all events parsed from it
+        self._read_ts = 0
+        
         # Statistics
         self.total_events = 0
         self.coalesced_events = 0
@@ -80,9 +96,8 @@ class ImprovedANSIInput(BaseANSIInput):
                 data = os.read(self.stdin_fd, 1)
                 if data:
                     # Return basic key event
-                    from .ansi_fixed import ParsedKey
                     return ParsedKey(chr(data[0]))
-        except:
+        except OSError:
             pass
         
         return None
@@ -100,24 +115,13 @@ class ImprovedANSIInput(BaseANSIInput):
         if not self._initialized:
             return None
         
-        # Check for coalesced events first
-        if self.coalescer:
+        # Check for coalesced events first, skipping the call if none are held
+        if self.coalescer and self.coalescer.holding:
             event = self.coalescer.get_pending_event()
             if event:
                 return event
         
-        # Try to get raw event with error recovery
-        if self.enable_error_recovery and self.resilient_io:
-            try:
-                raw_event = self._get_raw_event_safe(timeout)
-            except Exception as e:
-                self.error_count += 1
-                raw_event = self.error_recovery.handle_error(
-                    e, "input", "get_event"
-                )
-        else:
-            raw_event = super().get_event(timeout)
-        
+        raw_event = self._get_raw_event(timeout)
         if raw_event is None:
             return None
         
@@ -140,65 +144,117 @@ class ImprovedANSIInput(BaseANSIInput):
         
         return raw_event
     
+    def get_events(self, max_count: int = 10) -> List[Any]:
+        """
+        Get multiple events at once.
+        
+        With coalescing enabled this takes the batch path, otherwise events
+        are fetched one at a time.
+        """
+        if self.coalescer:
+            return self.get_events_batch(max_count)
+        return super().get_events(max_count)
+    
+    def get_events_batch(self, max_count: int = 64) -> List[Any]:
+        """
+        Get up to max_count events from a single read.
+        
+        Events still held by the coalescer come first. The raw events that
+        follow bypass the coalescer but are converted as get_event would
+        convert them, so mouse moves arrive as MouseMoveEvent; each run of
+        consecutive moves is reduced to its last move, with keys, presses
+        and releases acting as barriers.
+        
+        Args:
+            max_count: Maximum number of events to return
+            
+        Returns:
+            List of events
+        """
+        if not self._initialized:
+            return []
+        
+        queue = self.event_queue
+        events = self.coalescer.flush() if self.coalescer else []
+        if len(events) >= max_count:
+            # Leave the surplus queued, oldest first, for the next call
+            queue.extendleft(reversed(events[max_count:]))
+            del events[max_count:]
+            return events
+        
+        raw_event = self._get_raw_event(0.0)
+        if raw_event is None:
+            return events
+        raw_events = [raw_event]
+        room = max_count - len(events)
+        while queue and len(raw_events) < room:
+            raw_events.append(queue.popleft())
+        self.total_events += len(raw_events)
+        
+        convert = self._to_coalesceable
+        for event in raw_events:
+            move = convert(event)
+            if move is None:
+                events.append(event)
+            elif events and type(events[-1]) is MouseMoveEvent:
+                # Only the latest position of a drag matters
+                events[-1].release()
+                events[-1] = move
+            else:
+                events.append(move)
+        return events
+    
+    def _get_raw_event(self, timeout: float) -> Optional[object]:
+        """Get raw event, with error recovery if enabled."""
+        if self.enable_error_recovery and self.resilient_io:
+            try:
+                return self._get_raw_event_safe(timeout)
+            except Exception as e:
+                self.error_count += 1
+                return self.error_recovery.handle_error(e, "input", "get_event")
+        return super().get_event(timeout)
+    
     def _get_raw_event_safe(self, timeout: float) -> Optional[object]:
         """Get raw event with error recovery."""
         # Check queued events first
         if self.event_queue:
-            return self.event_queue.pop(0)
-        
-        # Read available input with error recovery
-        if timeout < 0:
-            ready = True
-        elif timeout == 0:
-            ready, _, _ = select.select([self.stdin_fd], [], [], 0)
-        else:
-            ready, _, _ = select.select([self.stdin_fd], [], [], timeout)
+            return self.event_queue.popleft()
         
-        if not ready:
+        # stdin is non-blocking, so a poll reads straight away and an empty
+        # descriptor comes back as no data, saving a select() per poll
+        if timeout > 0 and not self._selector.select(timeout):
             return None
         
         # Read with error recovery
         data = self.resilient_io.safe_read(self.stdin_fd, 4096, "input")
         if not data:
             return None
+        self._read_ts = now_ns()
         
-        # Parse input bytes
+        # Parse input bytes, with the per-byte calls bound to locals
+        parse = self.parser.parse_byte
+        convert = self._convert_to_event
+        enqueue = self.event_queue.append
         for byte in data:
-            result = self.parser.parse_byte(byte)
+            result = parse(byte)
             if result:
-                event = self._convert_to_event(result)
+                event = convert(result)
                 if event:
-                    self.event_queue.append(event)
+                    enqueue(event)
         
         # Return first event if available
         if self.event_queue:
-            return self.event_queue.pop(0)
+            return self.event_queue.popleft()
         
         return None
     
     def _to_coalesceable(self, event: Any) -> Optional[Any]:
         """Convert event to coalesceable type if possible."""
-        # Check if it's a parsed key event
-        if hasattr(event, 'key'):
-            return KeyEvent(
-                key=event.key,
-                ctrl=getattr(event, 'ctrl', False),
-                alt=getattr(event, 'alt', False),
-                shift=getattr(event, 'shift', False),
-                timestamp=time.time()
-            )
-        
-        # Check if it's a mouse event
-        elif hasattr(event, 'x') and hasattr(event, 'y'):
-            if getattr(event, 'action', '') == 'move':
-                return MouseMoveEvent(
-                    x=event.x,
-                    y=event.y,
-                    timestamp=time.time()
-                )
-        
-        # Not coalesceable
-        return None
+        converter = _COALESCE_CONVERTERS.get(type(event))
+        if converter is None:
+            # Not coalesceable
+            return None
+        return converter(event, self._read_ts or now_ns())
     
     def flush_events(self) -> List[Any]:
         """
@@ -220,8 +276,7 @@ class ImprovedANSIInput(BaseANSIInput):
         }
         
         if self.coalescer:
-            coalesce_stats = self.coalescer.get_stats()
-            stats.update(coalesce_stats)
+            stats.update(self.coalescer.get_stats())
         
         if self.error_recovery:
             stats['error_patterns'] = self.error_recovery.detect_error_patterns()
@@ -3,10 +3,28 @@
 Abstract base class for input backends.
 """
 
+import selectors
 from abc import ABC, abstractmethod
 from typing import Optional, List
 
 
+def create_read_selector(fd: int) -> selectors.BaseSelector:
+    """
+    Create a selector watching ``fd`` for input.
+    
+    Uses the platform's best selector (epoll on Linux), falling back to
+    select() for descriptors it can't watch, such as regular files.
+    """
+    selector = selectors.DefaultSelector()
+    try:
+        selector.register(fd, selectors.EVENT_READ)
+    except (OSError, ValueError):
+        selector.close()
+        selector = selectors.SelectSelector()
+        selector.register(fd, selectors.EVENT_READ)
+    return selector
+
+
 class InputHandler(ABC):
     """Abstract base class for input handlers."""
     
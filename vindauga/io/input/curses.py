@@ -7,14 +7,20 @@ which offers a portable interface across different Unix-like systems.
 """
 
 import curses
-from typing import Optional, List, Dict
+import sys
+from collections import deque
+from typing import Optional, List, Dict, Deque
 from dataclasses import dataclass
-from .base import InputHandler
+from .base import InputHandler, create_read_selector
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CursesKeyEvent:
-    """Represents a curses keyboard event."""
+    """
+    Represents a curses keyboard event.
+    
+    ASCII key events are shared between keystrokes, so they are immutable.
+    """
     key: str
     code: int
     ctrl: bool = False
@@ -22,7 +28,7 @@ class CursesKeyEvent:
     shift: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CursesMouseEvent:
     """Represents a curses mouse event."""
     x: int
@@ -48,8 +54,10 @@ class CursesInput(InputHandler):
         """
         super().__init__()
         self.stdscr = stdscr
-        self.event_queue = []
+        self._selector = None
+        self.event_queue: Deque[object] = deque()
         self.key_map = self._build_key_map()
+        self._ascii_events = self._build_ascii_events()
         self._last_mouse_state = 0
         
     def _build_key_map(self) -> Dict[int, str]:
@@ -86,6 +94,22 @@ class CursesInput(InputHandler):
             curses.KEY_F12: 'F12',
         }
     
+    def _build_ascii_events(self) -> tuple:
+        """
+        Build the shared key event for each ASCII code, or None if unmapped.
+        
+        _process_key_event answers codes below 128 from this table.
+        """
+        events = [None] * 128
+        for ch in range(1, 27):  # Ctrl+A through Ctrl+Z
+            events[ch] = CursesKeyEvent(chr(ch + 64), ch, ctrl=True)
+        for ch in range(32, 127):  # Printable characters
+            events[ch] = CursesKeyEvent(chr(ch), ch)
+        for ch, key_name in self.key_map.items():
+            if 0 <= ch < 128:
+                events[ch] = CursesKeyEvent(key_name, ch)
+        return tuple(events)
+    
     def initialize(self) -> bool:
         """Initialize input handler."""
         if self._initialized:
@@ -109,10 +133,16 @@ class CursesInput(InputHandler):
                 )
                 self._mouse_enabled = True
             
+            # Watch the terminal so has_events can poll without getch/ungetch
+            try:
+                self._selector = create_read_selector(sys.stdin.fileno())
+            except (OSError, ValueError):
+                self._selector = None
+            
             self._initialized = True
             return True
             
-        except:
+        except curses.error:
             return False
     
     def shutdown(self) -> None:
@@ -129,9 +159,13 @@ class CursesInput(InputHandler):
             if self._mouse_enabled:
                 curses.mousemask(0)
                 
-        except:
+        except curses.error:
             pass
         
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        
         self._initialized = False
     
     def get_event(self, timeout: float = 0.0) -> Optional[object]:
@@ -144,27 +178,28 @@ class CursesInput(InputHandler):
         Returns:
             Event object or None
         """
-        if not self._initialized or not self.stdscr:
+        stdscr = self.stdscr
+        if not self._initialized or not stdscr:
             return None
         
         # Check queued events first
         if self.event_queue:
-            return self.event_queue.pop(0)
+            return self.event_queue.popleft()
         
         # Set timeout mode
         if timeout < 0:
             # Blocking
-            self.stdscr.timeout(-1)
+            stdscr.timeout(-1)
         elif timeout == 0:
             # Non-blocking
-            self.stdscr.nodelay(True)
+            stdscr.nodelay(True)
         else:
             # Timed wait (convert to milliseconds)
-            self.stdscr.timeout(int(timeout * 1000))
+            stdscr.timeout(int(timeout * 1000))
         
         try:
             # Get input from curses
-            ch = self.stdscr.getch()
+            ch = stdscr.getch()
             
             # Check for no input
             if ch == -1:
@@ -177,52 +212,30 @@ class CursesInput(InputHandler):
             # Process keyboard event
             return self._process_key_event(ch)
             
-        except:
+        except curses.error:
             return None
         finally:
             # Reset to blocking mode
-            self.stdscr.nodelay(False)
-            self.stdscr.timeout(-1)
+            stdscr.nodelay(False)
+            stdscr.timeout(-1)
     
     def _process_key_event(self, ch: int) -> Optional[CursesKeyEvent]:
         """Process a keyboard event."""
+        # ASCII, including Tab, Enter and Escape, comes straight from the table
+        if 0 <= ch < 128:
+            return self._ascii_events[ch]
+        
         # Check for special keys
         if ch in self.key_map:
             return CursesKeyEvent(self.key_map[ch], ch)
         
-        # Check for control characters
-        if 0 < ch < 27:
-            # Ctrl+A through Ctrl+Z
-            return CursesKeyEvent(chr(ch + 64), ch, ctrl=True)
-        
-        # Check for Alt combinations (ESC followed by key)
-        if ch == 27:  # ESC
-            # Try to get next character quickly
-            self.stdscr.timeout(50)  # 50ms timeout
-            next_ch = self.stdscr.getch()
-            self.stdscr.timeout(-1)  # Reset timeout
-            
-            if next_ch == -1:
-                # Just ESC
-                return CursesKeyEvent('Escape', 27)
-            else:
-                # Alt+key
-                if next_ch in self.key_map:
-                    return CursesKeyEvent(self.key_map[next_ch], next_ch, alt=True)
-                elif 32 <= next_ch < 127:
-                    return CursesKeyEvent(chr(next_ch), next_ch, alt=True)
-        
-        # Regular printable character
-        if 32 <= ch < 127:
-            return CursesKeyEvent(chr(ch), ch)
-        
         # Extended ASCII or Unicode
         if ch >= 128:
             try:
                 # Try to decode as UTF-8
                 char = chr(ch)
                 return CursesKeyEvent(char, ch)
-            except:
+            except (ValueError, OverflowError):
                 pass
         
         # Unknown key
@@ -275,7 +288,7 @@ class CursesInput(InputHandler):
             
             return CursesMouseEvent(x, y, button, action)
             
-        except:
+        except curses.error:
             return None
     
     def has_events(self) -> bool:
@@ -283,6 +296,10 @@ class CursesInput(InputHandler):
         if self.event_queue:
             return True
         
+        if self._selector is not None:
+            # Curses reads from the same terminal
+            return bool(self._selector.select(0))
+        
         if self.stdscr:
             # Check for input without blocking
             self.stdscr.nodelay(True)
@@ -313,14 +330,14 @@ class CursesInput(InputHandler):
             self._mouse_enabled = enable
             return True
             
-        except:
+        except curses.error:
             return False
     
     def supports_mouse(self) -> bool:
         """Check if mouse is supported."""
         try:
             return curses.has_mouse()
-        except:
+        except curses.error:
             return False
     
     def flush_input(self) -> None:
@@ -337,7 +354,7 @@ class CursesInput(InputHandler):
         
         # Get queued events
         while self.event_queue and len(events) < max_count:
-            events.append(self.event_queue.pop(0))
+            events.append(self.event_queue.popleft())
         
         # Get more events
         while len(events) < max_count:
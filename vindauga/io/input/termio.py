@@ -6,32 +6,56 @@ This module provides high-performance input handling using direct
 termios control for Unix-like systems.
 """
 
+import array
+import io
 import sys
 import os
-import select
 import fcntl
 import termios
-from typing import Optional, List
-from .base import InputHandler
+from collections import deque
+from typing import Optional, List, Deque
+from .base import InputHandler, create_read_selector
 from .ansi import ANSIEscapeParser, ParsedKey, ParsedMouse
 
+# Upper bound on the single read flush_input uses to discard pending input
+FLUSH_READ_LIMIT = 1 << 20
+
+# How long get_event waits for the rest of an escape sequence split across
+# reads, in steps of ESCAPE_WAIT_STEP seconds (5ms at most)
+ESCAPE_WAIT_STEP = 0.0005
+ESCAPE_WAIT_STEPS = 10
+
 
 class TermIOInput(InputHandler):
     """
     TermIO input handler for Unix/Linux.
     
-    Uses select() for efficient non-blocking I/O and provides
-    high-performance event processing with minimal latency.
+    Waits on a persistent selector and reads straight into a preallocated
+    buffer, providing high-performance event processing with minimal
+    latency.
     """
     
-    def __init__(self):
-        """Initialize TermIO input handler."""
+    def __init__(self, eager_read: bool = False, enable_motion_coalescing: bool = True):
+        """
+        Initialize TermIO input handler.
+        
+        Args:
+            eager_read: If True, try reading before waiting on the selector,
+                saving the wait syscall while input streams in continuously
+                at the cost of one failed read whenever stdin is idle
+            enable_motion_coalescing: If True, consecutive mouse moves within
+                a read are collapsed to the last one before being parsed
+        """
         super().__init__()
         self.stdin_fd = None
+        self.eager_read = eager_read
+        self.enable_motion_coalescing = enable_motion_coalescing
+        self._selector = None
+        self._stdin_file = None
         self.parser = ANSIEscapeParser()
         self.input_buffer = bytearray(4096)
-        self.event_queue = []
-        self.partial_sequence = bytearray()
+        self._input_view = memoryview(self.input_buffer)
+        self.event_queue: Deque[object] = deque()
         
     def initialize(self) -> bool:
         """Initialize input handler."""
@@ -53,10 +77,14 @@ class TermIOInput(InputHandler):
             flags = fcntl.fcntl(self.stdin_fd, fcntl.F_GETFL)
             fcntl.fcntl(self.stdin_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
             
+            self._selector = create_read_selector(self.stdin_fd)
+            # Unbuffered view of stdin that reads straight into input_buffer
+            self._stdin_file = io.FileIO(self.stdin_fd, 'rb', closefd=False)
+            
             self._initialized = True
             return True
             
-        except:
+        except (OSError, ValueError):
             return False
     
     def shutdown(self) -> None:
@@ -69,17 +97,27 @@ class TermIOInput(InputHandler):
             if self.stdin_fd is not None:
                 flags = fcntl.fcntl(self.stdin_fd, fcntl.F_GETFL)
                 fcntl.fcntl(self.stdin_fd, fcntl.F_SETFL, flags & ~os.O_NONBLOCK)
-        except:
+        except OSError:
             pass
         
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+        if self._stdin_file is not None:
+            self._stdin_file.close()
+            self._stdin_file = None
+        
         self._initialized = False
     
     def get_event(self, timeout: float = 0.0) -> Optional[object]:
         """
         Get next event with optional timeout.
         
-        Uses select() for efficient waiting and handles partial
-        escape sequences across reads.
+        Reads into the preallocated input buffer and queues every event in
+        the read. The parser keeps the state of an escape sequence split
+        across reads, so no bytes are copied aside between calls; when a read
+        ends mid-sequence, the rest is waited for briefly (at most
+        ESCAPE_WAIT_STEPS * ESCAPE_WAIT_STEP seconds).
         
         Args:
             timeout: Timeout in seconds (0 = non-blocking, -1 = blocking)
@@ -91,70 +129,61 @@ class TermIOInput(InputHandler):
             return None
         
         # Check queued events first
-        if self.event_queue:
-            return self.event_queue.pop(0)
-        
-        # Process any partial sequence first
-        if self.partial_sequence:
-            for byte in self.partial_sequence:
-                result = self.parser.parse_byte(byte)
-                if result:
-                    self.partial_sequence.clear()
-                    return result
-            # If we still have partial sequence, continue reading
-        
-        # Wait for input using select
-        if timeout < 0:
-            # Blocking wait
-            ready, _, _ = select.select([self.stdin_fd], [], [])
-        elif timeout == 0:
-            # Non-blocking check
-            ready, _, _ = select.select([self.stdin_fd], [], [], 0)
-        else:
-            # Timed wait
-            ready, _, _ = select.select([self.stdin_fd], [], [], timeout)
-        
-        if not ready:
-            return None
-        
-        # Read available input
-        try:
-            # Use larger buffer for better performance
-            nbytes = os.readv(self.stdin_fd, [self.input_buffer])
-            if nbytes <= 0:
+        queue = self.event_queue
+        if queue:
+            return queue.popleft()
+        
+        # Read available input, waiting on the persistent selector if needed
+        read_input = self._read_input
+        nbytes = read_input() if self.eager_read else 0
+        if not nbytes:
+            if not self._selector.select(None if timeout < 0 else timeout):
                 return None
-            
-            # Process bytes through parser
-            for i in range(nbytes):
-                byte = self.input_buffer[i]
-                result = self.parser.parse_byte(byte)
-                if result:
-                    # Save remaining bytes as partial sequence
-                    if i + 1 < nbytes:
-                        self.partial_sequence = bytearray(self.input_buffer[i+1:nbytes])
-                    return result
-            
-            # All bytes processed but no complete sequence
-            # This might be a partial escape sequence
-            self.partial_sequence.extend(self.input_buffer[:nbytes])
-            
-        except (OSError, IOError):
-            return None
+            nbytes = read_input()
+            if not nbytes:
+                return None
+        
+        # Parse the whole read, plain key runs and CSI sequences in bulk
+        parser = self.parser
+        coalescing = self.enable_motion_coalescing
+        queue.extend(parser.feed(self._input_view[:nbytes], coalescing))
+        
+        # If the read ended inside an escape sequence, give the rest of it a
+        # moment to arrive so it is delivered by this call
+        waits = ESCAPE_WAIT_STEPS
+        while parser.in_sequence and waits:
+            waits -= 1
+            if self._selector.select(ESCAPE_WAIT_STEP):
+                nbytes = read_input()
+                if nbytes:
+                    queue.extend(parser.feed(self._input_view[:nbytes], coalescing))
+        
+        if queue:
+            return queue.popleft()
         
         return None
     
+    def _read_input(self) -> int:
+        """
+        Read pending stdin into the input buffer without blocking.
+        
+        Returns:
+            Number of bytes read, 0 if none were available
+        """
+        try:
+            # readinto returns None when the read would block
+            return self._stdin_file.readinto(self.input_buffer) or 0
+        except (OSError, IOError):
+            return 0
+    
     def has_events(self) -> bool:
         """Check if events are available."""
         if self.event_queue:
             return True
         
-        if self.partial_sequence:
-            return True
-        
-        # Use select with 0 timeout to check for available input
-        if self.stdin_fd:
-            ready, _, _ = select.select([self.stdin_fd], [], [], 0)
-            return bool(ready)
+        # Check for available input without waiting
+        if self._selector is not None:
+            return bool(self._selector.select(0))
         
         return False
     
@@ -173,31 +202,28 @@ class TermIOInput(InputHandler):
     def flush_input(self) -> None:
         """Flush input buffer."""
         self.event_queue.clear()
-        self.partial_sequence.clear()
         self.parser.reset()
         
-        # Drain stdin
-        if self.stdin_fd:
-            try:
-                # Set to non-blocking temporarily
-                flags = fcntl.fcntl(self.stdin_fd, fcntl.F_GETFL)
-                fcntl.fcntl(self.stdin_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
-                
-                # Read and discard all available input
-                while True:
-                    ready, _, _ = select.select([self.stdin_fd], [], [], 0)
-                    if not ready:
-                        break
-                    try:
-                        os.read(self.stdin_fd, 4096)
-                    except:
-                        break
-                
-                # Restore original flags
-                fcntl.fcntl(self.stdin_fd, fcntl.F_SETFL, flags)
-                
-            except:
-                pass
+        if self._selector is None:
+            return
+        
+        # Discard all available input in one read sized by FIONREAD
+        try:
+            pending = array.array('i', [0])
+            fcntl.ioctl(self.stdin_fd, termios.FIONREAD, pending, True)
+            if pending[0] > 0:
+                os.read(self.stdin_fd, min(pending[0], FLUSH_READ_LIMIT))
+            return
+        except OSError:
+            pass
+        
+        # Otherwise read and discard until stdin is empty
+        try:
+            while self._selector.select(0):
+                if not self._read_input():
+                    break
+        except (OSError, ValueError):
+            pass
     
     def get_events(self, max_count: int = 10) -> List[object]:
         """
@@ -210,7 +236,7 @@ class TermIOInput(InputHandler):
         
         # First get any queued events
         while self.event_queue and len(events) < max_count:
-            events.append(self.event_queue.pop(0))
+            events.append(self.event_queue.popleft())
         
         # Then try to read more
         while len(events) < max_count:
@@ -6,32 +6,11 @@ Detects available terminal I/O platforms and selects the best one based on
 capabilities and performance characteristics.
 """
 
-import os
 import sys
-import platform
-from enum import Enum
+from types import MappingProxyType
 from typing import Optional, Dict, List, Any
-
-
-class PlatformType(Enum):
-    """Available I/O platform types."""
-    ANSI = 'ansi'
-    TERMIO = 'termio'
-    CURSES = 'curses'
-    WIN32 = 'win32'
-    
-    @classmethod
-    def from_string(cls, value: str) -> 'PlatformType':
-        """Convert string to PlatformType."""
-        value = value.lower()
-        for platform_type in cls:
-            if platform_type.value == value:
-                return platform_type
-        raise ValueError(f"Unknown platform type: {value}")
-    
-    def __str__(self) -> str:
-        """Return string representation."""
-        return self.value
+from . import platform_detector
+from .platform_detector import PlatformType
 
 
 class PlatformCapabilities:
@@ -52,6 +31,17 @@ class PlatformCapabilities:
         self.max_colors = max_colors
         self.is_available = is_available
     
+    @classmethod
+    def from_detected(cls, detected: platform_detector.PlatformCapabilities) -> 'PlatformCapabilities':
+        """Convert capabilities found by platform_detector.PlatformDetector."""
+        colors = detected.color_support
+        return cls(has_colors=colors > 0,
+                   has_mouse=detected.mouse_support,
+                   has_unicode=detected.unicode_support,
+                   has_24bit_color=colors >= 16777216,
+                   max_colors=colors,
+                   is_available=detected.available)
+    
     def score(self) -> int:
         """Calculate capability score for platform selection."""
         if not self.is_available:
@@ -78,134 +68,60 @@ class PlatformCapabilities:
         return score
 
 
-class PlatformDetector:
-    """Detect available I/O platforms and their capabilities."""
+class PlatformDetector(platform_detector.PlatformDetector):
+    """
+    Detect available I/O platforms and their capabilities.
+    
+    Detection itself is done by platform_detector.PlatformDetector; this
+    class presents its results as PlatformCapabilities with score(),
+    caching them per platform.
+    """
     
     def __init__(self):
         """Initialize platform detector."""
+        super().__init__()
         self._capabilities_cache: Dict[PlatformType, PlatformCapabilities] = {}
     
+    def invalidate_caches(self) -> None:
+        """Forget detection results and re-read the environment."""
+        super().invalidate_caches()
+        self._capabilities_cache.clear()
+    
+    def detect_ansi_capabilities(self) -> platform_detector.PlatformCapabilities:
+        """
+        Detect ANSI capabilities, keeping this detector's stricter rules: an
+        unset TERM rules ANSI out, and an unknown terminal gets no colors.
+        """
+        if not self.term:
+            return platform_detector.PlatformCapabilities(name="ANSI")
+        caps = super().detect_ansi_capabilities()
+        if caps.available:
+            caps.color_support = self._term_colors
+        return caps
+    
+    def _get_capabilities(self, platform_type: PlatformType, detect) -> PlatformCapabilities:
+        """Return cached capabilities, converting detect() results on first use."""
+        caps = self._capabilities_cache.get(platform_type)
+        if caps is None:
+            caps = PlatformCapabilities.from_detected(detect())
+            self._capabilities_cache[platform_type] = caps
+        return caps
+    
     def get_ansi_capabilities(self) -> PlatformCapabilities:
         """Detect ANSI terminal capabilities."""
-        if PlatformType.ANSI in self._capabilities_cache:
-            return self._capabilities_cache[PlatformType.ANSI]
-        
-        caps = PlatformCapabilities()
-        
-        # Check if we're in a terminal
-        if not hasattr(sys.stdout, 'isatty') or not sys.stdout.isatty():
-            caps.is_available = False
-            self._capabilities_cache[PlatformType.ANSI] = caps
-            return caps
-        
-        # Check terminal type
-        term = os.environ.get('TERM', '')
-        if term in ['dumb', '']:
-            caps.is_available = False
-            self._capabilities_cache[PlatformType.ANSI] = caps
-            return caps
-        
-        caps.is_available = True
-        caps.has_unicode = True
-        caps.has_mouse = True
-        
-        # Check color support
-        colorterm = os.environ.get('COLORTERM', '')
-        if colorterm in ['truecolor', '24bit']:
-            caps.has_24bit_color = True
-            caps.has_colors = True
-            caps.max_colors = 16777216
-        elif '256color' in term:
-            caps.has_colors = True
-            caps.max_colors = 256
-        elif term in ['xterm', 'screen', 'vt100', 'linux']:
-            caps.has_colors = True
-            caps.max_colors = 16
-        
-        self._capabilities_cache[PlatformType.ANSI] = caps
-        return caps
+        return self._get_capabilities(PlatformType.ANSI, self.detect_ansi_capabilities)
     
     def get_termio_capabilities(self) -> PlatformCapabilities:
         """Detect TermIO capabilities."""
-        if PlatformType.TERMIO in self._capabilities_cache:
-            return self._capabilities_cache[PlatformType.TERMIO]
-        
-        caps = PlatformCapabilities()
-        
-        # TermIO is Linux/Unix specific
-        if platform.system() == 'Windows':
-            caps.is_available = False
-            self._capabilities_cache[PlatformType.TERMIO] = caps
-            return caps
-        
-        # Try to import termios
-        try:
-            import termios
-            import tty
-            import fcntl
-            
-            # Check if stdin is a terminal
-            if hasattr(sys.stdin, 'fileno'):
-                termios.tcgetattr(sys.stdin.fileno())
-                caps.is_available = True
-        except (ImportError, OSError, ValueError):
-            caps.is_available = False
-            self._capabilities_cache[PlatformType.TERMIO] = caps
-            return caps
-        
-        if caps.is_available:
-            caps.has_unicode = True
-            caps.has_mouse = True
-            
-            # Check color support from TERM
-            term = os.environ.get('TERM', '')
-            colorterm = os.environ.get('COLORTERM', '')
-            
-            if colorterm in ['truecolor', '24bit']:
-                caps.has_24bit_color = True
-                caps.has_colors = True
-                caps.max_colors = 16777216
-            elif '256color' in term:
-                caps.has_colors = True
-                caps.max_colors = 256
-            elif term not in ['dumb', '']:
-                caps.has_colors = True
-                caps.max_colors = 16
-        
-        self._capabilities_cache[PlatformType.TERMIO] = caps
-        return caps
+        return self._get_capabilities(PlatformType.TERMIO, self.detect_termio_capabilities)
     
     def get_curses_capabilities(self) -> PlatformCapabilities:
         """Detect Curses capabilities."""
-        if PlatformType.CURSES in self._capabilities_cache:
-            return self._capabilities_cache[PlatformType.CURSES]
-        
-        caps = PlatformCapabilities()
-        
-        # Try to import curses
-        try:
-            import curses
-            caps.is_available = True
-            caps.has_colors = True
-            caps.has_mouse = True
-            caps.has_unicode = True
-            caps.max_colors = 256  # Typical curses limitation
-        except ImportError:
-            caps.is_available = False
-        
-        self._capabilities_cache[PlatformType.CURSES] = caps
-        return caps
+        return self._get_capabilities(PlatformType.CURSES, self.detect_curses_capabilities)
     
     def get_win32_capabilities(self) -> PlatformCapabilities:
         """Detect Win32 console capabilities."""
-        if PlatformType.WIN32 in self._capabilities_cache:
-            return self._capabilities_cache[PlatformType.WIN32]
-        
-        caps = PlatformCapabilities()
-        caps.is_available = False  # Not implemented yet
-        
-        self._capabilities_cache[PlatformType.WIN32] = caps
-        return caps
+        return self._get_capabilities(PlatformType.WIN32, self.detect_win32_capabilities)
     
     def get_platform_capabilities(self, platform_type: PlatformType) -> PlatformCapabilities:
         """Get capabilities for a specific platform type."""
@@ -217,6 +133,9 @@ class PlatformDetector:
             return self.get_curses_capabilities()
         elif platform_type == PlatformType.WIN32:
             return self.get_win32_capabilities()
+        elif platform_type == PlatformType.DUMMY:
+            # The dummy backend is never selected automatically
+            return PlatformCapabilities()
         else:
             raise ValueError(f"Unknown platform type: {platform_type}")
     
@@ -229,13 +148,13 @@ class PlatformDetector:
             (PlatformType.WIN32, self.get_win32_capabilities())
         ]
         
-        # Filter available platforms and sort by score
+        # Filter available platforms
         available = [(p, c) for p, c in platforms if c.is_available]
         if not available:
             raise RuntimeError("No terminal I/O platform available")
         
-        available.sort(key=lambda x: x[1].score(), reverse=True)
-        return available[0][0]
+        # Highest score, the earliest platform winning ties
+        return max(available, key=lambda x: x[1].score())[0]
     
     def list_available_platforms(self) -> List[PlatformType]:
         """List all available platforms."""
@@ -247,18 +166,19 @@ class PlatformDetector:
         return available
     
     def get_platform_info(self) -> Dict[str, Any]:
-        """Get detailed platform information."""
-        info = {
-            'system': platform.system(),
-            'python_version': sys.version,
-            'terminal': os.environ.get('TERM', 'unknown'),
-            'colorterm': os.environ.get('COLORTERM', 'unknown'),
-            'platforms': {}
-        }
+        """
+        Get detailed platform information.
         
+        Built once until invalidate_caches; the per-platform entries are
+        shared read-only mappings and the returned dict is a copy.
+        """
+        if self._platform_info is not None:
+            return dict(self._platform_info)
+        
+        platforms = {}
         for platform_type in PlatformType:
             caps = self.get_platform_capabilities(platform_type)
-            info['platforms'][platform_type.value] = {
+            platforms[platform_type.value] = MappingProxyType({
                 'available': caps.is_available,
                 'score': caps.score(),
                 'has_colors': caps.has_colors,
@@ -266,50 +186,101 @@ class PlatformDetector:
                 'has_unicode': caps.has_unicode,
                 'has_24bit_color': caps.has_24bit_color,
                 'max_colors': caps.max_colors
-            }
+            })
         
-        return info
+        self._platform_info = {
+            'system': self.system,
+            'python_version': sys.version,
+            'terminal': self.term or 'unknown',
+            'colorterm': self.colorterm or 'unknown',
+            'platforms': MappingProxyType(platforms)
+        }
+        return dict(self._platform_info)
+
+
+def _ansi_backends():
+    """Import the ANSI display and input classes."""
+    from .display.ansi import ANSIDisplay
+    from .input.ansi import ANSIInput
+    return ANSIDisplay, ANSIInput
+
+
+def _termio_backends():
+    """Import the TermIO display and input classes."""
+    from .display.termio import TermIODisplay
+    from .input.termio import TermIOInput
+    return TermIODisplay, TermIOInput
+
+
+def _curses_backends():
+    """Import the Curses display and input classes."""
+    from .display.curses import CursesDisplay
+    from .input.curses import CursesInput
+    return CursesDisplay, CursesInput
+
+
+# Platform type -> function importing its (display, input) classes
+_BACKEND_LOADERS = {
+    PlatformType.ANSI: _ansi_backends,
+    PlatformType.TERMIO: _termio_backends,
+    PlatformType.CURSES: _curses_backends,
+}
 
 
 class PlatformIO:
-    """Platform I/O system combining display and input handlers."""
+    """
+    Platform I/O system combining display and input handlers.
+    
+    Systems made by create() import and construct their backends on first
+    access to display or input, keeping the backend modules off the
+    startup path.
+    """
     
     def __init__(self, display, input_handler, platform_type: PlatformType):
         """Initialize platform I/O system."""
-        self.display = display
-        self.input = input_handler
+        self._display = display
+        self._input = input_handler
+        self._backend_loader = None
         self.platform_type = platform_type
         self._initialized = False
     
+    @property
+    def display(self):
+        """Display backend, created on first access."""
+        if self._display is None and self._backend_loader is not None:
+            self._display = self._backend_loader()[0]()
+        return self._display
+    
+    @display.setter
+    def display(self, display):
+        self._display = display
+    
+    @property
+    def input(self):
+        """Input handler, created on first access."""
+        if self._input is None and self._backend_loader is not None:
+            self._input = self._backend_loader()[1]()
+        return self._input
+    
+    @input.setter
+    def input(self, input_handler):
+        self._input = input_handler
+    
     @classmethod
     def create(cls, platform_name: Optional[str] = None) -> 'PlatformIO':
-        """Create platform I/O system."""
+        """Create platform I/O system, deferring backend imports until use."""
         if platform_name:
             platform_type = PlatformType.from_string(platform_name)
         else:
             detector = PlatformDetector()
             platform_type = detector.detect_best_platform()
         
-        # Import and create appropriate backends
-        if platform_type == PlatformType.ANSI:
-            from .display.ansi import ANSIDisplay
-            from .input.ansi import ANSIInput
-            display = ANSIDisplay()
-            input_handler = ANSIInput()
-        elif platform_type == PlatformType.TERMIO:
-            from .display.termio import TermIODisplay
-            from .input.termio import TermIOInput
-            display = TermIODisplay()
-            input_handler = TermIOInput()
-        elif platform_type == PlatformType.CURSES:
-            from .display.curses import CursesDisplay
-            from .input.curses import CursesInput
-            display = CursesDisplay()
-            input_handler = CursesInput()
-        else:
+        if platform_type not in _BACKEND_LOADERS:
             raise ValueError(f"Unsupported platform: {platform_type}")
         
-        return cls(display, input_handler, platform_type)
+        io_system = cls(None, None, platform_type)
+        io_system._backend_loader = _BACKEND_LOADERS[platform_type]
+        return io_system
     
     def initialize(self) -> bool:
         """Initialize the I/O system."""
@@ -331,10 +302,11 @@ class PlatformIO:
     
     def shutdown(self) -> None:
         """Shutdown the I/O system."""
-        if self.display:
-            self.display.shutdown()
-        if self.input:
-            self.input.shutdown()
+        # Backends that were never created need no shutdown
+        if self._display:
+            self._display.shutdown()
+        if self._input:
+            self._input.shutdown()
         self._initialized = False
     
     def __enter__(self):
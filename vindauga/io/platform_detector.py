@@ -6,21 +6,101 @@ This module provides platform detection capabilities to automatically
 select the best available terminal I/O backend for the current environment.
 """
 
+import json
 import os
+import re
 import sys
 import platform
-from enum import Enum, auto
+from enum import Enum
+from types import MappingProxyType
 from typing import Dict, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict, replace
 
+# Imported once here so detection only has to check for None
+try:
+    import termios
+except ImportError:
+    termios = None
 
-class PlatformType(Enum):
-    """Available platform backend types."""
-    ANSI = auto()      # ANSI escape sequences (most modern terminals)
-    TERMIO = auto()    # Linux/Unix terminal I/O
-    CURSES = auto()    # NCurses library
-    WIN32 = auto()     # Windows Console API
-    DUMMY = auto()     # Dummy backend for testing
+try:
+    import curses
+except ImportError:
+    curses = None
+
+# Standard descriptors checked for a terminal
+STDIN_FILENO = 0
+STDOUT_FILENO = 1
+
+# Default location for the detection results cache, see PlatformDetector
+PLATFORM_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'vindauga', 'platform.json')
+
+# Bumped whenever detection logic changes, invalidating cached results
+_CACHE_VERSION = 3
+
+# Colour depth advertised through COLORTERM
+_COLORTERM_DEPTH = {'truecolor': 16777216, '24bit': 16777216}
+
+# TERM values known to support 16 colours
+_BASIC_TERMS = frozenset(('xterm', 'screen', 'vt100', 'linux', 'ansi'))
+
+# ANSI performance score by terminal name, found in TERM or TERM_PROGRAM.
+# Scores fall with precedence, so the best match is the highest score
+_TERM_SCORES = {'kitty': 95, 'alacritty': 90, 'iterm': 85, 'xterm': 75}
+_TERM_NAMES = re.compile('kitty|alacritty|xterm')
+_TERM_PROGRAM_NAMES = re.compile('kitty|alacritty|iterm')
+_DEFAULT_ANSI_SCORE = 70
+
+
+def _classify_term(term: str, colorterm: str, term_program: str) -> tuple:
+    """
+    Classify a terminal from its environment variables.
+    
+    Returns:
+        (advertised colour depth or 0 if unknown, ANSI performance score)
+    """
+    colors = _COLORTERM_DEPTH.get(colorterm)
+    if colors is None:
+        if '256color' in term:
+            colors = 256
+        elif term in _BASIC_TERMS:
+            colors = 16
+        else:
+            colors = 0
+    
+    names = _TERM_NAMES.findall(term) + _TERM_PROGRAM_NAMES.findall(term_program.lower())
+    score = max((_TERM_SCORES[name] for name in names), default=_DEFAULT_ANSI_SCORE)
+    return colors, score
+
+
+class PlatformType(str, Enum):
+    """
+    Available platform backend types.
+    
+    Members are their lowercase names as strings, so they compare equal to
+    those names and serve directly as JSON or dict keys.
+    """
+    ANSI = 'ansi'      # ANSI escape sequences (most modern terminals)
+    TERMIO = 'termio'  # Linux/Unix terminal I/O
+    CURSES = 'curses'  # NCurses library
+    WIN32 = 'win32'    # Windows Console API
+    DUMMY = 'dummy'    # Dummy backend for testing
+    
+    @classmethod
+    def from_string(cls, value: str) -> 'PlatformType':
+        """Convert string to PlatformType."""
+        value = value.lower()
+        try:
+            return _STRING_TO_TYPE[value]
+        except KeyError:
+            raise ValueError(f"Unknown platform type: {value}") from None
+    
+    def __str__(self) -> str:
+        """Return string representation."""
+        return self.value
+
+
+# Lowercase platform name -> PlatformType, for from_string
+_STRING_TO_TYPE = {platform_type.value: platform_type for platform_type in PlatformType}
 
 
 @dataclass
@@ -80,21 +160,104 @@ class PlatformDetector:
     terminal I/O backends are available and their capabilities.
     """
     
-    def __init__(self):
-        """Initialize the platform detector."""
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Initialize the platform detector.
+        
+        Args:
+            cache_path: If given, detect_all results are saved to this JSON
+                file and reused by later processes with the same terminal
+                environment, skipping live detection. Setting the
+                VINDAUGA_REFRESH_PLATFORM environment variable to 1 forces
+                redetection. PLATFORM_CACHE_PATH is the usual location.
+        """
+        self._read_environment()
+        
+        # Results of detect_all and get_platform_info, see invalidate_caches
+        self._platform_info: Optional[Dict[str, Any]] = None
+        self._scores: Optional[Dict[PlatformType, int]] = None
+        self.cache_path = cache_path
+        self._detected: Optional[Dict[PlatformType, PlatformCapabilities]] = None
+        if cache_path and os.environ.get('VINDAUGA_REFRESH_PLATFORM') != '1':
+            self._detected = self._load_cache()
+    
+    def _read_environment(self) -> None:
+        """Snapshot the system and terminal environment detection uses."""
         self.system = platform.system()
         self.is_windows = self.system == 'Windows'
         self.is_linux = self.system == 'Linux'
         self.is_mac = self.system == 'Darwin'
         self.is_unix = self.is_linux or self.is_mac
         
+        # (platform, name, probe method) in selection order; platforms that
+        # cannot exist on this OS have no probe and are never examined
+        self._probes = (
+            (PlatformType.ANSI, "ANSI", 'detect_ansi_capabilities'),
+            (PlatformType.TERMIO, "TermIO", 'detect_termio_capabilities' if self.is_unix else None),
+            (PlatformType.CURSES, "Curses", 'detect_curses_capabilities'),
+            (PlatformType.WIN32, "Win32", 'detect_win32_capabilities' if self.is_windows else None),
+        )
+        
         # Terminal environment
         self.term = os.environ.get('TERM', '')
         self.colorterm = os.environ.get('COLORTERM', '')
         self.term_program = os.environ.get('TERM_PROGRAM', '')
+        self._term_colors, self._term_score = _classify_term(self.term, self.colorterm,
+                                                             self.term_program)
         
-        # Check if we're in a real terminal
-        self.is_tty = hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
+        # Check if we're in a real terminal, straight from the standard
+        # descriptors; os.isatty reports False for closed or invalid ones
+        self.is_tty = os.isatty(STDOUT_FILENO)
+        self.stdin_is_tty = os.isatty(STDIN_FILENO)
+    
+    def invalidate_caches(self) -> None:
+        """
+        Forget detection results and re-read the environment.
+        
+        Call this when the terminal may have changed at runtime, e.g. after
+        setting os.environ['TERM'], or on SIGWINCH when a multiplexer
+        session is reattached from another terminal. The next detect_all
+        detects live, replacing any disk cache entry.
+        """
+        self._read_environment()
+        self._detected = None
+        self._platform_info = None
+        self._scores = None
+    
+    def _fingerprint(self) -> list:
+        """Describe the environment the detection results depend on."""
+        return [_CACHE_VERSION, self.system, self.term, self.colorterm, self.term_program,
+                self.is_tty, self.stdin_is_tty, sys.executable]
+    
+    def _load_cache(self) -> Optional[Dict[PlatformType, PlatformCapabilities]]:
+        """Load cached detection results if they match this environment."""
+        try:
+            with open(self.cache_path, 'rt', encoding='utf8') as cache_file:
+                cached = json.load(cache_file)
+            if cached['fingerprint'] != self._fingerprint():
+                return None
+            return {PlatformType(name): PlatformCapabilities(**caps)
+                    for name, caps in cached['platforms'].items()}
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+    
+    def _save_cache(self, detected: Dict[PlatformType, PlatformCapabilities]) -> None:
+        """Save detection results for later processes, ignoring failures."""
+        cached = {
+            'fingerprint': self._fingerprint(),
+            'platforms': {platform_type.value: asdict(caps) for platform_type, caps in detected.items()},
+        }
+        temp_path = f'{self.cache_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+            with open(temp_path, 'wt', encoding='utf8') as cache_file:
+                json.dump(cached, cache_file)
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
     
     def detect_ansi_capabilities(self) -> PlatformCapabilities:
         """
@@ -118,27 +281,11 @@ class PlatformDetector:
         caps.available = True
         caps.unicode_support = True
         caps.mouse_support = True
-        caps.performance_score = 70
-        
-        # Detect color support
-        if self.colorterm in ('truecolor', '24bit'):
-            caps.color_support = 16777216  # 24-bit
-        elif '256color' in self.term:
-            caps.color_support = 256
-        elif self.term in ('xterm', 'screen', 'vt100', 'linux', 'ansi'):
-            caps.color_support = 16
-        else:
-            caps.color_support = 8
-        
-        # Adjust performance score based on terminal type
-        if 'kitty' in self.term or self.term_program == 'kitty':
-            caps.performance_score = 95
-        elif 'alacritty' in self.term or self.term_program == 'alacritty':
-            caps.performance_score = 90
-        elif 'iterm' in self.term_program.lower():
-            caps.performance_score = 85
-        elif 'xterm' in self.term:
-            caps.performance_score = 75
+        
+        # Color support and performance from the terminal classification,
+        # assuming 8 colours when the terminal advertises nothing
+        caps.color_support = self._term_colors or 8
+        caps.performance_score = self._term_score
         
         return caps
     
@@ -155,37 +302,19 @@ class PlatformDetector:
         if not self.is_unix:
             return caps
         
-        # Check if we can import required modules
-        try:
-            import termios
-            import tty
-            import fcntl
-            caps.available = True
-        except ImportError:
-            return caps
-        
-        # Check if stdin is a terminal
-        if not hasattr(sys.stdin, 'fileno'):
-            caps.available = False
-            return caps
-        
-        try:
-            # Try to get terminal attributes
-            termios.tcgetattr(sys.stdin.fileno())
-        except:
-            caps.available = False
+        # Requires the termios modules and a terminal on stdin
+        if termios is None or not self.stdin_is_tty:
             return caps
         
+        caps.available = True
         # TermIO has similar capabilities to ANSI
         caps.unicode_support = True
         caps.mouse_support = True
         caps.performance_score = 80  # Generally faster than ANSI
         
-        # Color support same as ANSI
-        if self.colorterm in ('truecolor', '24bit'):
-            caps.color_support = 16777216
-        elif '256color' in self.term:
-            caps.color_support = 256
+        # Color support as for ANSI, any named terminal having 16 colours
+        if self._term_colors > 16:
+            caps.color_support = self._term_colors
         elif self.term not in ('', 'dumb'):
             caps.color_support = 16
         
@@ -200,13 +329,10 @@ class PlatformDetector:
         """
         caps = PlatformCapabilities(name="Curses")
         
-        # Try to import curses
-        try:
-            import curses
-            caps.available = True
-        except ImportError:
+        if curses is None:
             return caps
         
+        caps.available = True
         # Curses capabilities
         caps.unicode_support = True  # Modern curses supports Unicode
         caps.mouse_support = True
@@ -254,15 +380,29 @@ class PlatformDetector:
         """
         Detect capabilities of all platforms.
         
+        Results are computed once and reused until invalidate_caches; with
+        a cache_path they are also loaded from or saved to the disk cache.
+        Each call returns fresh copies, so callers may modify them freely.
+        
         Returns:
             Dictionary mapping platform types to their capabilities
         """
-        return {
-            PlatformType.ANSI: self.detect_ansi_capabilities(),
-            PlatformType.TERMIO: self.detect_termio_capabilities(),
-            PlatformType.CURSES: self.detect_curses_capabilities(),
-            PlatformType.WIN32: self.detect_win32_capabilities(),
-        }
+        if self._detected is None:
+            detected = {
+                platform_type: getattr(self, probe)() if probe else PlatformCapabilities(name=name)
+                for platform_type, name, probe in self._probes
+            }
+            if self.cache_path:
+                self._save_cache(detected)
+            self._detected = detected
+        return {platform_type: replace(caps) for platform_type, caps in self._detected.items()}
+    
+    def _platform_scores(self) -> Dict[PlatformType, int]:
+        """Return the overall score of every platform, computed once."""
+        if self._scores is None:
+            self._scores = {platform_type: caps.overall_score()
+                            for platform_type, caps in self.detect_all().items()}
+        return self._scores
     
     def select_best_platform(self) -> Optional[PlatformType]:
         """
@@ -272,44 +412,65 @@ class PlatformDetector:
             The PlatformType with the highest score, or None if none available
         """
         all_caps = self.detect_all()
+        scores = self._platform_scores()
         
-        # Filter to available platforms and sort by score
-        available = [
-            (platform_type, caps)
-            for platform_type, caps in all_caps.items()
-            if caps.available
-        ]
+        # Filter to available platforms
+        available = [platform_type for platform_type, caps in all_caps.items() if caps.available]
         
         if not available:
             return None
         
-        # Sort by overall score (highest first)
-        available.sort(key=lambda x: x[1].overall_score(), reverse=True)
-        
-        return available[0][0]
+        # Highest overall score, the earliest platform winning ties
+        return max(available, key=scores.__getitem__)
     
     def get_platform_info(self) -> Dict[str, Any]:
         """
         Get detailed information about the platform environment.
         
+        The information is built once and shared, so the per-platform
+        entries are read-only mappings; the returned dict itself is a copy.
+        
         Returns:
             Dictionary with platform information
         """
-        return {
+        if self._platform_info is not None:
+            return dict(self._platform_info)
+        
+        scores = self._platform_scores()
+        self._platform_info = {
             'system': self.system,
             'is_tty': self.is_tty,
             'term': self.term,
             'colorterm': self.colorterm,
             'term_program': self.term_program,
             'python_version': sys.version,
-            'platform_capabilities': {
-                platform_type.name: {
+            'platform_capabilities': MappingProxyType({
+                platform_type.value: MappingProxyType({
                     'available': caps.available,
-                    'score': caps.overall_score(),
+                    'score': scores[platform_type],
                     'colors': caps.color_support,
                     'mouse': caps.mouse_support,
                     'unicode': caps.unicode_support,
-                }
+                })
                 for platform_type, caps in self.detect_all().items()
-            }
-        }
\ No newline at end of file
+            })
+        }
+        return dict(self._platform_info)
+
+
+# Shared detector for callers that don't need their own
+_default_detector: Optional[PlatformDetector] = None
+
+
+def get_default_detector() -> PlatformDetector:
+    """Return the shared PlatformDetector, creating it on first use."""
+    global _default_detector
+    if _default_detector is None:
+        _default_detector = PlatformDetector()
+    return _default_detector
+
+
+def invalidate_caches() -> None:
+    """Make the shared detector re-read the environment and redetect."""
+    if _default_detector is not None:
+        _default_detector.invalidate_caches()
\ No newline at end of file
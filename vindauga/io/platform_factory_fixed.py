@@ -6,14 +6,15 @@ This version properly handles backend initialization failures and
 provides better fallback mechanisms.
 """
 
-import sys
+import curses
 import platform
+import termios
 from typing import Tuple, Optional
 from enum import Enum
 
 from .display.base import Display
 from .input.base import InputHandler
-from .platform_detector import PlatformDetector, PlatformType
+from .platform_detector import PlatformType, get_default_detector
 
 # Import display backends
 from .display.ansi import ANSIDisplay
@@ -25,6 +26,57 @@ from .input.ansi_improved import ImprovedANSIInput
 from .input.termio import TermIOInput
 from .input.curses import CursesInput
 
+# Platform type -> (display class, input handler factory)
+_BACKENDS = {
+    PlatformType.ANSI: (
+        ANSIDisplay,
+        lambda: ImprovedANSIInput(allow_ctrl_c=True,
+                                  enable_coalescing=True,
+                                  enable_error_recovery=True),
+    ),
+    PlatformType.TERMIO: (FixedTermIODisplay, TermIOInput),
+    PlatformType.CURSES: (CursesDisplay, lambda: CursesInput(None)),
+}
+
+# Errors a backend may raise while touching the terminal
+_BACKEND_ERRORS = (OSError, curses.error, termios.error)
+
+
+# Platforms to fall back on, in order, for each system
+_SYSTEM_FALLBACKS = {
+    # Prefer ANSI on macOS; TermIO might work with fixes, curses as last resort
+    'Darwin': (PlatformType.ANSI, PlatformType.TERMIO, PlatformType.CURSES),
+    # Linux supports all backends well
+    'Linux': (PlatformType.TERMIO, PlatformType.ANSI, PlatformType.CURSES),
+    # Windows typically only supports ANSI (with Windows Terminal), curses
+    # might work with windows-curses
+    'Windows': (PlatformType.ANSI, PlatformType.CURSES),
+}
+
+# Unknown system - try all
+_DEFAULT_FALLBACKS = (PlatformType.ANSI, PlatformType.TERMIO, PlatformType.CURSES)
+
+
+def _compute_fallback_order(preferred: PlatformType, system: str) -> Tuple[PlatformType, ...]:
+    """
+    Work out the fallback order for platforms on a given system.
+    
+    Args:
+        preferred: Preferred platform
+        system: Result of platform.system()
+        
+    Returns:
+        Platforms to try in order, starting with preferred
+    """
+    fallbacks = _SYSTEM_FALLBACKS.get(system, _DEFAULT_FALLBACKS)
+    return tuple(dict.fromkeys((preferred, *fallbacks)))
+
+
+# The fallback order only depends on the preferred platform and the OS,
+# so it is worked out once for every platform type
+_SYSTEM = platform.system()
+_FALLBACK_ORDERS = {p: _compute_fallback_order(p, _SYSTEM) for p in PlatformType}
+
 
 class FixedPlatformIO:
     """
@@ -53,9 +105,9 @@ class FixedPlatformIO:
         Raises:
             RuntimeError: If no suitable platform available
         """
-        # Auto-detect if not specified
+        # Auto-detect if not specified, reusing the shared detection results
         if platform_type is None:
-            detector = PlatformDetector()
+            detector = get_default_detector()
             platform_type = detector.select_best_platform()
             
             if platform_type is None:
@@ -68,27 +120,28 @@ class FixedPlatformIO:
         for platform in fallback_order:
             try:
                 display, input_handler = FixedPlatformIO._create_backend(platform)
-                
-                # Try to initialize
-                if display and input_handler:
-                    if display.initialize() and input_handler.initialize():
-                        return display, input_handler
-                    else:
-                        # Cleanup failed initialization
-                        try:
-                            display.shutdown()
-                            input_handler.shutdown()
-                        except:
-                            pass
-                        
-                        if not allow_fallback:
-                            raise RuntimeError(f"Failed to initialize {platform.name} backend")
-                        
-            except Exception as e:
+            except _BACKEND_ERRORS as e:
                 last_error = e
                 if not allow_fallback:
-                    raise
+                    raise RuntimeError(f"Failed to create {platform.name} backend") from e
+                continue
+            if display is None:
+                if not allow_fallback:
+                    raise RuntimeError(f"{platform.name} backend is not available")
                 continue
+            
+            try:
+                if FixedPlatformIO._initialize_pair(platform, display, input_handler):
+                    return display, input_handler
+            except _BACKEND_ERRORS as e:
+                last_error = e
+            
+            # Cleanup failed initialization
+            display.shutdown()
+            input_handler.shutdown()
+            
+            if not allow_fallback:
+                raise RuntimeError(f"Failed to initialize {platform.name} backend") from last_error
         
         # All platforms failed
         if last_error:
@@ -105,88 +158,43 @@ class FixedPlatformIO:
             platform_type: Platform type
             
         Returns:
-            Tuple of (Display, InputHandler) or (None, None) on failure
+            Tuple of (Display, InputHandler) or (None, None) if unavailable
         """
-        try:
-            if platform_type == PlatformType.ANSI:
-                # Use improved ANSI backend
-                display = ANSIDisplay()
-                input_handler = ImprovedANSIInput(
-                    allow_ctrl_c=True,
-                    enable_coalescing=True,
-                    enable_error_recovery=True
-                )
-                return display, input_handler
-                
-            elif platform_type == PlatformType.TERMIO:
-                # Use fixed TermIO backend
-                display = FixedTermIODisplay()
-                input_handler = TermIOInput()
-                return display, input_handler
-                
-            elif platform_type == PlatformType.CURSES:
-                # Curses with better initialization
-                return FixedPlatformIO._create_curses_backend()
-                
-            else:
-                return None, None
-                
-        except Exception:
+        backend = _BACKENDS.get(platform_type)
+        if backend is None:
+            return None, None
+        
+        display_class, input_factory = backend
+        if not display_class.is_available():
             return None, None
+        
+        return display_class(), input_factory()
     
     @staticmethod
-    def _create_curses_backend() -> Tuple[Optional[Display], Optional[InputHandler]]:
+    def _initialize_pair(platform_type: PlatformType, display: Display,
+                         input_handler: InputHandler) -> bool:
         """
-        Create Curses backend with proper error handling.
+        Initialize a display and its input handler.
         
+        Curses input needs the display's stdscr, so it is handed over
+        once the display has initialized.
+        
+        Args:
+            platform_type: Platform the backends belong to
+            display: Uninitialized display
+            input_handler: Uninitialized input handler
+            
         Returns:
-            Tuple of (Display, InputHandler) or (None, None) on failure
+            True if both initialized
         """
-        try:
-            import curses
-            
-            # Check if curses is actually available
-            # Some systems have the module but not the functionality
-            if not hasattr(curses, 'initscr'):
-                return None, None
-            
-            # Check if we're in a real terminal
-            if not sys.stdout.isatty():
-                return None, None
-            
-            # Try to create display
-            display = CursesDisplay()
-            
-            # Don't initialize here - let the factory do it
-            # This allows proper cleanup on failure
-            
-            # Create input handler (will get stdscr after init)
-            input_handler = CursesInput(None)
-            
-            # Special handling for curses initialization
-            # We need to initialize display first, then update input
-            def curses_init_sequence():
-                if display.initialize():
-                    # Update input handler with screen
-                    input_handler.stdscr = display.stdscr
-                    return input_handler.initialize()
-                return False
-            
-            # Monkey patch for coordinated initialization
-            original_display_init = display.initialize
-            display.initialize = curses_init_sequence
-            
-            return display, input_handler
-            
-        except ImportError:
-            # Curses not available
-            return None, None
-        except Exception:
-            # Any other error
-            return None, None
+        if not display.initialize():
+            return False
+        if platform_type is PlatformType.CURSES:
+            input_handler.stdscr = display.stdscr
+        return input_handler.initialize()
     
     @staticmethod
-    def _get_fallback_order(preferred: PlatformType) -> list:
+    def _get_fallback_order(preferred: PlatformType) -> Tuple[PlatformType, ...]:
         """
         Get fallback order for platforms.
         
@@ -194,52 +202,9 @@ class FixedPlatformIO:
             preferred: Preferred platform
             
         Returns:
-            List of platforms to try in order
+            Platforms to try in order
         """
-        all_platforms = [
-            PlatformType.ANSI,
-            PlatformType.TERMIO,
-            PlatformType.CURSES
-        ]
-        
-        # Start with preferred
-        order = [preferred]
-        
-        # Add others based on system
-        system = platform.system()
-        
-        if system == 'Darwin':  # macOS
-            # Prefer ANSI on macOS
-            if PlatformType.ANSI not in order:
-                order.append(PlatformType.ANSI)
-            # TermIO might work with fixes
-            if PlatformType.TERMIO not in order:
-                order.append(PlatformType.TERMIO)
-            # Curses as last resort
-            if PlatformType.CURSES not in order:
-                order.append(PlatformType.CURSES)
-                
-        elif system == 'Linux':
-            # Linux supports all backends well
-            for p in [PlatformType.TERMIO, PlatformType.ANSI, PlatformType.CURSES]:
-                if p not in order:
-                    order.append(p)
-                    
-        elif system == 'Windows':
-            # Windows typically only supports ANSI (with Windows Terminal)
-            if PlatformType.ANSI not in order:
-                order.append(PlatformType.ANSI)
-            # Curses might work with windows-curses
-            if PlatformType.CURSES not in order:
-                order.append(PlatformType.CURSES)
-        
-        else:
-            # Unknown system - try all
-            for p in all_platforms:
-                if p not in order:
-                    order.append(p)
-        
-        return order
+        return _FALLBACK_ORDERS[preferred]
     
     @staticmethod
     def test_all_backends() -> dict:
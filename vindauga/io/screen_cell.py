@@ -8,52 +8,188 @@ with Python best practices.
 """
 
 import unicodedata
-from typing import Optional
-from dataclasses import dataclass, field
+from enum import IntFlag
+from typing import Dict, Optional
+
+
+class Attr(IntFlag):
+    """Display attribute flags for ScreenCell.attrs."""
+    BOLD = 0x01
+    UNDERLINE = 0x02
+    REVERSE = 0x04
+    BLINK = 0x08
+    DIM = 0x10
+    ITALIC = 0x20
+    INVISIBLE = 0x40
+    STRIKETHROUGH = 0x80
+
+
+# Characters below U+1100 (the first Hangul Jamo) are never wide
+_WIDE_START = 0x1100
+
+# east_asian_width results for characters seen so far
+_WIDE_CACHE: Dict[str, bool] = {}
+
+# Bit layout of ScreenCell._state: codepoint, 24-bit fg, 24-bit bg, attrs on top
+_STATE_FG_SHIFT = 24
+_STATE_BG_SHIFT = 48
+_STATE_ATTR_SHIFT = 72
+_STATE_FIELD_MASK = 0xFFFFFF
+_STATE_LOW_MASK = (1 << _STATE_ATTR_SHIFT) - 1
+
+# Codepoint stored for the empty character of wide character trail cells
+_EMPTY_CHAR = 0x110000
+
+# Codepoint -> shared str, so cells showing the same character hand out
+# one string object; ASCII is filled in up front, the rest on first use
+_CHAR_POOL: Dict[int, str] = {code: chr(code) for code in range(128)}
+_CHAR_POOL[_EMPTY_CHAR] = ''
+
+
+def _check_field(name: str, value: int) -> None:
+    """Raise ValueError for a color that would spill into neighbouring fields."""
+    if not 0 <= value <= _STATE_FIELD_MASK:
+        raise ValueError(f"{name} must be between 0 and {_STATE_FIELD_MASK:#x}, got {value!r}")
+
+
+def _pack_state(char: str, fg_color: int, bg_color: int, attrs: int) -> int:
+    """Pack the display properties of a cell into a single integer."""
+    _check_field('fg_color', fg_color)
+    _check_field('bg_color', bg_color)
+    if attrs < 0:
+        raise ValueError(f"attrs must not be negative, got {attrs!r}")
+    return ((ord(char) if char else _EMPTY_CHAR) |
+            (fg_color << _STATE_FG_SHIFT) |
+            (bg_color << _STATE_BG_SHIFT) |
+            (attrs << _STATE_ATTR_SHIFT))
+
+
+# State of a blank cell: a space, white on black, no attributes
+_DEFAULT_STATE = _pack_state(' ', 7, 0, 0)
 
 
-@dataclass
 class ScreenCell:
     """
     Represents a single cell on the terminal screen.
     
     A screen cell contains a single character (which may be wide or combining),
     its display attributes (colors, styles), and metadata about its state.
+    There is one cell per screen position, so cells use slots rather than a
+    per-instance dict, and the character, colors and attributes are packed
+    into one integer so comparing or copying a cell is a single operation.
     
     Attributes:
         char: The character to display (default: space)
-        fg_color: Foreground color (0-255 or RGB tuple)
-        bg_color: Background color (0-255 or RGB tuple)
+        fg_color: Foreground color (0 to 0xFFFFFF)
+        bg_color: Background color (0 to 0xFFFFFF)
         attrs: Display attributes (bold, underline, etc.)
         dirty: Whether this cell has been modified
     """
     
-    # Display attributes as bit flags
-    ATTR_BOLD = 0x01
-    ATTR_UNDERLINE = 0x02
-    ATTR_REVERSE = 0x04
-    ATTR_BLINK = 0x08
-    ATTR_DIM = 0x10
-    ATTR_ITALIC = 0x20
-    ATTR_INVISIBLE = 0x40
-    ATTR_STRIKETHROUGH = 0x80
-    
-    char: str = ' '
-    fg_color: int = 7  # Default white
-    bg_color: int = 0  # Default black
-    attrs: int = 0
-    dirty: bool = field(default=True, compare=False)
-    
-    def __post_init__(self):
-        """Validate and normalize the character."""
-        # Ensure we have at least one character
-        if not self.char:
-            self.char = ' '
-        
-        # Take only the first character if multiple provided
-        # This handles the case where someone passes a string
-        if len(self.char) > 1:
-            self.char = self.char[0]
+    __slots__ = ('_state', 'dirty')
+    
+    # Display attributes as bit flags, kept for compatibility with Attr
+    ATTR_BOLD = Attr.BOLD
+    ATTR_UNDERLINE = Attr.UNDERLINE
+    ATTR_REVERSE = Attr.REVERSE
+    ATTR_BLINK = Attr.BLINK
+    ATTR_DIM = Attr.DIM
+    ATTR_ITALIC = Attr.ITALIC
+    ATTR_INVISIBLE = Attr.INVISIBLE
+    ATTR_STRIKETHROUGH = Attr.STRIKETHROUGH
+    
+    def __init__(self, char: str = ' ', fg_color: int = 7, bg_color: int = 0,
+                 attrs: int = 0, dirty: bool = True):
+        """Initialize the cell, keeping only the first character of char."""
+        if not char:
+            char = ' '
+        elif len(char) > 1:
+            char = char[0]
+        self._state = _pack_state(char, fg_color, bg_color, attrs)
+        self.dirty = dirty
+    
+    @classmethod
+    def _raw(cls, state: int = _DEFAULT_STATE, dirty: bool = True) -> 'ScreenCell':
+        """
+        Create a cell from an already packed state, skipping normalization.
+        
+        For trusted callers that fill buffers with many cells at once.
+        
+        Args:
+            state: Packed display state (default: blank cell)
+            dirty: Initial dirty flag
+            
+        Returns:
+            New cell
+        """
+        cell = cls.__new__(cls)
+        cell._state = state
+        cell.dirty = dirty
+        return cell
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare cells of the same type, ignoring the dirty flag."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._state == other._state
+    
+    # Cells are mutable, so they are not hashable
+    __hash__ = None
+    
+    @property
+    def char(self) -> str:
+        """The character to display."""
+        code = self._state & _STATE_FIELD_MASK
+        char = _CHAR_POOL.get(code)
+        if char is None:
+            char = _CHAR_POOL[code] = chr(code)
+        return char
+    
+    @char.setter
+    def char(self, char: str) -> None:
+        self._state = (self._state & ~_STATE_FIELD_MASK) | (ord(char) if char else _EMPTY_CHAR)
+    
+    @property
+    def fg_color(self) -> int:
+        """Foreground color."""
+        return (self._state >> _STATE_FG_SHIFT) & _STATE_FIELD_MASK
+    
+    @fg_color.setter
+    def fg_color(self, color: int) -> None:
+        _check_field('fg_color', color)
+        self._state = ((self._state & ~(_STATE_FIELD_MASK << _STATE_FG_SHIFT)) |
+                       (color << _STATE_FG_SHIFT))
+    
+    @property
+    def bg_color(self) -> int:
+        """Background color."""
+        return (self._state >> _STATE_BG_SHIFT) & _STATE_FIELD_MASK
+    
+    @bg_color.setter
+    def bg_color(self, color: int) -> None:
+        _check_field('bg_color', color)
+        self._state = ((self._state & ~(_STATE_FIELD_MASK << _STATE_BG_SHIFT)) |
+                       (color << _STATE_BG_SHIFT))
+    
+    @property
+    def attrs(self) -> int:
+        """Display attribute flags."""
+        return self._state >> _STATE_ATTR_SHIFT
+    
+    @attrs.setter
+    def attrs(self, attrs: int) -> None:
+        if attrs < 0:
+            raise ValueError(f"attrs must not be negative, got {attrs!r}")
+        self._state = (self._state & _STATE_LOW_MASK) | (attrs << _STATE_ATTR_SHIFT)
+    
+    @property
+    def style(self) -> int:
+        """Colors and attributes packed together; equal styles render alike."""
+        return self._state >> _STATE_FG_SHIFT
+    
+    def __repr__(self) -> str:
+        return (f"{self.__class__.__name__}(char={self.char!r}, fg_color={self.fg_color!r}, "
+                f"bg_color={self.bg_color!r}, attrs={self.attrs!r}, dirty={self.dirty!r})")
     
     @property
     def is_wide(self) -> bool:
@@ -65,11 +201,15 @@ class ScreenCell:
         Returns:
             True if the character is wide, False otherwise
         """
-        if not self.char or self.char == ' ':
+        char = self.char
+        if not char or ord(char) < _WIDE_START:
             return False
         
-        width = unicodedata.east_asian_width(self.char)
-        return width in ('W', 'F')  # Wide or Fullwidth
+        wide = _WIDE_CACHE.get(char)
+        if wide is None:
+            wide = unicodedata.east_asian_width(char) in ('W', 'F')  # Wide or Fullwidth
+            _WIDE_CACHE[char] = wide
+        return wide
     
     @property
     def width(self) -> int:
@@ -88,10 +228,13 @@ class ScreenCell:
         Args:
             char: The character to set
         """
-        if char != self.char:
-            self.char = char if char else ' '
-            if len(self.char) > 1:
-                self.char = self.char[0]
+        # Normalize straight to a codepoint and compare packed states, so an
+        # unchanged write costs one integer compare
+        code = ord(char[0]) if char else 0x20
+        state = self._state
+        new_state = (state & ~_STATE_FIELD_MASK) | code
+        if new_state != state:
+            self._state = new_state
             self.dirty = True
     
     def set_colors(self, fg: Optional[int] = None, bg: Optional[int] = None) -> None:
@@ -99,8 +242,8 @@ class ScreenCell:
         Set the foreground and/or background colors.
         
         Args:
-            fg: Foreground color (0-255), None to keep current
-            bg: Background color (0-255), None to keep current
+            fg: Foreground color (0 to 0xFFFFFF), None to keep current
+            bg: Background color (0 to 0xFFFFFF), None to keep current
         """
         changed = False
         
@@ -120,17 +263,16 @@ class ScreenCell:
         Enable or disable a display attribute.
         
         Args:
-            attr: Attribute flag (e.g., ATTR_BOLD)
+            attr: Attribute flag (e.g., Attr.BOLD)
             enabled: Whether to enable or disable the attribute
         """
-        old_attrs = self.attrs
+        # Work on the packed state with plain ints; shifting an Attr gives an int
+        bits = attr << _STATE_ATTR_SHIFT
+        state = self._state
+        new_state = state | bits if enabled else state & ~bits
         
-        if enabled:
-            self.attrs |= attr
-        else:
-            self.attrs &= ~attr
-        
-        if self.attrs != old_attrs:
+        if new_state != state:
+            self._state = new_state
             self.dirty = True
     
     def has_attr(self, attr: int) -> bool:
@@ -143,14 +285,11 @@ class ScreenCell:
         Returns:
             True if the attribute is set, False otherwise
         """
-        return bool(self.attrs & attr)
+        return bool(self._state & (attr << _STATE_ATTR_SHIFT))
     
     def clear(self) -> None:
         """Reset the cell to default state."""
-        self.char = ' '
-        self.fg_color = 7
-        self.bg_color = 0
-        self.attrs = 0
+        self._state = _DEFAULT_STATE
         self.dirty = True
     
     def copy_from(self, other: 'ScreenCell') -> None:
@@ -160,17 +299,20 @@ class ScreenCell:
         Args:
             other: The cell to copy from
         """
-        if (self.char != other.char or 
-            self.fg_color != other.fg_color or
-            self.bg_color != other.bg_color or
-            self.attrs != other.attrs):
-            
-            self.char = other.char
-            self.fg_color = other.fg_color
-            self.bg_color = other.bg_color
-            self.attrs = other.attrs
+        if self._state != other._state:
+            self._state = other._state
             self.dirty = True
     
+    @property
+    def display_key(self) -> int:
+        """
+        Get the display properties as a single comparable value.
+        
+        Returns:
+            The packed char, colors and attributes, excluding the dirty flag
+        """
+        return self._state
+    
     def equals_display(self, other: 'ScreenCell') -> bool:
         """
         Check if two cells have the same display properties.
@@ -183,10 +325,7 @@ class ScreenCell:
         Returns:
             True if cells would display identically
         """
-        return (self.char == other.char and
-                self.fg_color == other.fg_color and
-                self.bg_color == other.bg_color and
-                self.attrs == other.attrs)
+        return self._state == other._state
     
     def mark_clean(self) -> None:
         """Mark this cell as clean (not dirty)."""
@@ -203,13 +342,37 @@ class WideCharCell(ScreenCell):
     
     When a wide character is placed in the buffer, it occupies two cells.
     The first cell contains the actual character, and the second cell
-    contains this special marker.
+    contains this special marker. Trail cells carry no state of their own,
+    so buffers share the single WIDE_TRAIL instance, and neither its display
+    properties nor its dirty flag can be changed.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         """Initialize a wide character trailing cell."""
-        super().__init__(char='', fg_color=0, bg_color=0, attrs=0)
-        self.char = ''  # Force empty char, overriding normalization
+        # Empty char, bypassing normalization
+        self._state = _pack_state('', 0, 0, 0)
+    
+    def _immutable(self, *args, **kwargs) -> None:
+        raise TypeError("Wide character trail cells cannot be modified")
+    
+    set_char = set_colors = set_attr = clear = copy_from = _immutable
+    mark_clean = mark_dirty = _immutable
+    
+    char = property(ScreenCell.char.fget, _immutable)
+    fg_color = property(ScreenCell.fg_color.fget, _immutable)
+    bg_color = property(ScreenCell.bg_color.fget, _immutable)
+    attrs = property(ScreenCell.attrs.fget, _immutable)
+    
+    @property
+    def dirty(self) -> bool:
+        """Trail cells are redrawn with their lead cell, never on their own."""
+        return False
+    
+    @dirty.setter
+    def dirty(self, dirty: bool) -> None:
+        self._immutable()
     
     @property
     def is_wide_trail(self) -> bool:
@@ -219,4 +382,8 @@ class WideCharCell(ScreenCell):
     @property
     def width(self) -> int:
         """Trail cells have zero width."""
-        return 0
\ No newline at end of file
+        return 0
+
+
+# Shared trailing cell for every wide character
+WIDE_TRAIL = WideCharCell()
\ No newline at end of file
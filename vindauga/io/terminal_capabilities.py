@@ -9,57 +9,97 @@ escape sequences, environment variables, and runtime queries.
 import sys
 import os
 import select
+import shutil
 import time
 import re
-from typing import Optional, Dict, Any, List, Tuple
-from dataclasses import dataclass
-from enum import Enum
+from typing import Optional, Dict, Any, List, Mapping, Tuple
+from dataclasses import dataclass, replace
+from enum import IntFlag
+from types import MappingProxyType
 
+# Matches any TERM naming color support; group 1 is set for 256-color terms
+_COLOR_RE = re.compile(r'.*(256color)|.*color')
 
-class TerminalCapability(Enum):
-    """Terminal capabilities."""
+
+class TerminalCapability(IntFlag):
+    """
+    Terminal capabilities, as combinable flags.
+    
+    Member values are bit masks rather than the former strings such as
+    "color_16"; use the member name where a stable text form is needed.
+    """
     # Display capabilities
-    COLOR_16 = "color_16"
-    COLOR_256 = "color_256"
-    COLOR_24BIT = "color_24bit"
-    UNICODE = "unicode"
-    WIDE_CHARS = "wide_chars"
-    ITALIC = "italic"
-    UNDERLINE = "underline"
-    STRIKETHROUGH = "strikethrough"
+    COLOR_16 = 1 << 0
+    COLOR_256 = 1 << 1
+    COLOR_24BIT = 1 << 2
+    UNICODE = 1 << 3
+    WIDE_CHARS = 1 << 4
+    ITALIC = 1 << 5
+    UNDERLINE = 1 << 6
+    STRIKETHROUGH = 1 << 7
     
     # Control capabilities
-    ALTERNATE_SCREEN = "alternate_screen"
-    CURSOR_SHAPE = "cursor_shape"
-    CURSOR_COLOR = "cursor_color"
-    TITLE = "title"
+    ALTERNATE_SCREEN = 1 << 8
+    CURSOR_SHAPE = 1 << 9
+    CURSOR_COLOR = 1 << 10
+    TITLE = 1 << 11
     
     # Input capabilities
-    MOUSE_X11 = "mouse_x11"
-    MOUSE_SGR = "mouse_sgr"
-    MOUSE_URXVT = "mouse_urxvt"
-    BRACKETED_PASTE = "bracketed_paste"
-    FOCUS_EVENTS = "focus_events"
+    MOUSE_X11 = 1 << 12
+    MOUSE_SGR = 1 << 13
+    MOUSE_URXVT = 1 << 14
+    BRACKETED_PASTE = 1 << 15
+    FOCUS_EVENTS = 1 << 16
     
     # Advanced capabilities
-    SIXEL_GRAPHICS = "sixel_graphics"
-    KITTY_GRAPHICS = "kitty_graphics"
-    SYNCHRONIZED_UPDATE = "synchronized_update"
+    SIXEL_GRAPHICS = 1 << 17
+    KITTY_GRAPHICS = 1 << 18
+    SYNCHRONIZED_UPDATE = 1 << 19
 
 
-@dataclass
+def _caps_from_mapping(capabilities: Mapping[TerminalCapability, bool]) -> TerminalCapability:
+    """Fold a capability -> bool mapping into flags."""
+    caps = TerminalCapability(0)
+    for cap, present in capabilities.items():
+        if present:
+            caps |= cap
+    return caps
+
+
+@dataclass(init=False)
 class TerminalInfo:
     """Terminal information."""
     name: str = "unknown"
     version: str = "unknown"
     type: str = "unknown"
-    capabilities: Dict[TerminalCapability, bool] = None
+    caps: TerminalCapability = TerminalCapability(0)
     color_count: int = 16
     size: Tuple[int, int] = (80, 24)
     
-    def __post_init__(self):
-        if self.capabilities is None:
-            self.capabilities = {}
+    def __init__(self, name: str = "unknown", version: str = "unknown", type: str = "unknown",
+                 capabilities: Optional[Mapping[TerminalCapability, bool]] = None,
+                 color_count: int = 16, size: Tuple[int, int] = (80, 24), *,
+                 caps: TerminalCapability = TerminalCapability(0)):
+        # The capabilities mapping is kept for callers of the old field
+        self.name = name
+        self.version = version
+        self.type = type
+        self.caps = caps | _caps_from_mapping(capabilities or {})
+        self.color_count = color_count
+        self.size = size
+    
+    def has(self, capability: TerminalCapability) -> bool:
+        """Check whether every flag in capability is set."""
+        return self.caps & capability == capability
+    
+    @property
+    def capabilities(self) -> Mapping[TerminalCapability, bool]:
+        """Read-only view of the set capabilities, for callers expecting a mapping."""
+        return MappingProxyType({cap: True for cap in TerminalCapability if self.caps & cap})
+    
+    @capabilities.setter
+    def capabilities(self, capabilities: Mapping[TerminalCapability, bool]) -> None:
+        self.caps = _caps_from_mapping(capabilities)
 
 
 class TerminalCapabilityDetector:
@@ -86,6 +126,20 @@ class TerminalCapabilityDetector:
     DA3_PATTERN = re.compile(r'\x1b\[=([0-9;]+)c')
     DSR_PATTERN = re.compile(r'\x1b\[(\d+);(\d+)R')
     
+    # Numeric DA1 parameters, and the bit each parameter of interest sets
+    DA1_PARAM_PATTERN = re.compile(r'(?:^|;)(\d+)(?=;|$)')
+    DA1_BITS = {
+        '1': 0x1,   # 132 column mode
+        '4': 0x2,   # Sixel graphics
+        '6': 0x4,   # Selective erase
+        '22': 0x8,  # ANSI color
+    }
+    
+    # Any DA or DSR reply: intro ('?', '>', '=' or none), parameters, final byte
+    RESPONSE_PATTERN = re.compile(r'\x1b\[([?>=]?)([0-9;]*)([cR])')
+    # The same, for spotting complete replies in raw input before decoding
+    RESPONSE_BYTES_PATTERN = re.compile(RESPONSE_PATTERN.pattern.encode('ascii'))
+    
     def __init__(self, timeout: float = 0.1):
         """
         Initialize capability detector.
@@ -100,40 +154,18 @@ class TerminalCapabilityDetector:
         
         # Terminal type database
         self.terminal_database = {
-            'xterm': {
-                TerminalCapability.COLOR_256: True,
-                TerminalCapability.MOUSE_X11: True,
-                TerminalCapability.MOUSE_SGR: True,
-                TerminalCapability.ALTERNATE_SCREEN: True,
-            },
-            'xterm-256color': {
-                TerminalCapability.COLOR_256: True,
-                TerminalCapability.COLOR_24BIT: True,
-                TerminalCapability.MOUSE_X11: True,
-                TerminalCapability.MOUSE_SGR: True,
-                TerminalCapability.ALTERNATE_SCREEN: True,
-            },
-            'screen': {
-                TerminalCapability.COLOR_256: True,
-                TerminalCapability.ALTERNATE_SCREEN: True,
-            },
-            'tmux': {
-                TerminalCapability.COLOR_256: True,
-                TerminalCapability.COLOR_24BIT: True,
-                TerminalCapability.ALTERNATE_SCREEN: True,
-            },
-            'kitty': {
-                TerminalCapability.COLOR_24BIT: True,
-                TerminalCapability.KITTY_GRAPHICS: True,
-                TerminalCapability.UNICODE: True,
-                TerminalCapability.WIDE_CHARS: True,
-            },
-            'iterm2': {
-                TerminalCapability.COLOR_24BIT: True,
-                TerminalCapability.SIXEL_GRAPHICS: True,
-                TerminalCapability.UNICODE: True,
-                TerminalCapability.WIDE_CHARS: True,
-            },
+            'xterm': (TerminalCapability.COLOR_256 | TerminalCapability.MOUSE_X11 |
+                      TerminalCapability.MOUSE_SGR | TerminalCapability.ALTERNATE_SCREEN),
+            'xterm-256color': (TerminalCapability.COLOR_256 | TerminalCapability.COLOR_24BIT |
+                               TerminalCapability.MOUSE_X11 | TerminalCapability.MOUSE_SGR |
+                               TerminalCapability.ALTERNATE_SCREEN),
+            'screen': TerminalCapability.COLOR_256 | TerminalCapability.ALTERNATE_SCREEN,
+            'tmux': (TerminalCapability.COLOR_256 | TerminalCapability.COLOR_24BIT |
+                     TerminalCapability.ALTERNATE_SCREEN),
+            'kitty': (TerminalCapability.COLOR_24BIT | TerminalCapability.KITTY_GRAPHICS |
+                      TerminalCapability.UNICODE | TerminalCapability.WIDE_CHARS),
+            'iterm2': (TerminalCapability.COLOR_24BIT | TerminalCapability.SIXEL_GRAPHICS |
+                       TerminalCapability.UNICODE | TerminalCapability.WIDE_CHARS),
         }
     
     def detect_all(self) -> TerminalInfo:
@@ -150,7 +182,6 @@ class TerminalCapabilityDetector:
         if self._setup_terminal():
             try:
                 self._query_device_attributes()
-                self._query_specific_features()
             finally:
                 self._restore_terminal()
         
@@ -164,48 +195,49 @@ class TerminalCapabilityDetector:
     
     def _detect_from_environment(self):
         """Detect capabilities from environment variables."""
+        env = os.environ
+        
         # Terminal type
-        term = os.environ.get('TERM', 'unknown')
+        term = env.get('TERM', 'unknown')
         self.terminal_info.type = term
         
         # Color support from TERM
-        if '256color' in term:
-            self.terminal_info.capabilities[TerminalCapability.COLOR_256] = True
+        color = _COLOR_RE.match(term)
+        if color and color.group(1):
+            self.terminal_info.caps |= TerminalCapability.COLOR_256
             self.terminal_info.color_count = 256
-        elif 'color' in term:
-            self.terminal_info.capabilities[TerminalCapability.COLOR_16] = True
+        elif color:
+            self.terminal_info.caps |= TerminalCapability.COLOR_16
             self.terminal_info.color_count = 16
         
         # 24-bit color from COLORTERM
-        colorterm = os.environ.get('COLORTERM', '')
+        colorterm = env.get('COLORTERM', '')
         if colorterm in ['truecolor', '24bit']:
-            self.terminal_info.capabilities[TerminalCapability.COLOR_24BIT] = True
+            self.terminal_info.caps |= TerminalCapability.COLOR_24BIT
             self.terminal_info.color_count = 16777216
         
         # Terminal emulator detection
-        term_program = os.environ.get('TERM_PROGRAM', '')
+        term_program = env.get('TERM_PROGRAM', '')
         if term_program:
             self.terminal_info.name = term_program
             
             # Program-specific capabilities
             if 'iTerm' in term_program:
-                self.terminal_info.capabilities[TerminalCapability.COLOR_24BIT] = True
-                self.terminal_info.capabilities[TerminalCapability.SIXEL_GRAPHICS] = True
+                self.terminal_info.caps |= TerminalCapability.COLOR_24BIT | TerminalCapability.SIXEL_GRAPHICS
             elif term_program == 'Apple_Terminal':
-                self.terminal_info.capabilities[TerminalCapability.COLOR_256] = True
+                self.terminal_info.caps |= TerminalCapability.COLOR_256
             elif term_program == 'vscode':
-                self.terminal_info.capabilities[TerminalCapability.COLOR_24BIT] = True
+                self.terminal_info.caps |= TerminalCapability.COLOR_24BIT
         
         # Kitty detection
-        if 'KITTY_WINDOW_ID' in os.environ:
+        if 'KITTY_WINDOW_ID' in env:
             self.terminal_info.name = 'kitty'
-            self.terminal_info.capabilities[TerminalCapability.KITTY_GRAPHICS] = True
-            self.terminal_info.capabilities[TerminalCapability.COLOR_24BIT] = True
+            self.terminal_info.caps |= TerminalCapability.KITTY_GRAPHICS | TerminalCapability.COLOR_24BIT
         
         # Unicode support
-        lang = os.environ.get('LANG', '')
-        if 'UTF-8' in lang or 'utf8' in lang.lower():
-            self.terminal_info.capabilities[TerminalCapability.UNICODE] = True
+        lang = env.get('LANG', '').lower()
+        if 'utf-8' in lang or 'utf8' in lang:
+            self.terminal_info.caps |= TerminalCapability.UNICODE
     
     def _setup_terminal(self) -> bool:
         """Set up terminal for queries."""
@@ -260,60 +292,117 @@ class TerminalCapabilityDetector:
             sys.stdout.write(query)
             sys.stdout.flush()
             
-            # Wait for response
-            response = b''
-            start_time = time.time()
+            # Wait for response, sleeping in select until data arrives
+            response = bytearray()
+            deadline = time.monotonic() + self.timeout
+            remaining = self.timeout
+            while remaining > 0:
+                ready, _, _ = select.select([self._stdin_fd], [], [], remaining)
+                if not ready:
+                    break
+                try:
+                    data = os.read(self._stdin_fd, 1024)
+                except OSError:
+                    break
+                if not data:
+                    break
+                response.extend(data)
+                # Check if we have a complete response
+                if self.RESPONSE_BYTES_PATTERN.search(response):
+                    break
+                remaining = deadline - time.monotonic()
+                        
+            return response.decode('ascii', errors='ignore') if response else None
             
-            while time.time() - start_time < self.timeout:
-                ready, _, _ = select.select([self._stdin_fd], [], [], 0.01)
+        except (OSError, ValueError):
+            return None
+    
+    def _send_queries_batched(self, queries: List[str]) -> Optional[str]:
+        """
+        Send several queries at once and collect their responses.
+        
+        Reading stops as soon as one reply per query has arrived, or when
+        the timeout runs out, so the whole batch costs a single round trip.
+        
+        Args:
+            queries: Query sequences to send
+            
+        Returns:
+            Response string or None
+        """
+        if self._stdin_fd is None:
+            return None
+        
+        try:
+            sys.stdout.write(''.join(queries))
+            sys.stdout.flush()
+            
+            response = bytearray()
+            deadline = time.monotonic() + self.timeout
+            remaining = self.timeout
+            while remaining > 0:
+                ready, _, _ = select.select([self._stdin_fd], [], [], remaining)
                 if ready:
                     try:
                         data = os.read(self._stdin_fd, 1024)
-                        if data:
-                            response += data
-                            # Check if we have a complete response
-                            if b'c' in data or b'R' in data:
-                                break
-                    except:
+                    except OSError:
                         break
-                        
+                    if not data:
+                        break
+                    response.extend(data)
+                    replies = self.RESPONSE_BYTES_PATTERN.findall(response)
+                    if len(replies) >= len(queries):
+                        break
+                remaining = deadline - time.monotonic()
+            
             return response.decode('ascii', errors='ignore') if response else None
             
-        except:
+        except (OSError, ValueError):
             return None
     
-    def _query_device_attributes(self):
-        """Query device attributes."""
-        # Primary device attributes (DA1)
-        response = self._send_query(self.DA1_QUERY)
-        if response:
-            match = self.DA1_PATTERN.search(response)
-            if match:
-                params = match.group(1).split(';')
-                self._parse_da1_response(params)
+    def _dispatch_responses(self, response: Optional[str]):
+        """
+        Route each reply in a response to its parser.
+        
+        Args:
+            response: Response string from the terminal
+        """
+        if not response:
+            return
         
-        # Secondary device attributes (DA2)
-        response = self._send_query(self.DA2_QUERY)
-        if response:
-            match = self.DA2_PATTERN.search(response)
-            if match:
-                params = match.group(1).split(';')
-                self._parse_da2_response(params)
+        for match in self.RESPONSE_PATTERN.finditer(response):
+            intro, params, final = match.groups()
+            if final == 'R':
+                if self.DSR_PATTERN.match(match.group()):
+                    # Terminal responds to DSR
+                    self.terminal_info.caps |= TerminalCapability.CURSOR_SHAPE
+            elif intro == '>':
+                if params:
+                    self._parse_da2_response(params.split(';'))
+            elif intro != '=':
+                if intro or params:
+                    self._parse_da1_response(intro + params)
     
-    def _parse_da1_response(self, params: List[str]):
+    def _query_device_attributes(self):
+        """Query device attributes (DA1, DA2) and cursor position reporting."""
+        # Queries left unanswered are not retried: the batch only ends early
+        # once every reply is in, so a retry would cost a second full timeout
+        queries = [self.DA1_QUERY, self.DA2_QUERY, self.DSR_QUERY]
+        self._dispatch_responses(self._send_queries_batched(queries))
+    
+    def _parse_da1_response(self, params: str):
         """Parse DA1 response parameters."""
-        # Common DA1 parameters indicate capabilities
-        param_set = set(params)
+        # Fold the parameters of interest into a bitmask
+        bits = 0
+        da1_bits = self.DA1_BITS
+        for match in self.DA1_PARAM_PATTERN.finditer(params):
+            bits |= da1_bits.get(match.group(1), 0)
         
         # Check for specific capabilities
-        if '1' in param_set:  # 132 column mode
-            pass
-        if '4' in param_set:  # Sixel graphics
-            self.terminal_info.capabilities[TerminalCapability.SIXEL_GRAPHICS] = True
-        if '6' in param_set:  # Selective erase
-            pass
-        if '22' in param_set:  # ANSI color
-            self.terminal_info.capabilities[TerminalCapability.COLOR_16] = True
+        if bits & 0x2:  # Sixel graphics
+            self.terminal_info.caps |= TerminalCapability.SIXEL_GRAPHICS
+        if bits & 0x8:  # ANSI color
+            self.terminal_info.caps |= TerminalCapability.COLOR_16
     
     def _parse_da2_response(self, params: List[str]):
         """Parse DA2 response parameters."""
@@ -341,48 +430,31 @@ class TerminalCapabilityDetector:
             # Firmware version
             self.terminal_info.version = params[1]
     
-    def _query_specific_features(self):
-        """Query for specific features."""
-        # Check cursor position reporting (basic test)
-        response = self._send_query(self.DSR_QUERY)
-        if response and self.DSR_PATTERN.search(response):
-            # Terminal responds to DSR
-            self.terminal_info.capabilities[TerminalCapability.CURSOR_SHAPE] = True
-    
     def _detect_from_database(self):
         """Fill in capabilities from terminal database."""
         term_type = self.terminal_info.type.lower()
         
-        # Check direct match
-        if term_type in self.terminal_database:
-            for cap, value in self.terminal_database[term_type].items():
-                if cap not in self.terminal_info.capabilities:
-                    self.terminal_info.capabilities[cap] = value
-        
-        # Check partial matches
-        for known_term, caps in self.terminal_database.items():
+        # Every entry contained in the terminal type contributes its flags
+        for known_term in self.terminal_database:
             if known_term in term_type:
-                for cap, value in caps.items():
-                    if cap not in self.terminal_info.capabilities:
-                        self.terminal_info.capabilities[cap] = value
+                self.terminal_info.caps |= self.terminal_database[known_term]
     
     def _finalize_detection(self):
         """Final adjustments to detected capabilities."""
-        caps = self.terminal_info.capabilities
+        info = self.terminal_info
         
         # If we have 24-bit color, we also have 256 and 16
-        if caps.get(TerminalCapability.COLOR_24BIT):
-            caps[TerminalCapability.COLOR_256] = True
-            caps[TerminalCapability.COLOR_16] = True
-            self.terminal_info.color_count = 16777216
-        elif caps.get(TerminalCapability.COLOR_256):
-            caps[TerminalCapability.COLOR_16] = True
-            if self.terminal_info.color_count < 256:
-                self.terminal_info.color_count = 256
+        if info.caps & TerminalCapability.COLOR_24BIT:
+            info.caps |= TerminalCapability.COLOR_256 | TerminalCapability.COLOR_16
+            info.color_count = 16777216
+        elif info.caps & TerminalCapability.COLOR_256:
+            info.caps |= TerminalCapability.COLOR_16
+            if info.color_count < 256:
+                info.color_count = 256
         
         # Wide chars require Unicode
-        if caps.get(TerminalCapability.WIDE_CHARS):
-            caps[TerminalCapability.UNICODE] = True
+        if info.caps & TerminalCapability.WIDE_CHARS:
+            info.caps |= TerminalCapability.UNICODE
         
         # Get terminal size
         try:
@@ -393,15 +465,43 @@ class TerminalCapabilityDetector:
             pass
 
 
+# Environment variables that feed detection, used to key cached results
+_ENV_KEYS = ('TERM', 'COLORTERM', 'TERM_PROGRAM', 'KITTY_WINDOW_ID', 'LANG')
+
+# Detection results keyed on the environment, whether stdin is a TTY and the query timeout
+_CAPS_CACHE: Dict[Tuple, TerminalInfo] = {}
+
+
+def invalidate_capability_cache() -> None:
+    """Forget cached detection results, e.g. after the terminal changes."""
+    _CAPS_CACHE.clear()
+
+
 def detect_terminal_capabilities(timeout: float = 0.1) -> TerminalInfo:
     """
     Convenience function to detect terminal capabilities.
     
+    Detection involves terminal round trips, so results are cached per
+    environment; call invalidate_capability_cache() to force a fresh query.
+    
     Args:
         timeout: Timeout for queries
         
     Returns:
         TerminalInfo with detected capabilities
     """
-    detector = TerminalCapabilityDetector(timeout=timeout)
-    return detector.detect_all()
\ No newline at end of file
+    environ = os.environ
+    try:
+        is_tty = sys.stdin.isatty()
+    except (AttributeError, OSError, ValueError):
+        # stdin missing or closed
+        is_tty = False
+    key = tuple(environ.get(name, '') for name in _ENV_KEYS) + (is_tty, timeout)
+    info = _CAPS_CACHE.get(key)
+    if info is None:
+        detector = TerminalCapabilityDetector(timeout=timeout)
+        info = _CAPS_CACHE[key] = detector.detect_all()
+        # Callers get their own copy, so they can't alter the cached result
+        return replace(info)
+    # The window may have been resized since the cached detection
+    return replace(info, size=tuple(shutil.get_terminal_size()))
\ No newline at end of file
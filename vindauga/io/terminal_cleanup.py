@@ -9,9 +9,22 @@ are always restored to a sane state, even after crashes.
 import sys
 import os
 import signal
+import threading
 import atexit
 import weakref
-from typing import Optional, Set, Callable
+from types import MethodType
+from typing import Optional, Set, Callable, Dict, Tuple
+
+# Reset sequences sent on cleanup, joined so they go out in one write
+_RESET_BLOB = (
+    b'\033[?1049l'  # Exit alternate screen
+    b'\033[?25h'    # Show cursor
+    b'\033[0m'      # Reset attributes
+    b'\033[?1000l'  # Disable X11 mouse
+    b'\033[?1006l'  # Disable SGR mouse
+    b'\033[?1002l'  # Disable cell motion tracking
+    b'\033[?1003l'  # Disable all motion tracking
+)
 
 
 class TerminalCleanupManager:
@@ -36,8 +49,13 @@ class TerminalCleanupManager:
             return
             
         self._initialized = True
-        self._cleanup_handlers: Set[weakref.ref] = set()
-        self._signal_handlers_installed = False
+        # Plain callables are held weakly in a WeakSet.  A bound method is
+        # created afresh on each attribute access, so it is stored as its
+        # function under the id of the instance it belongs to.  Keying on id
+        # rather than the instance keeps unhashable owners registrable; a
+        # finalizer drops the entry when the instance is collected
+        self._cleanup_handlers: weakref.WeakSet[Callable[[], None]] = weakref.WeakSet()
+        self._cleanup_methods: Dict[int, Tuple[weakref.ref, Set[Callable]]] = {}
         self._original_termios = None
         self._stdin_fd = None
         
@@ -46,6 +64,9 @@ class TerminalCleanupManager:
         
         # Register atexit handler
         atexit.register(self._cleanup_all)
+        
+        # Install signal handlers
+        self._install_signal_handlers()
     
     def _save_terminal_state(self):
         """Save original terminal state."""
@@ -64,13 +85,25 @@ class TerminalCleanupManager:
         Args:
             handler: Cleanup function to call on exit
         """
-        # Use weak reference to avoid keeping objects alive
-        self._cleanup_handlers.add(weakref.ref(handler))
-        
-        # Install signal handlers on first registration
-        if not self._signal_handlers_installed:
-            self._install_signal_handlers()
-            self._signal_handlers_installed = True
+        # Use weak references to avoid keeping objects alive, except for
+        # methods of instances that cannot be weakly referenced
+        if isinstance(handler, MethodType):
+            owner = handler.__self__
+            entry = self._cleanup_methods.get(id(owner))
+            if entry is None:
+                try:
+                    owner_ref = weakref.ref(owner)
+                except TypeError:
+                    # __slots__ classes without __weakref__ are held strongly
+                    owner_ref = lambda owner=owner: owner
+                else:
+                    # Not run at exit: it would drop entries before
+                    # _cleanup_all gets to call them
+                    weakref.finalize(owner, self._cleanup_methods.pop, id(owner), None).atexit = False
+                entry = self._cleanup_methods[id(owner)] = (owner_ref, set())
+            entry[1].add(handler.__func__)
+        else:
+            self._cleanup_handlers.add(handler)
     
     def unregister_cleanup(self, handler: Callable[[], None]):
         """
@@ -79,19 +112,19 @@ class TerminalCleanupManager:
         Args:
             handler: Cleanup function to remove
         """
-        # Remove dead references and the specified handler
-        dead_refs = set()
-        for ref in self._cleanup_handlers:
-            obj = ref()
-            if obj is None:
-                dead_refs.add(ref)
-            elif obj == handler:
-                dead_refs.add(ref)
-        
-        self._cleanup_handlers -= dead_refs
+        if isinstance(handler, MethodType):
+            entry = self._cleanup_methods.get(id(handler.__self__))
+            if entry is not None:
+                entry[1].discard(handler.__func__)
+        else:
+            self._cleanup_handlers.discard(handler)
     
     def _install_signal_handlers(self):
         """Install signal handlers for cleanup."""
+        # Signal handlers can only be set from the main thread
+        if threading.current_thread() is not threading.main_thread():
+            return
+        
         def signal_handler(signum, frame):
             """Handle signals by cleaning up and re-raising."""
             self._cleanup_all()
@@ -119,49 +152,46 @@ class TerminalCleanupManager:
     
     def _cleanup_all(self):
         """Run all cleanup handlers."""
-        # Call registered cleanup handlers
-        dead_refs = set()
-        for ref in self._cleanup_handlers:
-            handler = ref()
-            if handler is None:
-                dead_refs.add(ref)
-            else:
+        # Call registered cleanup handlers; dead entries have already
+        # dropped out of the weak collections
+        for handler in list(self._cleanup_handlers):
+            try:
+                handler()
+            except:
+                pass
+        
+        for owner_ref, functions in list(self._cleanup_methods.values()):
+            owner = owner_ref()
+            if owner is None:
+                continue
+            for function in list(functions):
                 try:
-                    handler()
+                    function(owner)
                 except:
                     pass
         
-        # Clean up dead references
-        self._cleanup_handlers -= dead_refs
-        
         # Force terminal restoration
         self._force_terminal_restore()
     
     def _force_terminal_restore(self):
         """Force restore terminal to sane state."""
         try:
-            # Send reset sequences directly
-            reset_sequences = [
-                '\033[?1049l',  # Exit alternate screen
-                '\033[?25h',    # Show cursor
-                '\033[0m',      # Reset attributes
-                '\033[?1000l',  # Disable X11 mouse
-                '\033[?1006l',  # Disable SGR mouse
-                '\033[?1002l',  # Disable cell motion tracking
-                '\033[?1003l',  # Disable all motion tracking
-            ]
-            
-            for seq in reset_sequences:
-                try:
-                    sys.stdout.write(seq)
-                except:
-                    pass
-            
+            # Flush anything still buffered so it cannot land after the reset
             try:
                 sys.stdout.flush()
             except:
                 pass
             
+            # Send every reset sequence in a single unbuffered write
+            try:
+                os.write(sys.stdout.fileno(), _RESET_BLOB)
+            except (AttributeError, OSError, ValueError):
+                try:
+                    sys.stdout.buffer.write(_RESET_BLOB)
+                    sys.stdout.buffer.flush()
+                except:
+                    pass
+            
             # Restore terminal settings
             if self._original_termios and self._stdin_fd is not None:
                 import termios
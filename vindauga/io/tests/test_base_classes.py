@@ -5,11 +5,13 @@ Unit tests for abstract base classes.
 Tests for Display and InputHandler abstract base classes.
 """
 
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 from vindauga.io.display.base import Display
 from vindauga.io.display.buffer import DisplayBuffer, ScreenCell
-from vindauga.io.input.base import InputHandler
+from vindauga.io.input.base import InputHandler, create_read_selector
 from vindauga.events.event import Event
 
 
@@ -349,6 +351,28 @@ class TestInputHandlerBase(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             with self.input_handler:
                 pass
+    
+    def test_read_selector(self):
+        """Test the read selector reports pending input on a pipe."""
+        read_fd, write_fd = os.pipe()
+        selector = create_read_selector(read_fd)
+        try:
+            self.assertEqual(selector.select(0), [])
+            os.write(write_fd, b'x')
+            self.assertEqual(len(selector.select(0)), 1)
+        finally:
+            selector.close()
+            os.close(read_fd)
+            os.close(write_fd)
+    
+    def test_read_selector_regular_file(self):
+        """Test the read selector falls back for descriptors epoll rejects."""
+        with tempfile.TemporaryFile() as handle:
+            selector = create_read_selector(handle.fileno())
+            try:
+                self.assertEqual(len(selector.select(0)), 1)
+            finally:
+                selector.close()
 
 
 if __name__ == '__main__':
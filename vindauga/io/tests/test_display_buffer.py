@@ -87,6 +87,29 @@ class TestDisplayBuffer(unittest.TestCase):
         self.assertTrue(damage.contains(10))
         self.assertTrue(damage.contains(11))
     
+    def test_wide_trail_shared(self):
+        """Test trail cells are shared and replaced when written over."""
+        from vindauga.io.screen_cell import WIDE_TRAIL
+        self.buffer.put_text(0, 0, '中文')
+        self.assertIs(self.buffer.get_cell(1, 0), WIDE_TRAIL)
+        self.assertIs(self.buffer.get_cell(3, 0), WIDE_TRAIL)
+        
+        self.buffer.put_char(1, 0, 'x')
+        self.assertEqual(self.buffer.get_cell(1, 0).char, 'x')
+        self.assertEqual(WIDE_TRAIL.char, '')
+        
+        self.buffer.clear_rect(3, 0, 1, 1)
+        self.assertEqual(self.buffer.get_cell(3, 0).char, ' ')
+        self.assertEqual(WIDE_TRAIL.char, '')
+    
+    def test_wide_trail_skipped_by_dirty_bookkeeping(self):
+        """Test clearing or marking damage leaves the shared trail alone."""
+        self.buffer.put_text(0, 0, '中')
+        self.buffer.clear_damage()
+        self.buffer.mark_all_dirty()
+        self.assertTrue(self.buffer.get_cell(0, 0).dirty)
+        self.assertFalse(self.buffer.get_cell(1, 0).dirty)
+    
     def test_put_text(self):
         """Test putting text strings."""
         written = self.buffer.put_text(10, 5, "Hello", fg=3, bg=5)
@@ -248,6 +271,28 @@ class TestDisplayBuffer(unittest.TestCase):
         # Cells should also be marked clean
         for x in range(10, 15):
             self.assertFalse(self.buffer.get_cell(x, 5).dirty)
+        
+        # Cells dirtied outside any damaged span are swept too
+        self.buffer.get_cell(0, 0).mark_dirty()
+        self.buffer.clear_damage()
+        self.assertFalse(self.buffer.get_cell(0, 0).dirty)
+    
+    def test_clear_damage_cleans_all_cells(self):
+        """Test clear_damage resets every cell's dirty flag."""
+        # A new buffer starts out fully dirty
+        self.assertTrue(all(cell.dirty for row in self.buffer.cells for cell in row))
+        self.buffer.clear_damage()
+        self.assertFalse(any(cell.dirty for row in self.buffer.cells for cell in row))
+        
+        self.buffer.put_text(10, 5, "Hi")
+        dirty = [(x, y) for y, row in enumerate(self.buffer.cells)
+                 for x, cell in enumerate(row) if cell.dirty]
+        self.assertEqual(dirty, [(10, 5), (11, 5)])
+        self.assertEqual(self.buffer.damage[5].get_bounds(), (10, 12))
+        
+        self.buffer.scroll_up(1)
+        self.buffer.clear_damage()
+        self.assertFalse(any(cell.dirty for row in self.buffer.cells for cell in row))
     
     def test_mark_all_dirty(self):
         """Test marking entire buffer as dirty."""
@@ -301,6 +346,22 @@ class TestDisplayBuffer(unittest.TestCase):
         buffer = DisplayBuffer(80, 25, fps=0)
         self.assertTrue(buffer.should_update())
         self.assertTrue(buffer.should_update())  # Always true
+    
+    def test_diff(self):
+        """Test diff reports only rows and columns that display differently."""
+        previous = DisplayBuffer(80, 25)
+        self.assertEqual(list(self.buffer.diff(previous)), [])
+        
+        self.buffer.put_text(2, 3, "ab")
+        self.buffer.set_attrs(10, 7, 1, 4)
+        self.assertEqual(list(self.buffer.diff(previous)), [(3, [2, 3]), (7, [10])])
+        
+        previous.get_cell(10, 7).dirty = False
+        self.buffer.clear_damage()
+        self.assertEqual(list(self.buffer.diff(previous)), [(3, [2, 3]), (7, [10])])
+        
+        with self.assertRaises(ValueError):
+            list(self.buffer.diff(DisplayBuffer(40, 25)))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for EventCoalescer class."""
+
+import time
+import unittest
+from vindauga.io.event_coalescer import (EventCoalescer, KeyEvent, MouseMoveEvent, ResizeEvent,
+                                         MOD_CTRL, MOD_ALT, MOD_SHIFT, now_ns)
+
+
+class TestKeyEvent(unittest.TestCase):
+    """Test cases for KeyEvent class."""
+
+    def test_modifier_properties(self):
+        """Test modifier flags are derived from the packed mods field."""
+        event = KeyEvent('a', mods=MOD_CTRL | MOD_SHIFT)
+        self.assertTrue(event.ctrl)
+        self.assertFalse(event.alt)
+        self.assertTrue(event.shift)
+
+        event = KeyEvent('a')
+        self.assertFalse(event.ctrl or event.alt or event.shift)
+
+    def test_modifier_keywords(self):
+        """Test the old ctrl/alt/shift keywords fold into mods."""
+        self.assertEqual(KeyEvent('a', ctrl=True, shift=True), KeyEvent('a', mods=MOD_CTRL | MOD_SHIFT))
+        self.assertEqual(KeyEvent('a', mods=MOD_ALT, ctrl=True).mods, MOD_ALT | MOD_CTRL)
+
+    def test_old_positional_modifiers_rejected(self):
+        """Test old positional (key, ctrl, alt, shift) calls fail loudly."""
+        with self.assertRaises(TypeError):
+            KeyEvent('a', False, True)
+
+    def test_coalesce_requires_same_modifiers(self):
+        """Test key events only coalesce with identical modifiers."""
+        first = KeyEvent('a', mods=MOD_ALT)
+        self.assertTrue(first.can_coalesce_with(KeyEvent('a', mods=MOD_ALT)))
+        self.assertFalse(first.can_coalesce_with(KeyEvent('a', mods=MOD_CTRL)))
+        self.assertFalse(first.can_coalesce_with(KeyEvent('b', mods=MOD_ALT)))
+
+
+class TestMouseMoveEvent(unittest.TestCase):
+    """Test cases for MouseMoveEvent pooling."""
+
+    def setUp(self):
+        MouseMoveEvent._pool.clear()
+        self.addCleanup(MouseMoveEvent._pool.clear)
+
+    def test_acquire_reuses_released(self):
+        """Test released events are handed back out by acquire."""
+        event = MouseMoveEvent.acquire(1, 2, 3)
+        event.release()
+        reused = MouseMoveEvent.acquire(4, 5, 6)
+        self.assertIs(reused, event)
+        self.assertEqual((reused.x, reused.y, reused.timestamp), (4, 5, 6))
+
+    def test_events_have_no_dict(self):
+        """Test coalesceable events use slots rather than a per-instance dict."""
+        for event in (MouseMoveEvent(1, 2, 3), KeyEvent('a'), ResizeEvent(80, 24, 0)):
+            self.assertFalse(hasattr(event, '__dict__'))
+    
+    def test_coalesced_moves_are_recycled(self):
+        """Test the coalescer releases superseded mouse moves."""
+        coalescer = EventCoalescer()
+        first = MouseMoveEvent.acquire(1, 1)
+        coalescer.add_event(first)
+        coalescer.add_event(MouseMoveEvent.acquire(2, 2))
+        self.assertEqual(MouseMoveEvent._pool, [first])
+
+    def test_caller_owned_moves_not_recycled(self):
+        """Test moves built by the caller never enter the pool."""
+        coalescer = EventCoalescer()
+        first = MouseMoveEvent(1, 1, 0)
+        coalescer.add_event(first)
+        coalescer.add_event(MouseMoveEvent(2, 2, 0))
+        self.assertEqual(MouseMoveEvent._pool, [])
+        self.assertIsNot(MouseMoveEvent.acquire(3, 3), first)
+
+
+class TestEventCoalescer(unittest.TestCase):
+    """Test cases for EventCoalescer class."""
+
+    def setUp(self):
+        self.coalescer = EventCoalescer()
+        MouseMoveEvent._pool.clear()
+        self.addCleanup(MouseMoveEvent._pool.clear)
+
+    def test_key_repeat_coalescing(self):
+        """Test repeated keys are folded into a single event."""
+        self.assertIsNone(self.coalescer.add_event(KeyEvent('a')))
+        self.assertIsNone(self.coalescer.add_event(KeyEvent('a')))
+        output = self.coalescer.add_event(KeyEvent('b'))
+        self.assertEqual(output.key, 'a')
+        self.assertEqual(output.repeat_count, 2)
+
+    def test_key_repeat_cap(self):
+        """Test a held key is released once it reaches max_key_repeat."""
+        coalescer = EventCoalescer(max_key_repeat=3)
+        self.assertIsNone(coalescer.add_event(KeyEvent('a')))
+        self.assertIsNone(coalescer.add_event(KeyEvent('a')))
+        output = coalescer.add_event(KeyEvent('a'))
+        self.assertEqual(output.repeat_count, 3)
+        self.assertEqual(coalescer.flush(), [])
+
+    def test_mouse_coalescing_keeps_latest(self):
+        """Test rapid mouse moves keep only the latest position."""
+        self.coalescer.add_event(MouseMoveEvent(1, 1, 0))
+        self.coalescer.add_event(MouseMoveEvent(2, 3, 0))
+        pending = self.coalescer.flush()
+        self.assertEqual(len(pending), 1)
+        self.assertEqual((pending[0].x, pending[0].y), (2, 3))
+
+    def test_flush(self):
+        """Test flush returns all held events and clears them."""
+        self.coalescer.add_event(MouseMoveEvent(1, 1, 0))
+        self.coalescer.add_event(KeyEvent('a'))
+        self.coalescer.add_event(ResizeEvent(80, 24, 0))
+        self.assertEqual(len(self.coalescer.flush()), 3)
+        self.assertEqual(self.coalescer.flush(), [])
+
+    def test_get_pending_event_ages_out(self):
+        """Test held events are released once their window has passed."""
+        coalescer = EventCoalescer(mouse_coalesce_time=0.01, key_coalesce_time=10)
+        coalescer.add_event(KeyEvent('a'))
+        coalescer.add_event(MouseMoveEvent(4, 5, 0))
+        coalescer.last_mouse_event.timestamp -= 1_000_000_000
+        event = coalescer.get_pending_event()
+        self.assertIsInstance(event, MouseMoveEvent)
+        self.assertIsNone(coalescer.get_pending_event())
+        self.assertIsNotNone(coalescer.last_key_event)
+
+    def test_holding_flag(self):
+        """Test holding tracks whether any events may be held."""
+        coalescer = EventCoalescer(key_coalesce_time=0.01)
+        self.assertFalse(coalescer.holding)
+        coalescer.add_event(KeyEvent('a'))
+        self.assertTrue(coalescer.holding)
+        
+        self.assertIsNone(coalescer.get_pending_event())
+        self.assertTrue(coalescer.holding)
+        coalescer.last_key_event.timestamp -= 1_000_000_000
+        self.assertIsNotNone(coalescer.get_pending_event())
+        self.assertIsNone(coalescer.get_pending_event())
+        self.assertFalse(coalescer.holding)
+        
+        coalescer.add_event(KeyEvent('a'))
+        coalescer.flush()
+        self.assertFalse(coalescer.holding)
+    
+    def test_thresholds_in_nanoseconds(self):
+        """Test time windows are pre-scaled to integer nanoseconds."""
+        coalescer = EventCoalescer(mouse_coalesce_time=0.016, key_coalesce_time=0.05,
+                                   resize_coalesce_time=0.1)
+        self.assertEqual(coalescer.mouse_coalesce_ns, 16_000_000)
+        self.assertEqual(coalescer.key_coalesce_ns, 50_000_000)
+        self.assertEqual(coalescer.resize_coalesce_ns, 100_000_000)
+
+    def test_key_outside_window_not_coalesced(self):
+        """Test a key arriving after the window is released separately."""
+        coalescer = EventCoalescer(key_coalesce_time=0.01)
+        coalescer.add_event(KeyEvent('a'))
+        coalescer.last_key_event.timestamp -= 1_000_000_000
+        output = coalescer.add_event(KeyEvent('a'))
+        self.assertEqual(output.repeat_count, 1)
+
+    def test_supplied_timestamp_kept(self):
+        """Test an arrival time taken from now_ns is kept, a missing one stamped."""
+        arrived = now_ns() - 1_000_000_000
+        self.coalescer.add_event(MouseMoveEvent(1, 1, arrived))
+        self.assertEqual(self.coalescer.last_mouse_event.timestamp, arrived)
+        self.assertIsNotNone(self.coalescer.get_pending_event())
+
+        self.coalescer.add_event(KeyEvent('a'))
+        self.assertGreater(self.coalescer.last_key_event.timestamp, arrived)
+
+    def test_float_timestamp_restamped(self):
+        """Test an old-style time.time() timestamp is replaced with now_ns."""
+        before = now_ns()
+        self.coalescer.add_event(MouseMoveEvent(1, 1, time.time()))
+        timestamp = self.coalescer.last_mouse_event.timestamp
+        self.assertIs(type(timestamp), int)
+        self.assertGreaterEqual(timestamp, before)
+
+    def test_max_queue_size_deprecated(self):
+        """Test the old max_queue_size argument is still accepted."""
+        with self.assertWarns(DeprecationWarning):
+            coalescer = EventCoalescer(0.016, 0.05, 0.1, 100)
+        self.assertEqual(coalescer.max_key_repeat, 32)
+
+    def test_stats_disabled_by_default(self):
+        """Test counters stay untouched unless stats are enabled."""
+        self.coalescer.add_event(KeyEvent('a'))
+        self.coalescer.flush()
+        self.assertEqual(self.coalescer.get_stats()['events_received'], 0)
+
+        self.coalescer.enable_stats()
+        self.coalescer.add_event(KeyEvent('a'))
+        self.assertEqual(self.coalescer.get_stats()['events_received'], 1)
+
+    def test_stats_snapshot_cached(self):
+        """Test stats are recomputed only when the counters change."""
+        self.coalescer.enable_stats()
+        self.coalescer.add_event(KeyEvent('a'))
+        self.coalescer.add_event(KeyEvent('a'))
+        stats = self.coalescer.get_stats()
+        self.assertEqual(stats['events_received'], 2)
+        self.assertEqual(stats['events_coalesced'], 1)
+        self.assertAlmostEqual(stats['coalesce_ratio'], 0.5)
+        self.assertIs(self.coalescer.get_stats(), stats)
+
+        self.coalescer.flush()
+        stats = self.coalescer.get_stats()
+        self.assertEqual(stats['events_output'], 1)
+        self.assertAlmostEqual(stats['reduction_ratio'], 0.5)
+
+    def test_stats_mapping(self):
+        """Test the stats behave as the read-only mapping get_stats returns."""
+        self.coalescer.enable_stats()
+        self.coalescer.add_event(KeyEvent('a'))
+        stats = self.coalescer.get_stats()
+        self.assertEqual(stats['events_received'], 1)
+        self.assertIn('events_received', stats)
+        self.assertEqual(list(stats), ['events_received', 'events_coalesced', 'events_output',
+                                       'coalesce_ratio', 'reduction_ratio'])
+        self.assertEqual(dict(stats.items()), dict(stats))
+        self.assertEqual(stats.get('events_output'), 0)
+        self.assertIsNone(stats.get('count'))
+        with self.assertRaises(KeyError):
+            stats['count']
+        with self.assertRaises(TypeError):
+            stats['events_received'] = 0
+
+    def test_passthrough(self):
+        """Test unknown events pass straight through."""
+        event = object()
+        self.assertIs(self.coalescer.add_event(event), event)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,13 +6,14 @@ Unit tests for Phase 2 platform backends.
 import unittest
 import sys
 import os
+import io
 from unittest.mock import MagicMock, patch, PropertyMock
 from io import StringIO
 
 from vindauga.io.display.ansi import ANSIDisplay
 from vindauga.io.display.termio import TermIODisplay
 from vindauga.io.display.curses import CursesDisplay
-from vindauga.io.input.ansi import ANSIInput, ANSIEscapeParser, ParsedKey, ParsedMouse
+from vindauga.io.input.ansi import ANSIInput, ANSIEscapeParser, ParsedKey, ParsedMouse, ParserState
 from vindauga.io.input.termio import TermIOInput
 from vindauga.io.input.curses import CursesInput, CursesKeyEvent, CursesMouseEvent
 from vindauga.io import PlatformIO, PlatformType
@@ -20,6 +21,34 @@ from vindauga.io.display_buffer import DisplayBuffer
 from vindauga.io.screen_cell import ScreenCell
 
 
+def _attach_pipe(test, handler, selector=None):
+    """
+    Point an input handler at a non-blocking pipe and return its write end.
+    
+    The pipe and everything attached to it are closed when the test ends.
+    A selector may be supplied; otherwise one is built for the pipe.
+    """
+    import fcntl
+    from vindauga.io.input.base import create_read_selector
+    
+    read_fd, write_fd = os.pipe()
+    test.addCleanup(os.close, read_fd)
+    test.addCleanup(os.close, write_fd)
+    flags = fcntl.fcntl(read_fd, fcntl.F_GETFL)
+    fcntl.fcntl(read_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+    
+    handler.stdin_fd = read_fd
+    if selector is None:
+        selector = create_read_selector(read_fd)
+        test.addCleanup(selector.close)
+    handler._selector = selector
+    if isinstance(handler, TermIOInput):
+        handler._stdin_file = io.FileIO(read_fd, 'rb', closefd=False)
+        test.addCleanup(handler._stdin_file.close)
+    handler._initialized = True
+    return write_fd
+
+
 class TestANSIDisplay(unittest.TestCase):
     """Test cases for ANSI display backend."""
     
@@ -68,6 +97,20 @@ class TestANSIDisplay(unittest.TestCase):
             self.assertFalse(display.has_24bit_color)
             self.assertTrue(display.has_256_color)
     
+    def test_attr_sequences(self):
+        """Test SGR sequences for each color depth."""
+        display = self.display
+        self.assertEqual(display._build_attr_sequence(7, 0, 0), '\x1b[0m')
+        self.assertEqual(display._build_attr_sequence(1, 12, ScreenCell.ATTR_BOLD | ScreenCell.ATTR_REVERSE),
+                         '\x1b[0;1;7;31;104m')
+        
+        display.has_256_color = True
+        self.assertEqual(display._build_attr_sequence(200, 0, 0), '\x1b[0;38;5;200;40m')
+        
+        display.has_24bit_color = True
+        self.assertEqual(display._build_attr_sequence(0x123456, 3, ScreenCell.ATTR_UNDERLINE),
+                         '\x1b[0;4;38;2;18;52;86;43m')
+    
     def test_buffer_flushing(self):
         """Test buffer flushing with damage tracking."""
         buffer = DisplayBuffer(10, 5)
@@ -119,6 +162,71 @@ class TestANSIEscapeParser(unittest.TestCase):
         self.assertEqual(result.key, 'A')
         self.assertTrue(result.ctrl)
     
+    def test_backspace_and_unmapped_controls(self):
+        """Test DEL maps to Backspace and unmapped control bytes are dropped."""
+        self.assertEqual(self.parser.parse_byte(0x7F).key, 'Backspace')
+        self.assertEqual(self.parser.parse_byte(0x08).key, 'Backspace')
+        self.assertIsNone(self.parser.parse_byte(0x00))
+        self.assertIsNone(self.parser.parse_byte(0x1C))
+    
+    def test_feed_matches_parse_byte(self):
+        """Test feed gives the same results as parsing byte by byte."""
+        data = b'ab\x1b[5;5~\tc\x1b[<0;3;4M\x1bOQ\x01\x1b[1'
+        expected = [result for result in map(ANSIEscapeParser().parse_byte, data) if result]
+        
+        # Split mid-sequence so the second chunk continues a partial CSI
+        results = self.parser.feed(data[:5]) + self.parser.feed(data[5:])
+        self.assertEqual(results, expected)
+        self.assertEqual(self.parser.state, ParserState.CSI)
+    
+    def test_feed_coalesces_moves(self):
+        """Test feed skips all but the last move of a drag when asked."""
+        data = (b'\x1b[<32;1;1M\x1b[<32;2;1M\x1b[<0;2;1M\x1b[<32;3;1M'
+                b'\x1b[<32;4;1M\x1b[<33;5;1M\x1b[64;6;1M\x1b[64;7;1M')
+        self.assertEqual(self.parser.feed(data, coalesce_moves=True), [
+            ParsedMouse(1, 0, 0, 'move'),
+            ParsedMouse(1, 0, 0, 'press'),
+            ParsedMouse(3, 0, 0, 'move'),
+            ParsedMouse(4, 0, 1, 'move'),
+            ParsedMouse(5, 0, 4, 'wheel'),
+            ParsedMouse(6, 0, 4, 'wheel'),
+        ])
+        self.assertEqual(len(self.parser.feed(data)), 8)
+    
+    def test_parsed_keys_interned(self):
+        """Test repeated keystrokes reuse the same immutable ParsedKey."""
+        first = self.parser.parse_byte(ord('a'))
+        self.assertIs(self.parser.parse_byte(ord('a')), first)
+        
+        keys = [self.parser.parse_byte(byte) for byte in b'\x1b[5;5~\x1b[5;5~']
+        self.assertIs(keys[5], keys[11])
+        self.assertEqual(keys[5], ParsedKey('PageUp', ctrl=True))
+        
+        with self.assertRaises(AttributeError):
+            first.key = 'b'
+    
+    def test_mouse_sequences(self):
+        """Test X11 and SGR mouse reports decode to ParsedMouse."""
+        cases = [
+            (b'\x1b[0;10;5M', ParsedMouse(9, 4, 0, 'press')),
+            (b'\x1b[<2;10;5M', ParsedMouse(9, 4, 2, 'press')),
+            (b'\x1b[<0;10;5m', ParsedMouse(9, 4, 0, 'release')),
+            (b'\x1b[<32;3;4M', ParsedMouse(2, 3, 0, 'move')),
+            (b'\x1b[<65;1;1M', ParsedMouse(0, 0, 5, 'wheel')),
+            (b'\x1b[<20;1;1M', ParsedMouse(0, 0, 0, 'press', ctrl=True, shift=True)),
+        ]
+        for data, expected in cases:
+            with self.subTest(data=data):
+                results = [self.parser.parse_byte(byte) for byte in data]
+                self.assertEqual(results[-1], expected)
+                self.assertEqual(self.parser.state, ParserState.NORMAL)
+                self.assertEqual(self.parser.parse_csi_sequence(data[2:-1], b'', data[-1]), expected)
+    
+    def test_parsed_events_have_no_dict(self):
+        """Test parsed events use slots rather than a per-instance dict."""
+        self.assertFalse(hasattr(ParsedKey('a'), '__dict__'))
+        self.assertFalse(hasattr(ParsedMouse(0, 0, 0, 'press'), '__dict__'))
+    
     def test_escape_sequences(self):
         """Test parsing of escape sequences."""
         # Arrow up: ESC [ A
@@ -141,6 +249,18 @@ class TestANSIEscapeParser(unittest.TestCase):
         self.assertIsInstance(result, ParsedKey)
         self.assertEqual(result.key, 'F1')
     
+    def test_csi_parameter_accumulation(self):
+        """Test CSI parameters are accumulated as integers."""
+        for byte in b'\x1b[5;;12':
+            self.parser.parse_byte(byte)
+        self.assertEqual(self.parser.sequence_params, [5, -1])
+        
+        # Ctrl+PageUp: ESC [ 5 ; 5 ~
+        self.parser.reset()
+        results = [self.parser.parse_byte(byte) for byte in b'\x1b[5;5~']
+        self.assertEqual(results[-1], ParsedKey('PageUp', ctrl=True))
+        self.assertEqual(self.parser.sequence_params, [])
+    
     def test_parser_reset(self):
         """Test parser reset functionality."""
         # Start an escape sequence
@@ -150,6 +270,20 @@ class TestANSIEscapeParser(unittest.TestCase):
         # Should parse normally again
         result = self.parser.parse_byte(ord('A'))
         self.assertEqual(result.key, 'A')
+    
+    def test_parser_state_tracking(self):
+        """Test parser state follows the escape sequence and recovers."""
+        self.parser.parse_byte(0x1B)
+        self.assertEqual(self.parser.state, ParserState.ESC)
+        self.parser.parse_byte(ord('['))
+        self.assertEqual(self.parser.state, ParserState.CSI)
+        self.parser.parse_byte(ord('A'))
+        self.assertEqual(self.parser.state, ParserState.NORMAL)
+        
+        # Unsupported states reset the parser
+        self.parser.state = ParserState.OSC
+        self.assertIsNone(self.parser.parse_byte(ord('A')))
+        self.assertEqual(self.parser.state, ParserState.NORMAL)
 
 
 class TestTermIODisplay(unittest.TestCase):
@@ -224,6 +358,108 @@ class TestANSIInput(unittest.TestCase):
         result = self.input_handler.initialize()
         self.assertTrue(result)
         self.assertTrue(self.input_handler.is_initialized)
+    
+    def test_queue_input_matches_parser(self):
+        """Test bulk text parsing produces the same events as the parser."""
+        data = b'hi \x1b[A\x01x\x1b[<0;10;20Mok\x1bOP'
+        expected = [result for result in map(ANSIEscapeParser().parse_byte, data) if result]
+        
+        self.input_handler._queue_input(data)
+        self.assertEqual(list(self.input_handler.event_queue), expected)
+    
+    def test_queue_input_coalesces_drag(self):
+        """Test consecutive mouse moves of one drag keep only the latest."""
+        data = b'\x1b[<32;1;1M\x1b[<32;2;1M\x1b[<32;3;1M\x1b[<48;4;1M\x1b[<32;5;1M'
+        self.input_handler._queue_input(data[:22])
+        self.input_handler._queue_input(data[22:])
+        self.assertEqual(list(self.input_handler.event_queue), [
+            ParsedMouse(2, 0, 0, 'move'),
+            ParsedMouse(3, 0, 0, 'move', ctrl=True),
+            ParsedMouse(4, 0, 0, 'move'),
+        ])
+    
+    def test_get_event_drains_pipe(self):
+        """Test get_event reads all pending chunks into the reusable buffer."""
+        write_fd = _attach_pipe(self, self.input_handler)
+        handler = self.input_handler
+        
+        os.write(write_fd, b'ab')
+        os.write(write_fd, b'\x1b[A')
+        self.assertEqual(handler.get_event().key, 'a')
+        self.assertEqual([event.key for event in handler.event_queue], ['b', 'Up'])
+    
+    def test_get_events_batches(self):
+        """Test get_events returns queued and newly read events in order."""
+        write_fd = _attach_pipe(self, self.input_handler)
+        handler = self.input_handler
+        
+        os.write(write_fd, b'abc')
+        self.assertEqual(handler.get_event().key, 'a')
+        os.write(write_fd, b'\x1b[B')
+        events = handler.get_events(3)
+        self.assertEqual([event.key for event in events], ['b', 'c', 'Down'])
+        self.assertEqual(handler.get_events(), [])
+    
+    def test_has_events_ignores_partial_sequence(self):
+        """Test has_events stays False until an escape sequence completes."""
+        write_fd = _attach_pipe(self, self.input_handler)
+        handler = self.input_handler
+        
+        os.write(write_fd, b'\x1b[5')
+        self.assertFalse(handler.has_events())
+        os.write(write_fd, b';5~')
+        self.assertTrue(handler.has_events())
+        self.assertEqual(handler.parser.state, ParserState.NORMAL)
+
+
+class TestImprovedANSIInput(unittest.TestCase):
+    """Test cases for the improved ANSI input handler."""
+    
+    def test_poll_reads_without_select(self):
+        """Test a zero-timeout poll reads the non-blocking fd directly."""
+        from vindauga.io.input.ansi_improved import ImprovedANSIInput
+        
+        handler = ImprovedANSIInput(enable_coalescing=False)
+        write_fd = _attach_pipe(self, handler, selector=MagicMock())
+        
+        self.assertIsNone(handler.get_event(0))
+        self.assertEqual(handler.error_count, 0)
+        
+        os.write(write_fd, b'ab')
+        self.assertEqual(handler.get_event(0).key, 'a')
+        self.assertEqual(handler.get_event(0).key, 'b')
+        handler._selector.select.assert_not_called()
+    
+    def test_batch_converts_mouse_moves(self):
+        """Test the batch path returns moves as get_event would, reduced to the last."""
+        from vindauga.io.input.ansi_improved import ImprovedANSIInput
+        from vindauga.io.event_coalescer import MouseMoveEvent
+        
+        handler = ImprovedANSIInput()
+        write_fd = _attach_pipe(self, handler)
+        
+        os.write(write_fd, b'\x1b[<35;1;1M\x1b[<35;2;1Ma\x1b[<35;3;1M')
+        events = handler.get_events()
+        self.assertEqual(len(events), 3)
+        self.assertIsInstance(events[0], MouseMoveEvent)
+        self.assertEqual(events[1].key, 'a')
+        self.assertIsInstance(events[2], MouseMoveEvent)
+        self.assertEqual((events[0].x, events[2].x), (1, 2))
+    
+    def test_batch_bounded_by_max_count(self):
+        """Test max_count bounds flushed and newly read events together."""
+        from vindauga.io.input.ansi_improved import ImprovedANSIInput
+        
+        handler = ImprovedANSIInput()
+        write_fd = _attach_pipe(self, handler)
+        
+        os.write(write_fd, b'\x1b[<35;1;1M')
+        self.assertIsNone(handler.get_event())
+        os.write(write_fd, b'abc')
+        events = handler.get_events(2)
+        self.assertEqual(len(events), 2)
+        self.assertEqual(events[1].key, 'a')
+        self.assertEqual([event.key for event in handler.get_events(5)], ['b', 'c'])
 
 
 class TestTermIOInput(unittest.TestCase):
@@ -238,6 +474,65 @@ class TestTermIOInput(unittest.TestCase):
         self.assertFalse(self.input_handler.is_initialized)
         self.assertIsNotNone(self.input_handler.parser)
         self.assertIsNone(self.input_handler.stdin_fd)
+    
+    def test_get_event_across_reads(self):
+        """Test events split across reads are completed by the parser."""
+        write_fd = _attach_pipe(self, self.input_handler)
+        handler = self.input_handler
+        
+        os.write(write_fd, b'ab\x1b[5')
+        self.assertEqual(handler.get_event().key, 'a')
+        self.assertEqual(handler.get_event().key, 'b')
+        self.assertIsNone(handler.get_event())
+        os.write(write_fd, b';5~')
+        self.assertEqual(handler.get_event(), ParsedKey('PageUp', ctrl=True))
+        self.assertFalse(handler.has_events())
+    
+    def test_get_event_waits_for_split_sequence(self):
+        """Test a sequence split across reads is completed in one call."""
+        from vindauga.io.input.termio import ESCAPE_WAIT_STEP
+        
+        write_fd = _attach_pipe(self, self.input_handler)
+        handler = self.input_handler
+        select = handler._selector.select
+        
+        def deliver_rest(timeout):
+            if timeout == ESCAPE_WAIT_STEP:
+                os.write(write_fd, b';5~')
+            return select(timeout)
+        
+        os.write(write_fd, b'\x1b[5')
+        with patch.object(handler._selector, 'select', side_effect=deliver_rest):
+            self.assertEqual(handler.get_event(), ParsedKey('PageUp', ctrl=True))
+        self.assertFalse(handler.parser.in_sequence)
+    
+    def test_eager_read_skips_wait(self):
+        """Test eager reads only wait on the selector when stdin is idle."""
+        write_fd = _attach_pipe(self, self.input_handler)
+        handler = self.input_handler
+        handler.eager_read = True
+        
+        os.write(write_fd, b'x')
+        with patch.object(handler._selector, 'select') as mock_select:
+            self.assertEqual(handler.get_event(1.0).key, 'x')
+            mock_select.assert_not_called()
+            
+            mock_select.return_value = []
+            self.assertIsNone(handler.get_event(1.0))
+            mock_select.assert_called_once_with(1.0)
+    
+    def test_flush_input_discards_pending(self):
+        """Test flush_input drops queued events and unread input."""
+        write_fd = _attach_pipe(self, self.input_handler)
+        handler = self.input_handler
+        
+        os.write(write_fd, b'ab')
+        handler.get_event()
+        os.write(write_fd, b'c' * 10000 + b'\x1b[')
+        handler.flush_input()
+        self.assertFalse(handler.has_events())
+        os.write(write_fd, b'd')
+        self.assertEqual(handler.get_event().key, 'd')
 
 
 class TestCursesInput(unittest.TestCase):
@@ -262,6 +557,37 @@ class TestCursesInput(unittest.TestCase):
         self.assertEqual(self.input_handler.key_map[curses.KEY_UP], 'Up')
         self.assertEqual(self.input_handler.key_map[curses.KEY_DOWN], 'Down')
         self.assertEqual(self.input_handler.key_map[curses.KEY_F1], 'F1')
+    
+    def test_ascii_key_events(self):
+        """Test ASCII codes map to shared key events."""
+        process = self.input_handler._process_key_event
+        self.assertEqual(process(ord('a')), CursesKeyEvent('a', ord('a')))
+        self.assertEqual(process(1), CursesKeyEvent('A', 1, ctrl=True))
+        self.assertEqual(process(9).key, 'Tab')
+        self.assertEqual(process(27).key, 'Escape')
+        self.assertIsNone(process(127))
+        self.assertIs(process(ord('a')), process(ord('a')))
+    
+    def test_events_have_no_dict(self):
+        """Test curses events use slots rather than a per-instance dict."""
+        for event in (CursesKeyEvent('a', ord('a')), CursesMouseEvent(1, 2, 1, 'press')):
+            self.assertFalse(hasattr(event, '__dict__'))
+    
+    def test_has_events_polls_terminal(self):
+        """Test has_events checks the terminal without reading from curses."""
+        from vindauga.io.input.base import create_read_selector
+        
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, write_fd)
+        handler = self.input_handler
+        handler._selector = create_read_selector(read_fd)
+        self.addCleanup(handler._selector.close)
+        
+        self.assertFalse(handler.has_events())
+        os.write(write_fd, b'a')
+        self.assertTrue(handler.has_events())
+        handler.stdscr.getch.assert_not_called()
 
 
 class TestPlatformIO(unittest.TestCase):
@@ -9,7 +9,7 @@ import unittest
 import os
 import sys
 from unittest.mock import patch, MagicMock
-from vindauga.io.platform import PlatformDetector, PlatformType, PlatformCapabilities
+from vindauga.io.platform import PlatformDetector, PlatformType, PlatformCapabilities, PlatformIO
 
 
 class TestPlatformType(unittest.TestCase):
@@ -51,6 +51,23 @@ class TestPlatformCapabilities(unittest.TestCase):
         self.assertEqual(caps.max_colors, 256)
         self.assertTrue(caps.is_available)
     
+    def test_from_detected(self):
+        """Test conversion from platform_detector capabilities."""
+        from vindauga.io import platform_detector
+        detected = platform_detector.PlatformCapabilities(
+            name="ANSI", available=True, color_support=16777216,
+            mouse_support=True, unicode_support=True
+        )
+        caps = PlatformCapabilities.from_detected(detected)
+        self.assertTrue(caps.is_available)
+        self.assertTrue(caps.has_colors)
+        self.assertTrue(caps.has_24bit_color)
+        self.assertEqual(caps.max_colors, 16777216)
+        
+        caps = PlatformCapabilities.from_detected(platform_detector.PlatformCapabilities(name="Win32"))
+        self.assertFalse(caps.is_available)
+        self.assertFalse(caps.has_colors)
+    
     def test_scoring(self):
         """Test capability scoring."""
         # High capability platform
@@ -91,10 +108,8 @@ class TestPlatformDetector(unittest.TestCase):
         """Test ANSI terminal detection."""
         # Mock terminal environment
         with patch.dict(os.environ, {'TERM': 'xterm-256color', 'COLORTERM': 'truecolor'}):
-            with patch('sys.stdout') as mock_stdout:
-                mock_stdout.isatty.return_value = True
-                
-                caps = self.detector.get_ansi_capabilities()
+            with patch('os.isatty', return_value=True):
+                caps = PlatformDetector().get_ansi_capabilities()
                 
                 self.assertTrue(caps.is_available)
                 self.assertTrue(caps.has_colors)
@@ -105,41 +120,42 @@ class TestPlatformDetector(unittest.TestCase):
     
     def test_ansi_detection_no_terminal(self):
         """Test ANSI detection when not in a terminal."""
-        with patch('sys.stdout') as mock_stdout:
-            mock_stdout.isatty.return_value = False
-            
-            caps = self.detector.get_ansi_capabilities()
+        with patch('os.isatty', return_value=False):
+            caps = PlatformDetector().get_ansi_capabilities()
             self.assertFalse(caps.is_available)
     
     def test_ansi_detection_basic_term(self):
         """Test ANSI detection with basic terminal."""
         with patch.dict(os.environ, {'TERM': 'screen', 'COLORTERM': ''}):
-            with patch('sys.stdout') as mock_stdout:
-                mock_stdout.isatty.return_value = True
-                
-                caps = self.detector.get_ansi_capabilities()
+            with patch('os.isatty', return_value=True):
+                caps = PlatformDetector().get_ansi_capabilities()
                 
                 self.assertTrue(caps.is_available)
                 self.assertTrue(caps.has_colors)
                 self.assertFalse(caps.has_24bit_color)
                 self.assertEqual(caps.max_colors, 256)
     
+    def test_ansi_detection_unset_term(self):
+        """Test ANSI is unavailable without TERM, and unknown terminals get no colors."""
+        with patch('os.isatty', return_value=True):
+            with patch.dict(os.environ, {'TERM': '', 'COLORTERM': ''}):
+                self.assertFalse(PlatformDetector().get_ansi_capabilities().is_available)
+            with patch.dict(os.environ, {'TERM': 'foo', 'COLORTERM': ''}):
+                caps = PlatformDetector().get_ansi_capabilities()
+                self.assertTrue(caps.is_available)
+                self.assertFalse(caps.has_colors)
+    
     @patch('platform.system')
     def test_termio_detection_linux(self, mock_system):
         """Test TermIO detection on Linux."""
         mock_system.return_value = 'Linux'
         
-        # Mock termios import and stdin
-        with patch.dict('sys.modules', {'termios': MagicMock(), 'tty': MagicMock()}):
+        # Mock a terminal on stdin
+        with patch('os.isatty', return_value=True):
             with patch('sys.stdin') as mock_stdin:
                 mock_stdin.fileno.return_value = 0
                 
-                # Mock successful termios.tcgetattr call
-                import sys
-                termios_mock = sys.modules['termios']
-                termios_mock.tcgetattr.return_value = {}
-                
-                caps = self.detector.get_termio_capabilities()
+                caps = PlatformDetector().get_termio_capabilities()
                 
                 self.assertTrue(caps.is_available)
                 self.assertTrue(caps.has_colors)  # Depends on TERM
@@ -151,7 +167,7 @@ class TestPlatformDetector(unittest.TestCase):
         """Test TermIO detection on Windows (should be unavailable)."""
         mock_system.return_value = 'Windows'
         
-        caps = self.detector.get_termio_capabilities()
+        caps = PlatformDetector().get_termio_capabilities()
         self.assertFalse(caps.is_available)
     
     def test_curses_detection_available(self):
@@ -169,15 +185,8 @@ class TestPlatformDetector(unittest.TestCase):
     
     def test_curses_detection_unavailable(self):
         """Test Curses detection when unavailable."""
-        # Mock failed curses import
-        with patch('builtins.__import__') as mock_import:
-            def import_side_effect(name, *args, **kwargs):
-                if name == 'curses':
-                    raise ImportError("No module named 'curses'")
-                return __import__(name, *args, **kwargs)
-            
-            mock_import.side_effect = import_side_effect
-            
+        # Mock curses being unavailable
+        with patch('vindauga.io.platform_detector.curses', None):
             # Clear cache to force re-detection
             self.detector._capabilities_cache.clear()
             
@@ -251,6 +260,17 @@ class TestPlatformDetector(unittest.TestCase):
             self.assertNotIn(PlatformType.TERMIO, available)
             self.assertNotIn(PlatformType.WIN32, available)
     
+    def test_environment_read_once(self):
+        """Test the environment is read at construction, not on each probe."""
+        with patch.dict(os.environ, {'TERM': 'xterm-256color', 'COLORTERM': ''}):
+            with patch('os.isatty', return_value=True):
+                detector = PlatformDetector()
+        
+        with patch.dict(os.environ, {'TERM': 'dumb'}):
+            caps = detector.get_ansi_capabilities()
+        self.assertTrue(caps.is_available)
+        self.assertEqual(caps.max_colors, 256)
+    
     def test_platform_info(self):
         """Test platform information gathering."""
         info = self.detector.get_platform_info()
@@ -276,5 +296,109 @@ class TestPlatformDetector(unittest.TestCase):
         self.assertIs(caps1, caps2)
 
 
+
+class TestPlatformIO(unittest.TestCase):
+    """Test cases for PlatformIO class."""
+    
+    def test_create_defers_backends(self):
+        """Test backends are only constructed when first accessed."""
+        io_system = PlatformIO.create('ansi')
+        self.assertIsNone(io_system._display)
+        self.assertIsNone(io_system._input)
+        
+        io_system.shutdown()
+        self.assertIsNone(io_system._display)
+        
+        from vindauga.io.input.ansi import ANSIInput
+        self.assertIsInstance(io_system.input, ANSIInput)
+        self.assertIs(io_system.input, io_system.input)
+        self.assertIsNone(io_system._display)
+    
+    def test_create_unsupported(self):
+        """Test unsupported platforms are rejected up front."""
+        with self.assertRaises(ValueError):
+            PlatformIO.create('win32')
+
+
+class TestFixedPlatformIO(unittest.TestCase):
+    """Test cases for FixedPlatformIO backend creation."""
+    
+    def test_curses_unavailable_without_tty(self):
+        """Test curses is skipped without raising when stdout is not a terminal."""
+        from vindauga.io.platform_factory_fixed import FixedPlatformIO
+        with patch('sys.stdout') as stdout:
+            stdout.isatty.return_value = False
+            self.assertEqual(FixedPlatformIO._create_backend(PlatformType.CURSES), (None, None))
+            with self.assertRaises(RuntimeError):
+                FixedPlatformIO.create(PlatformType.CURSES, allow_fallback=False)
+    
+    def test_fallback_order_precomputed(self):
+        """Test fallback orders are built once per platform type."""
+        from vindauga.io import platform_factory_fixed
+        from vindauga.io.platform_factory_fixed import FixedPlatformIO, _compute_fallback_order
+        order = FixedPlatformIO._get_fallback_order(PlatformType.CURSES)
+        self.assertIs(order, FixedPlatformIO._get_fallback_order(PlatformType.CURSES))
+        self.assertEqual(order, _compute_fallback_order(PlatformType.CURSES,
+                                                        platform_factory_fixed._SYSTEM))
+        self.assertEqual(_compute_fallback_order(PlatformType.CURSES, 'Linux'),
+                         (PlatformType.CURSES, PlatformType.TERMIO, PlatformType.ANSI))
+    
+    def test_curses_input_gets_screen(self):
+        """Test curses input is initialized with the display's screen."""
+        from vindauga.io.platform_factory_fixed import FixedPlatformIO
+        display, input_handler = MagicMock(), MagicMock()
+        with patch.object(FixedPlatformIO, '_create_backend', return_value=(display, input_handler)):
+            result = FixedPlatformIO.create(PlatformType.CURSES, allow_fallback=False)
+        self.assertEqual(result, (display, input_handler))
+        self.assertIs(input_handler.stdscr, display.stdscr)
+        
+        from vindauga.io.display.curses import CursesDisplay
+        with patch.object(CursesDisplay, 'is_available', return_value=True):
+            display, _ = FixedPlatformIO._create_backend(PlatformType.CURSES)
+        self.assertNotIn('initialize', vars(display))
+    
+    def test_create_uses_shared_detector(self):
+        """Test auto-detection goes through the shared detector."""
+        from vindauga.io.platform_factory_fixed import FixedPlatformIO
+        detector = MagicMock()
+        detector.select_best_platform.return_value = PlatformType.ANSI
+        backends = (MagicMock(), MagicMock())
+        with patch('vindauga.io.platform_factory_fixed.get_default_detector', return_value=detector), \
+                patch.object(FixedPlatformIO, '_create_backend', return_value=backends) as create_backend:
+            self.assertEqual(FixedPlatformIO.create(), backends)
+        create_backend.assert_called_once_with(PlatformType.ANSI)
+    
+    def test_initialize_error_cleans_up(self):
+        """Test an OSError from initialize shuts both backends down."""
+        from vindauga.io.platform_factory_fixed import FixedPlatformIO
+        display, input_handler = MagicMock(), MagicMock()
+        display.initialize.side_effect = OSError('no tty')
+        with patch.object(FixedPlatformIO, '_create_backend', return_value=(display, input_handler)):
+            with self.assertRaises(RuntimeError) as context:
+                FixedPlatformIO.create(PlatformType.ANSI, allow_fallback=False)
+        self.assertIsInstance(context.exception.__cause__, OSError)
+        display.shutdown.assert_called_once()
+        input_handler.shutdown.assert_called_once()
+    
+    def test_backend_errors_fall_back(self):
+        """Test termios errors and failed construction fall back to the next backend."""
+        import termios
+        from vindauga.io.platform_factory_fixed import FixedPlatformIO
+        display, input_handler = MagicMock(), MagicMock()
+        display.initialize.side_effect = termios.error(25, 'not a tty')
+        good = (MagicMock(), MagicMock())
+        with patch.object(FixedPlatformIO, '_get_fallback_order',
+                          return_value=(PlatformType.CURSES, PlatformType.TERMIO, PlatformType.ANSI)), \
+                patch.object(FixedPlatformIO, '_create_backend',
+                             side_effect=[(display, input_handler), OSError('no tty'), good]):
+            self.assertEqual(FixedPlatformIO.create(PlatformType.CURSES), good)
+        display.shutdown.assert_called_once()
+        
+        with patch.object(FixedPlatformIO, '_create_backend', side_effect=OSError('no tty')):
+            with self.assertRaises(RuntimeError) as context:
+                FixedPlatformIO.create(PlatformType.ANSI, allow_fallback=False)
+        self.assertIsInstance(context.exception.__cause__, OSError)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -4,6 +4,7 @@
 import unittest
 import os
 import sys
+import tempfile
 from unittest.mock import patch, MagicMock
 from vindauga.io.platform_detector import (
     PlatformType, PlatformCapabilities, PlatformDetector
@@ -20,6 +21,13 @@ class TestPlatformType(unittest.TestCase):
         self.assertIsNotNone(PlatformType.CURSES)
         self.assertIsNotNone(PlatformType.WIN32)
         self.assertIsNotNone(PlatformType.DUMMY)
+    
+    def test_string_values(self):
+        """Test platform types are their lowercase names."""
+        self.assertEqual(PlatformType.ANSI, 'ansi')
+        self.assertIn(PlatformType.TERMIO, frozenset({'termio', 'curses'}))
+        self.assertEqual(str(PlatformType.CURSES), 'curses')
+        self.assertIs(PlatformType.from_string('Win32'), PlatformType.WIN32)
 
 
 class TestPlatformCapabilities(unittest.TestCase):
@@ -120,7 +128,7 @@ class TestPlatformDetector(unittest.TestCase):
     @patch.dict(os.environ, {'TERM': 'xterm-256color', 'COLORTERM': 'truecolor'})
     def test_detect_ansi_capabilities(self):
         """Test ANSI capability detection."""
-        with patch('sys.stdout.isatty', return_value=True):
+        with patch('os.isatty', return_value=True):
             # Create new detector with patched environment
             detector = PlatformDetector()
             caps = detector.detect_ansi_capabilities()
@@ -151,19 +159,20 @@ class TestPlatformDetector(unittest.TestCase):
         """Test TermIO capability detection."""
         # On Unix
         mock_system.return_value = 'Linux'
-        detector = PlatformDetector()
         
-        # Mock termios module
-        with patch.dict('sys.modules', {'termios': MagicMock(), 
-                                        'tty': MagicMock(),
-                                        'fcntl': MagicMock()}):
+        # With a terminal on stdin
+        with patch('os.isatty', return_value=True):
             with patch('sys.stdin.fileno', return_value=0):
-                sys.modules['termios'].tcgetattr = MagicMock()
-                
-                caps = detector.detect_termio_capabilities()
-                self.assertTrue(caps.available)
-                self.assertTrue(caps.unicode_support)
-                self.assertTrue(caps.mouse_support)
+                detector = PlatformDetector()
+        caps = detector.detect_termio_capabilities()
+        self.assertTrue(caps.available)
+        self.assertTrue(caps.unicode_support)
+        self.assertTrue(caps.mouse_support)
+        
+        # Without termios
+        with patch('vindauga.io.platform_detector.termios', None):
+            caps = detector.detect_termio_capabilities()
+            self.assertFalse(caps.available)
         
         # On Windows
         mock_system.return_value = 'Windows'
@@ -182,7 +191,7 @@ class TestPlatformDetector(unittest.TestCase):
             self.assertEqual(caps.color_support, 256)
         
         # Without curses
-        with patch('builtins.__import__', side_effect=ImportError):
+        with patch('vindauga.io.platform_detector.curses', None):
             caps = self.detector.detect_curses_capabilities()
             self.assertFalse(caps.available)
     
@@ -267,10 +276,107 @@ class TestPlatformDetector(unittest.TestCase):
         
         # Check all platforms are included
         caps = info['platform_capabilities']
-        self.assertIn('ANSI', caps)
-        self.assertIn('TERMIO', caps)
-        self.assertIn('CURSES', caps)
-        self.assertIn('WIN32', caps)
+        self.assertIn('ansi', caps)
+        self.assertIn('termio', caps)
+        self.assertIn('curses', caps)
+        self.assertIn('win32', caps)
+
+    
+    def test_term_classification(self):
+        """Test TERM, COLORTERM and TERM_PROGRAM classification."""
+        from vindauga.io.platform_detector import _classify_term
+        self.assertEqual(_classify_term('xterm-kitty', '', ''), (0, 95))
+        self.assertEqual(_classify_term('xterm-256color', 'truecolor', ''), (16777216, 75))
+        self.assertEqual(_classify_term('screen', '', 'iTerm.app'), (16, 85))
+        self.assertEqual(_classify_term('alacritty', '', ''), (0, 90))
+        self.assertEqual(_classify_term('', '', ''), (0, 70))
+    
+    @patch('platform.system')
+    def test_detect_all_skips_other_os(self, mock_system):
+        """Test probes for platforms of another OS are never run."""
+        mock_system.return_value = 'Linux'
+        detector = PlatformDetector()
+        with patch.object(detector, 'detect_win32_capabilities') as mock_win32:
+            all_caps = detector.detect_all()
+            mock_win32.assert_not_called()
+        self.assertEqual(all_caps[PlatformType.WIN32].name, "Win32")
+        self.assertFalse(all_caps[PlatformType.WIN32].available)
+        
+        mock_system.return_value = 'Windows'
+        detector = PlatformDetector()
+        with patch.object(detector, 'detect_termio_capabilities') as mock_termio:
+            self.assertFalse(detector.detect_all()[PlatformType.TERMIO].available)
+            mock_termio.assert_not_called()
+    
+    def test_detect_all_memoized(self):
+        """Test detection runs once until the caches are invalidated."""
+        detector = PlatformDetector()
+        with patch.object(detector, 'detect_ansi_capabilities',
+                          return_value=PlatformCapabilities(name="ANSI")) as mock_detect:
+            detector.select_best_platform()
+            info = detector.get_platform_info()
+            self.assertEqual(mock_detect.call_count, 1)
+            self.assertIs(detector.get_platform_info()['platform_capabilities'],
+                          info['platform_capabilities'])
+            with self.assertRaises(TypeError):
+                info['platform_capabilities']['ansi']['available'] = True
+            
+            with patch.dict(os.environ, {'TERM': 'xterm-kitty'}):
+                detector.invalidate_caches()
+            self.assertEqual(detector.term, 'xterm-kitty')
+            detector.detect_all()
+            self.assertEqual(mock_detect.call_count, 2)
+    
+    def test_detect_all_returns_copies(self):
+        """Test editing returned capabilities leaves later detections alone."""
+        detector = PlatformDetector()
+        with patch.object(detector, 'detect_curses_capabilities',
+                          return_value=PlatformCapabilities(name="Curses", available=True,
+                                                            performance_score=60)):
+            detector.detect_all()[PlatformType.CURSES].available = False
+            self.assertTrue(detector.detect_all()[PlatformType.CURSES].available)
+            self.assertIsNotNone(detector.select_best_platform())
+    
+    def test_default_detector(self):
+        """Test the shared detector and module-level invalidation."""
+        from vindauga.io.platform_detector import get_default_detector, invalidate_caches
+        detector = get_default_detector()
+        self.assertIs(get_default_detector(), detector)
+        
+        detector.detect_all()
+        with patch.dict(os.environ, {'TERM': 'xterm-kitty'}):
+            invalidate_caches()
+        self.assertIsNone(detector._detected)
+        self.assertEqual(detector.term, 'xterm-kitty')
+        invalidate_caches()
+    
+    def _cache_path(self):
+        """Return a cache file path in a temporary directory."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        return os.path.join(directory.name, 'vindauga', 'platform.json')
+    
+    def test_detection_cache_reused(self):
+        """Test cached results skip live detection in a later detector."""
+        cache_path = self._cache_path()
+        detected = PlatformDetector(cache_path=cache_path).detect_all()
+        self.assertTrue(os.path.exists(cache_path))
+        
+        detector = PlatformDetector(cache_path=cache_path)
+        with patch.object(detector, 'detect_ansi_capabilities') as mock_detect:
+            self.assertEqual(detector.detect_all(), detected)
+            mock_detect.assert_not_called()
+    
+    def test_detection_cache_invalidated(self):
+        """Test a changed environment or refresh request redetects."""
+        cache_path = self._cache_path()
+        PlatformDetector(cache_path=cache_path).detect_all()
+        
+        with patch.dict(os.environ, {'TERM': 'other-term'}):
+            self.assertIsNone(PlatformDetector(cache_path=cache_path)._detected)
+        with patch.dict(os.environ, {'VINDAUGA_REFRESH_PLATFORM': '1'}):
+            self.assertIsNone(PlatformDetector(cache_path=cache_path)._detected)
+        self.assertIsNotNone(PlatformDetector(cache_path=cache_path)._detected)
 
 
 if __name__ == '__main__':
@@ -2,7 +2,8 @@
 """Unit tests for ScreenCell class."""
 
 import unittest
-from vindauga.io.screen_cell import ScreenCell, WideCharCell
+from vindauga.io import screen_cell
+from vindauga.io.screen_cell import Attr, ScreenCell, WideCharCell
 
 
 class TestScreenCell(unittest.TestCase):
@@ -33,6 +34,55 @@ class TestScreenCell(unittest.TestCase):
         cell = ScreenCell(char='')
         self.assertEqual(cell.char, ' ')
     
+    def test_slots(self):
+        """Test cells carry no per-instance dict."""
+        self.assertFalse(hasattr(ScreenCell(), '__dict__'))
+        self.assertFalse(hasattr(WideCharCell(), '__dict__'))
+    
+    def test_equality_ignores_dirty(self):
+        """Test equality compares display fields only."""
+        self.assertEqual(ScreenCell('A', 1, 2, dirty=True), ScreenCell('A', 1, 2, dirty=False))
+        self.assertNotEqual(ScreenCell('A', 1, 2), ScreenCell('A', 1, 3))
+        self.assertNotEqual(WideCharCell(), ScreenCell(' ', 0, 0))
+    
+    def test_packed_fields_independent(self):
+        """Test packed fields round-trip and do not disturb one another."""
+        cell = ScreenCell('\U0001F389', fg_color=0xFFFFFF, bg_color=0x123456, attrs=0xFF)
+        cell.attrs = ScreenCell.ATTR_BOLD
+        cell.fg_color = 0xABCDEF
+        self.assertEqual((cell.char, cell.fg_color, cell.bg_color, cell.attrs),
+                         ('\U0001F389', 0xABCDEF, 0x123456, ScreenCell.ATTR_BOLD))
+        
+        cell.char = ''
+        self.assertEqual(cell.char, '')
+        self.assertEqual(cell.bg_color, 0x123456)
+    
+    def test_out_of_range_fields_rejected(self):
+        """Test values that would spill into neighbouring fields are refused."""
+        for kwargs in ({'fg_color': -1}, {'bg_color': 1 << 24}, {'attrs': -1}):
+            with self.assertRaises(ValueError):
+                ScreenCell('a', **kwargs)
+        cell = ScreenCell('a', fg_color=1, bg_color=2)
+        for name, value in (('fg_color', -1), ('fg_color', 1 << 24), ('bg_color', -2), ('attrs', -1)):
+            with self.assertRaises(ValueError):
+                setattr(cell, name, value)
+        self.assertEqual((cell.fg_color, cell.bg_color, cell.attrs), (1, 2, 0))
+    
+    def test_raw_matches_constructor(self):
+        """Test the raw constructor builds the same cells as __init__."""
+        self.assertEqual(ScreenCell._raw(), ScreenCell())
+        cell = ScreenCell('x', 3, 4, ScreenCell.ATTR_BOLD, dirty=False)
+        raw = ScreenCell._raw(cell.display_key, dirty=False)
+        self.assertEqual(raw, cell)
+        self.assertFalse(raw.dirty)
+    
+    def test_chars_shared(self):
+        """Test cells showing the same character return one string object."""
+        first = ScreenCell('\u2500')
+        second = ScreenCell(''.join(['\u2500', 'x'])[0])
+        self.assertIs(first.char, second.char)
+        self.assertIs(WideCharCell().char, WideCharCell().char)
+    
     def test_wide_character_detection(self):
         """Test detection of wide characters."""
         # Regular ASCII character
@@ -50,6 +100,16 @@ class TestScreenCell(unittest.TestCase):
         self.assertTrue(cell.is_wide)
         self.assertEqual(cell.width, 2)
     
+    def test_wide_lookup_cached(self):
+        """Test east_asian_width results are cached and ASCII skips the lookup."""
+        screen_cell._WIDE_CACHE.clear()
+        self.assertFalse(ScreenCell('A').is_wide)
+        self.assertNotIn('A', screen_cell._WIDE_CACHE)
+        
+        self.assertTrue(ScreenCell('中').is_wide)
+        self.assertFalse(ScreenCell('\u2500').is_wide)
+        self.assertEqual(screen_cell._WIDE_CACHE, {'中': True, '\u2500': False})
+    
     def test_set_char(self):
         """Test setting character and dirty flag."""
         cell = ScreenCell()
@@ -63,6 +123,16 @@ class TestScreenCell(unittest.TestCase):
         cell.dirty = False
         cell.set_char('X')
         self.assertFalse(cell.dirty)
+        
+        # Normalized writes that leave the char unchanged are not changes
+        cell.set_char('XYZ')
+        self.assertFalse(cell.dirty)
+        cell.set_char('')
+        self.assertEqual(cell.char, ' ')
+        self.assertTrue(cell.dirty)
+        cell.dirty = False
+        cell.set_char('')
+        self.assertFalse(cell.dirty)
     
     def test_set_colors(self):
         """Test setting colors."""
@@ -98,6 +168,19 @@ class TestScreenCell(unittest.TestCase):
         self.assertFalse(cell.has_attr(ScreenCell.ATTR_BOLD))
         self.assertTrue(cell.has_attr(ScreenCell.ATTR_UNDERLINE))  # Still set
     
+    def test_attr_flags(self):
+        """Test the Attr flags drive the attribute helpers."""
+        self.assertIs(ScreenCell.ATTR_ITALIC, Attr.ITALIC)
+        cell = ScreenCell()
+        cell.set_attr(Attr.BOLD | Attr.DIM)
+        self.assertTrue(cell.has_attr(Attr.DIM))
+        self.assertFalse(cell.has_attr(Attr.ITALIC))
+        self.assertEqual(Attr(cell.attrs), Attr.BOLD | Attr.DIM)
+        
+        cell.set_attr(Attr.BOLD, False)
+        self.assertEqual(cell.attrs, Attr.DIM)
+        self.assertIs(type(cell.attrs), int)
+    
     def test_clear(self):
         """Test clearing a cell."""
         cell = ScreenCell('X', fg_color=3, bg_color=5, 
@@ -165,6 +248,22 @@ class TestWideCharCell(unittest.TestCase):
         self.assertEqual(cell.width, 0)
         self.assertEqual(cell.fg_color, 0)
         self.assertEqual(cell.bg_color, 0)
+    
+    def test_wide_trail_immutable(self):
+        """Test the display properties of trail cells cannot be changed."""
+        cell = WideCharCell()
+        with self.assertRaises(TypeError):
+            cell.set_char('x')
+        with self.assertRaises(TypeError):
+            cell.clear()
+        for name, value in (('char', 'x'), ('fg_color', 3), ('bg_color', 3), ('attrs', 1), ('dirty', True)):
+            with self.assertRaises(TypeError):
+                setattr(cell, name, value)
+        with self.assertRaises(TypeError):
+            cell.mark_clean()
+        self.assertEqual(cell.char, '')
+        self.assertEqual(cell.fg_color, 0)
+        self.assertFalse(cell.dirty)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for terminal capability detection."""
+
+import os
+import sys
+import select
+import unittest
+from dataclasses import replace
+from io import StringIO
+from unittest.mock import patch
+
+from vindauga.io.terminal_capabilities import (TerminalCapability, TerminalCapabilityDetector, TerminalInfo,
+                                               detect_terminal_capabilities, invalidate_capability_cache)
+
+
+class TestTerminalCapabilityDetector(unittest.TestCase):
+    """Test cases for TerminalCapabilityDetector queries."""
+    
+    def setUp(self):
+        self.detector = TerminalCapabilityDetector(timeout=0.05)
+        read_fd, self.write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, self.write_fd)
+        self.detector._stdin_fd = read_fd
+    
+    def test_queries_batched(self):
+        """Test DA1, DA2 and DSR go out together and replies are routed."""
+        os.write(self.write_fd, b'\x1b[?62;4;22c\x1b[>41;354;0c\x1b[12;40R')
+        with patch('sys.stdout', new_callable=StringIO) as stdout, \
+                patch.object(self.detector, '_send_query') as send_query:
+            self.detector._query_device_attributes()
+        
+        self.assertEqual(stdout.getvalue(), '\x1b[c\x1b[>c\x1b[6n')
+        send_query.assert_not_called()
+        info = self.detector.terminal_info
+        self.assertTrue(info.capabilities[TerminalCapability.SIXEL_GRAPHICS])
+        self.assertTrue(info.capabilities[TerminalCapability.COLOR_16])
+        self.assertTrue(info.capabilities[TerminalCapability.CURSOR_SHAPE])
+        self.assertEqual((info.type, info.version), ('VT420', '354'))
+    
+    def test_da1_parameters(self):
+        """Test DA1 parameters map to capabilities only as whole numbers."""
+        self.detector._parse_da1_response('?64;1;22;44')
+        self.assertEqual(self.detector.terminal_info.capabilities,
+                         {TerminalCapability.COLOR_16: True})
+    
+    def test_closed_output_tolerated(self):
+        """Test queries give up quietly when stdout is closed."""
+        stdout = StringIO()
+        stdout.close()
+        with patch('sys.stdout', stdout):
+            self.assertIsNone(self.detector._send_query(self.detector.DSR_QUERY))
+            self.assertIsNone(self.detector._send_queries_batched([self.detector.DA1_QUERY]))
+    
+    def test_single_query_waits_once(self):
+        """Test a prompt reply is collected with a single select call."""
+        os.write(self.write_fd, b'\x1b[12;40R')
+        with patch('sys.stdout', new_callable=StringIO), \
+                patch('select.select', wraps=select.select) as select_call:
+            response = self.detector._send_query(self.detector.DSR_QUERY)
+        self.assertEqual(response, '\x1b[12;40R')
+        self.assertEqual(select_call.call_count, 1)
+    
+    def test_missing_replies_not_requeried(self):
+        """Test queries lost from a batch cost no extra round trip."""
+        os.write(self.write_fd, b'\x1b[?62c')
+        with patch('sys.stdout', new_callable=StringIO) as stdout, \
+                patch.object(self.detector, '_send_query') as send_query:
+            self.detector._query_device_attributes()
+        send_query.assert_not_called()
+        self.assertEqual(stdout.getvalue(), '\x1b[c\x1b[>c\x1b[6n')
+        self.assertEqual(self.detector.terminal_info.capabilities, {})
+    
+    def test_color_from_term(self):
+        """Test TERM names map to the matching color depth."""
+        for term, count in (('xterm-256color', 256), ('color-256color', 256),
+                            ('rxvt-color', 16), ('vt100', 16)):
+            detector = TerminalCapabilityDetector()
+            with patch.dict(os.environ, {'TERM': term, 'COLORTERM': ''}):
+                detector._detect_from_environment()
+            self.assertEqual(detector.terminal_info.color_count, count, term)
+        self.assertNotIn(TerminalCapability.COLOR_16, detector.terminal_info.capabilities)
+    
+    def test_unicode_from_lang(self):
+        """Test UTF-8 locales are recognised whatever their spelling."""
+        for lang, unicode in (('en_US.UTF-8', True), ('C.utf-8', True), ('de_DE.utf8', True), ('C', False)):
+            detector = TerminalCapabilityDetector()
+            with patch.dict(os.environ, {'LANG': lang}):
+                detector._detect_from_environment()
+            self.assertEqual(detector.terminal_info.has(TerminalCapability.UNICODE), unicode, lang)
+    
+    def test_database_partial_matches(self):
+        """Test every database entry contained in TERM contributes."""
+        self.detector.terminal_info.type = 'screen.xterm-256color'
+        self.detector._detect_from_database()
+        capabilities = self.detector.terminal_info.capabilities
+        self.assertTrue(capabilities[TerminalCapability.COLOR_24BIT])
+        self.assertTrue(capabilities[TerminalCapability.MOUSE_SGR])
+        self.assertNotIn(TerminalCapability.KITTY_GRAPHICS, capabilities)
+    
+    def test_capability_flags(self):
+        """Test capabilities are held as flags with a read-only mapping view."""
+        info = TerminalInfo()
+        self.assertFalse(info.has(TerminalCapability.UNICODE))
+        info.caps |= TerminalCapability.UNICODE | TerminalCapability.COLOR_16
+        self.assertTrue(info.has(TerminalCapability.UNICODE))
+        self.assertFalse(info.has(TerminalCapability.UNICODE | TerminalCapability.COLOR_256))
+        self.assertEqual(info.capabilities, {TerminalCapability.COLOR_16: True,
+                                             TerminalCapability.UNICODE: True})
+        with self.assertRaises(TypeError):
+            info.capabilities[TerminalCapability.TITLE] = True
+    
+    def test_capabilities_mapping_accepted(self):
+        """Test the old capabilities mapping still works as argument and setter."""
+        info = TerminalInfo(capabilities={TerminalCapability.TITLE: True, TerminalCapability.ITALIC: False})
+        self.assertEqual(info.caps, TerminalCapability.TITLE)
+        info.capabilities = {TerminalCapability.ITALIC: True}
+        self.assertEqual(info.caps, TerminalCapability.ITALIC)
+        self.assertEqual(replace(info), info)
+    
+    def test_queries_run_for_truecolor_terminal(self):
+        """Test a known truecolor terminal is still asked what only queries can tell."""
+        os.write(self.write_fd, b'\x1b[?62;4;22c\x1b[>41;354;0c\x1b[12;40R')
+        with patch.dict(os.environ, {'TERM': 'xterm-256color', 'COLORTERM': 'truecolor'}), \
+                patch('sys.stdout', new_callable=StringIO), \
+                patch.object(self.detector, '_setup_terminal', return_value=True), \
+                patch.object(self.detector, '_restore_terminal'):
+            info = self.detector.detect_all()
+        self.assertTrue(info.has(TerminalCapability.CURSOR_SHAPE | TerminalCapability.SIXEL_GRAPHICS))
+        self.assertEqual(info.version, '354')
+
+
+class TestDetectTerminalCapabilities(unittest.TestCase):
+    """Test cases for the cached detect_terminal_capabilities helper."""
+    
+    def setUp(self):
+        invalidate_capability_cache()
+        self.addCleanup(invalidate_capability_cache)
+        patcher = patch.object(TerminalCapabilityDetector, 'detect_all',
+                               side_effect=lambda: TerminalInfo(name='test'))
+        self.detect_all = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch('sys.stdin')
+        patcher.start().isatty.return_value = False
+        self.addCleanup(patcher.stop)
+    
+    def test_results_cached_per_environment(self):
+        """Test detection runs once per environment until invalidated."""
+        with patch.dict(os.environ, {'TERM': 'xterm'}):
+            info = detect_terminal_capabilities()
+            info.caps |= TerminalCapability.COLOR_24BIT
+            self.assertFalse(detect_terminal_capabilities().caps)
+            self.assertEqual(self.detect_all.call_count, 1)
+        
+        with patch.dict(os.environ, {'TERM': 'screen'}):
+            detect_terminal_capabilities()
+        self.assertEqual(self.detect_all.call_count, 2)
+        
+        invalidate_capability_cache()
+        with patch.dict(os.environ, {'TERM': 'xterm'}):
+            detect_terminal_capabilities()
+        self.assertEqual(self.detect_all.call_count, 3)
+    
+    def test_results_cached_per_timeout(self):
+        """Test a different query timeout gets its own detection run."""
+        with patch.dict(os.environ, {'TERM': 'xterm'}):
+            detect_terminal_capabilities(timeout=0.1)
+            detect_terminal_capabilities(timeout=0.5)
+            detect_terminal_capabilities(timeout=0.5)
+        self.assertEqual(self.detect_all.call_count, 2)
+    
+    def test_unusable_stdin(self):
+        """Test detection still returns a result with stdin closed or missing."""
+        sys.stdin.isatty.side_effect = ValueError('I/O operation on closed file')
+        self.assertIsInstance(detect_terminal_capabilities(), TerminalInfo)
+        with patch('sys.stdin', None):
+            self.assertIsInstance(detect_terminal_capabilities(), TerminalInfo)
+    
+    def test_size_refreshed_on_cache_hit(self):
+        """Test a cached result reports the current terminal size."""
+        with patch.dict(os.environ, {'TERM': 'xterm'}):
+            detect_terminal_capabilities()
+            with patch('shutil.get_terminal_size', return_value=os.terminal_size((132, 50))):
+                self.assertEqual(detect_terminal_capabilities().size, (132, 50))
+        self.assertEqual(self.detect_all.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for TerminalCleanupManager class."""
+
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+import threading
+import unittest
+from unittest.mock import patch
+
+from vindauga.io.terminal_cleanup import TerminalCleanupManager, _RESET_BLOB
+
+
+class TestTerminalCleanupManager(unittest.TestCase):
+    """Test cases for TerminalCleanupManager class."""
+
+    def setUp(self):
+        self.manager = TerminalCleanupManager()
+        self.manager._cleanup_handlers.clear()
+        self.manager._cleanup_methods.clear()
+        self.addCleanup(self.manager._cleanup_handlers.clear)
+        self.addCleanup(self.manager._cleanup_methods.clear)
+
+    def test_handlers_held_weakly(self):
+        """Test functions and bound methods run until their owners are collected."""
+        calls = []
+
+        class Owner:
+            def shutdown(self):
+                calls.append('method')
+
+        def handler():
+            calls.append('function')
+
+        owner = Owner()
+        self.manager.register_cleanup(handler)
+        self.manager.register_cleanup(owner.shutdown)
+        with patch.object(self.manager, '_force_terminal_restore'):
+            self.manager._cleanup_all()
+            self.assertEqual(sorted(calls), ['function', 'method'])
+
+            del handler, owner
+            calls.clear()
+            self.manager._cleanup_all()
+        self.assertEqual(calls, [])
+
+    def test_unregister(self):
+        """Test unregistered handlers are no longer called."""
+        calls = []
+
+        class Owner:
+            def shutdown(self):
+                calls.append('method')
+
+        owner = Owner()
+        self.manager.register_cleanup(owner.shutdown)
+        self.manager.unregister_cleanup(owner.shutdown)
+        with patch.object(self.manager, '_force_terminal_restore'):
+            self.manager._cleanup_all()
+        self.assertEqual(calls, [])
+
+    def test_unhashable_owner(self):
+        """Test methods of instances that define __eq__ without __hash__ register."""
+        calls = []
+
+        class Owner:
+            def __eq__(self, other):
+                return self is other
+
+            def shutdown(self):
+                calls.append('method')
+
+        owner = Owner()
+        self.manager.register_cleanup(owner.shutdown)
+        with patch.object(self.manager, '_force_terminal_restore'):
+            self.manager._cleanup_all()
+        self.assertEqual(calls, ['method'])
+
+        del owner
+        self.assertEqual(self.manager._cleanup_methods, {})
+
+    def test_slotted_owner_held_strongly(self):
+        """Test methods of instances without __weakref__ still register."""
+        calls = []
+
+        class Owner:
+            __slots__ = ()
+
+            def shutdown(self):
+                calls.append('method')
+
+        self.manager.register_cleanup(Owner().shutdown)
+        with patch.object(self.manager, '_force_terminal_restore'):
+            self.manager._cleanup_all()
+        self.assertEqual(calls, ['method'])
+
+    def test_method_runs_at_exit(self):
+        """Test a registered bound method runs when the interpreter exits normally."""
+        script = textwrap.dedent('''
+            from vindauga.io.terminal_cleanup import register_cleanup
+
+            class Owner:
+                def shutdown(self):
+                    print('shutdown', flush=True)
+
+            owner = Owner()
+            register_cleanup(owner.shutdown)
+        ''')
+        result = subprocess.run([sys.executable, '-c', script], stdin=subprocess.DEVNULL,
+                                capture_output=True, text=True, timeout=30,
+                                cwd=os.path.dirname(os.path.dirname(os.path.dirname(
+                                    os.path.dirname(os.path.abspath(__file__))))))
+        self.assertIn('shutdown', result.stdout)
+
+    def test_reset_sent_in_one_write(self):
+        """Test the reset sequences go out in a single write to stdout."""
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        self.addCleanup(os.close, write_fd)
+        with patch('sys.stdout') as stdout, patch('os.write', wraps=os.write) as write:
+            stdout.fileno.return_value = write_fd
+            self.manager._force_terminal_restore()
+        write.assert_called_once_with(write_fd, _RESET_BLOB)
+        self.assertEqual(os.read(read_fd, 1024), _RESET_BLOB)
+
+
+    def test_signal_handlers_main_thread_only(self):
+        """Test signal handlers are only installed from the main thread."""
+        with patch('signal.signal') as set_signal:
+            worker = threading.Thread(target=self.manager._install_signal_handlers)
+            worker.start()
+            worker.join()
+            set_signal.assert_not_called()
+
+            self.manager._install_signal_handlers()
+            self.assertIn(signal.SIGINT, [args[0] for args, _ in set_signal.call_args_list])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -338,5 +338,21 @@ class TestTermIOInput(unittest.TestCase):
             self.assertEqual(len(self.input_handler.event_queue), 0)
 
 
+
+class TestFixedTermIODisplay(unittest.TestCase):
+    """Test cases for the fixed TermIO display backend."""
+    
+    def test_init_terminal_single_writev(self):
+        """Test terminal setup sequences go out in one writev call."""
+        from vindauga.io.display.termio_fixed import FixedTermIODisplay
+        display = FixedTermIODisplay()
+        display.tty_fd = 1
+        with patch('os.writev') as writev, patch('os.write') as write:
+            display._init_terminal()
+        writev.assert_called_once()
+        self.assertEqual(b''.join(writev.call_args[0][1])[:8], b'\x1b[?1049h')
+        write.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file